@@ -104,6 +104,9 @@ hiddenimports = [
     # 日志
     'loguru',
     
+    # JSON 编解码（C 实现）
+    'orjson',
+    
     # Windows API
     'win32api',
     'win32con',
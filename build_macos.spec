@@ -105,6 +105,9 @@ hiddenimports = [
     # 日志
     'loguru',
     
+    # JSON 编解码（C 实现）
+    'orjson',
+    
     # macOS 特定
     'fcntl',            # 文件锁
     
@@ -8,9 +8,12 @@
 import sys
 import sqlite3
 import json
+import copy
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 
 # 添加项目根目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -18,9 +21,39 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.logger import get_logger
 from utils.crypto import get_crypto_manager
 from utils.app_paths import get_database_file
+from utils import json_utils
 
 logger = get_logger("account_storage")
 
+# ⭐ 允许用于 ORDER BY 的字段（白名单，排序字段直接拼入 SQL）
+SORTABLE_COLUMNS = frozenset({
+    'created_at', 'days_remaining', 'total_cost', 'last_used',
+    'usage_percent', 'email', 'id',
+})
+
+# 账号列表查询缓存最多保留的条件组合数
+QUERY_CACHE_SIZE = 16
+
+# 单条 IN (...) 查询最多绑定的参数数（旧版 SQLite 上限为 999）
+SQL_IN_CHUNK_SIZE = 500
+
+
+def _copy_account(account: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    复制缓存中的账号数据（嵌套的 dict/list，如 machine_info，深拷贝）
+    
+    Args:
+        account: 缓存中的账号
+        
+    Returns:
+        Dict: 调用方可自由修改的副本（修改不影响缓存）
+    """
+    copied = dict(account)
+    for key, value in copied.items():
+        if isinstance(value, (dict, list)):
+            copied[key] = copy.deepcopy(value)
+    return copied
+
 
 class AccountStorage:
     """账号存储管理器"""
@@ -40,6 +73,12 @@ class AccountStorage:
         
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.crypto = get_crypto_manager()
+        
+        # ⭐ 账号列表查询缓存：{(筛选, 排序): 账号列表}，任何写入都会递增版本号并清空
+        self._data_version = 0
+        self._query_cache: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         self._init_database()
     
     def _init_database(self):
@@ -187,16 +226,85 @@ class AccountStorage:
             cursor.execute("ALTER TABLE accounts ADD COLUMN is_invalid INTEGER DEFAULT 0")
             conn.commit()
         
+        # ⭐ 创建时间索引（默认排序和月份筛选可直接走索引）
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_accounts_created ON accounts(created_at DESC)")
+        
+        # ⭐ 启动检测结果缓存表（单行，短时间内重复启动时跳过网络检测）
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS detection_cache (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                account_json TEXT,
+                cached_at REAL
+            )
+        ''')
+        
         conn.commit()
         conn.close()
         logger.info("数据库初始化完成")
     
+    def _invalidate_cache(self):
+        """账号数据已写入：递增版本号并清空查询缓存"""
+        with self._cache_lock:
+            self._data_version += 1
+            self._query_cache.clear()
+    
     def _get_connection(self) -> sqlite3.Connection:
         """获取数据库连接"""
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row  # 返回字典格式
         return conn
     
+    # 插入账号的列（与 _prepare_insert 返回的值一一对应）
+    _INSERT_SQL = '''
+        INSERT {verb} INTO accounts (
+            email, password, access_token, refresh_token, session_token, user_id,
+            membership_type, days_remaining, usage_percent, used, limit_value, status, db_path, machine_id_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    def _prepare_insert(self, account_data: Dict[str, Any]) -> tuple:
+        """
+        加密敏感字段并生成插入行
+        
+        Args:
+            account_data: 账号数据字典
+            
+        Returns:
+            tuple: 与 _INSERT_SQL 列顺序对应的值
+        """
+        encrypted_data = account_data.copy()
+        if 'password' in encrypted_data and encrypted_data['password']:
+            encrypted_data['password'] = self.crypto.encrypt(encrypted_data['password'])
+        if 'access_token' in encrypted_data and encrypted_data['access_token']:
+            encrypted_data['access_token'] = self.crypto.encrypt(encrypted_data['access_token'])
+        if 'refresh_token' in encrypted_data and encrypted_data['refresh_token']:
+            encrypted_data['refresh_token'] = self.crypto.encrypt(encrypted_data['refresh_token'])
+        # ⭐ 加密 session_token（type=web，用于 API 调用）
+        if 'session_token' in encrypted_data and encrypted_data['session_token']:
+            encrypted_data['session_token'] = self.crypto.encrypt(encrypted_data['session_token'])
+        # ⭐ 加密 machine_info（机器码信息）
+        if 'machine_info' in encrypted_data and encrypted_data['machine_info']:
+            import json
+            machine_info_json = json.dumps(encrypted_data['machine_info'])
+            encrypted_data['machine_id_json'] = self.crypto.encrypt(machine_info_json)
+        
+        return (
+            encrypted_data.get('email'),
+            encrypted_data.get('password', ''),
+            encrypted_data.get('access_token', ''),
+            encrypted_data.get('refresh_token', ''),
+            encrypted_data.get('session_token', ''),
+            encrypted_data.get('user_id', ''),
+            encrypted_data.get('membership_type', 'free'),
+            encrypted_data.get('days_remaining', 0),
+            encrypted_data.get('usage_percent', 0.0),
+            encrypted_data.get('used', 0),
+            encrypted_data.get('limit', 1000),
+            encrypted_data.get('status', 'active'),
+            encrypted_data.get('db_path', ''),
+            encrypted_data.get('machine_id_json', '')
+        )
+    
     def add_account(self, account_data: Dict[str, Any]) -> Optional[int]:
         """
         添加新账号
@@ -210,50 +318,17 @@ class AccountStorage:
         conn = None
         try:
             # 加密敏感字段
-            encrypted_data = account_data.copy()
-            if 'password' in encrypted_data and encrypted_data['password']:
-                encrypted_data['password'] = self.crypto.encrypt(encrypted_data['password'])
-            if 'access_token' in encrypted_data and encrypted_data['access_token']:
-                encrypted_data['access_token'] = self.crypto.encrypt(encrypted_data['access_token'])
-            if 'refresh_token' in encrypted_data and encrypted_data['refresh_token']:
-                encrypted_data['refresh_token'] = self.crypto.encrypt(encrypted_data['refresh_token'])
-            # ⭐ 加密 session_token（type=web，用于 API 调用）
-            if 'session_token' in encrypted_data and encrypted_data['session_token']:
-                encrypted_data['session_token'] = self.crypto.encrypt(encrypted_data['session_token'])
-            # ⭐ 加密 machine_info（机器码信息）
-            if 'machine_info' in encrypted_data and encrypted_data['machine_info']:
-                import json
-                machine_info_json = json.dumps(encrypted_data['machine_info'])
-                encrypted_data['machine_id_json'] = self.crypto.encrypt(machine_info_json)
+            row = self._prepare_insert(account_data)
             
             conn = self._get_connection()
             cursor = conn.cursor()
             
             # 插入数据（包含 session_token、db_path 和 machine_id_json）
-            cursor.execute('''
-                INSERT INTO accounts (
-                    email, password, access_token, refresh_token, session_token, user_id,
-                    membership_type, days_remaining, usage_percent, used, limit_value, status, db_path, machine_id_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                encrypted_data.get('email'),
-                encrypted_data.get('password', ''),
-                encrypted_data.get('access_token', ''),
-                encrypted_data.get('refresh_token', ''),
-                encrypted_data.get('session_token', ''),
-                encrypted_data.get('user_id', ''),
-                encrypted_data.get('membership_type', 'free'),
-                encrypted_data.get('days_remaining', 0),
-                encrypted_data.get('usage_percent', 0.0),
-                encrypted_data.get('used', 0),
-                encrypted_data.get('limit', 1000),
-                encrypted_data.get('status', 'active'),
-                encrypted_data.get('db_path', ''),
-                encrypted_data.get('machine_id_json', '')
-            ))
+            cursor.execute(self._INSERT_SQL.format(verb=''), row)
             
             account_id = cursor.lastrowid
             conn.commit()
+            self._invalidate_cache()
             
             logger.info(f"成功添加账号: {account_data.get('email')} (ID: {account_id})")
             return account_id
@@ -281,6 +356,48 @@ class AccountStorage:
                 except:
                     pass
     
+    def add_accounts_bulk(self, accounts: List[Dict[str, Any]]) -> int:
+        """
+        批量添加账号（单个事务，已存在的邮箱自动跳过）
+        
+        Args:
+            accounts: 账号数据字典列表
+            
+        Returns:
+            int: 实际插入的账号数
+        """
+        if not accounts:
+            return 0
+        
+        conn = None
+        try:
+            rows = [self._prepare_insert(account) for account in accounts]
+            
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.executemany(self._INSERT_SQL.format(verb='OR IGNORE'), rows)
+            inserted = cursor.rowcount
+            conn.commit()
+            self._invalidate_cache()
+            
+            logger.info(f"批量添加账号: {inserted}/{len(accounts)} 个")
+            return inserted
+            
+        except Exception as e:
+            logger.error(f"批量添加账号失败: {e}")
+            if conn:
+                try:
+                    conn.rollback()
+                except:
+                    pass
+            return 0
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
     def upsert_account(self, account_data: Dict[str, Any]) -> Optional[int]:
         """
         更新或插入账号（如果存在则更新，不存在则插入）
@@ -336,6 +453,8 @@ class AccountStorage:
         """
         获取账号列表（支持筛选和排序）
         
+        数据未变化时相同条件的查询直接返回缓存结果（不再执行 SQL 和解密）
+        
         Args:
             filter_type: 账号类型筛选（free/pro/team等）
             filter_status: 状态筛选（active/expired）
@@ -344,7 +463,36 @@ class AccountStorage:
             ascending: 是否升序
             
         Returns:
-            List[Dict]: 账号列表
+            List[Dict]: 账号列表（调用方可自由修改，不影响缓存）
+        """
+        key = (filter_type, filter_status, filter_month, sort_by, ascending)
+        with self._cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return [_copy_account(account) for account in cached]
+            version = self._data_version
+        
+        accounts = self._query_accounts(filter_type, filter_status, filter_month, sort_by, ascending)
+        
+        # 查询期间发生写入时不缓存（结果可能已过期）；查询失败（None）也不缓存
+        if accounts is None:
+            return []
+        with self._cache_lock:
+            if version == self._data_version:
+                self._query_cache[key] = accounts
+                while len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return [_copy_account(account) for account in accounts]
+    
+    def _query_accounts(self, filter_type: Optional[str], filter_status: Optional[str],
+                        filter_month: Optional[str], sort_by: str,
+                        ascending: bool) -> Optional[List[Dict[str, Any]]]:
+        """
+        执行账号列表查询并解密（参数同 get_all_accounts）
+        
+        Returns:
+            Optional[List[Dict]]: 账号列表，查询失败返回 None
         """
         conn = None
         try:
@@ -385,11 +533,18 @@ class AccountStorage:
             
             # 月份筛选
             if filter_month:
-                sql += ' AND strftime("%Y-%m", created_at) = ?'
-                params.append(filter_month)
+                # ⭐ 用区间比较代替 strftime()，可以使用 created_at 索引
+                year, month = map(int, filter_month.split('-'))
+                next_month = f"{year + month // 12:04d}-{month % 12 + 1:02d}"
+                sql += ' AND created_at >= ? AND created_at < ?'
+                params.append(f"{year:04d}-{month:02d}-01")
+                params.append(f"{next_month}-01")
             
             # 排序（处理NULL值）
             order = 'ASC' if ascending else 'DESC'
+            if sort_by not in SORTABLE_COLUMNS:
+                logger.warning(f"不支持的排序字段: {sort_by}，改用 created_at")
+                sort_by = 'created_at'
             
             # ⭐ 对于 total_cost 字段，NULL 值视为 0
             if sort_by == 'total_cost':
@@ -445,7 +600,7 @@ class AccountStorage:
             
         except Exception as e:
             logger.error(f"获取账号列表失败: {e}")
-            return []
+            return None
         finally:
             if conn:
                 try:
@@ -561,6 +716,137 @@ class AccountStorage:
                 except:
                     pass
     
+    def get_accounts_by_ids(self, account_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        根据 ID 批量获取账号（单次 SQL 查询）
+        
+        Args:
+            account_ids: 账号 ID 列表
+            
+        Returns:
+            Dict[int, Dict]: {账号ID: 账号信息}，不存在的 ID 不会出现在结果中
+        """
+        if not account_ids:
+            return {}
+        
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            # ⭐ 按参数上限分段查询（选中数千个账号时也不会超出 SQLite 绑定参数限制）
+            account_ids = list(account_ids)
+            rows = []
+            for start in range(0, len(account_ids), SQL_IN_CHUNK_SIZE):
+                chunk = account_ids[start:start + SQL_IN_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'SELECT * FROM accounts WHERE id IN ({placeholders})', chunk)
+                rows.extend(cursor.fetchall())
+            
+            accounts = {}
+            for row in rows:
+                account = dict(row)
+                
+                # 解密敏感字段
+                if account.get('access_token'):
+                    try:
+                        account['access_token'] = self.crypto.decrypt(account['access_token'])
+                    except:
+                        pass
+                
+                if account.get('refresh_token'):
+                    try:
+                        account['refresh_token'] = self.crypto.decrypt(account['refresh_token'])
+                    except:
+                        pass
+                
+                if account.get('session_token'):
+                    try:
+                        account['session_token'] = self.crypto.decrypt(account['session_token'])
+                    except:
+                        pass
+                
+                if account.get('machine_id_json'):
+                    try:
+                        machine_info_json = self.crypto.decrypt(account['machine_id_json'])
+                        account['machine_info'] = json.loads(machine_info_json)
+                    except:
+                        pass
+                
+                accounts[account['id']] = account
+            
+            return accounts
+            
+        except Exception as e:
+            logger.error(f"批量获取账号失败: {e}")
+            return {}
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def _prepare_update(self, data: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+        """
+        把待更新数据转换为 UPDATE 的字段赋值和参数（加密敏感字段、序列化 JSON 字段）
+        
+        Args:
+            data: 要更新的数据
+            
+        Returns:
+            Tuple[List[str], List]: ("字段 = ?" 列表, 参数列表)
+        """
+        # 加密敏感字段
+        encrypted_data = data.copy()
+        if 'password' in encrypted_data and encrypted_data['password']:
+            encrypted_data['password'] = self.crypto.encrypt(encrypted_data['password'])
+        if 'access_token' in encrypted_data and encrypted_data['access_token']:
+            encrypted_data['access_token'] = self.crypto.encrypt(encrypted_data['access_token'])
+        if 'refresh_token' in encrypted_data and encrypted_data['refresh_token']:
+            encrypted_data['refresh_token'] = self.crypto.encrypt(encrypted_data['refresh_token'])
+        # ⭐ 加密 session_token
+        if 'session_token' in encrypted_data and encrypted_data['session_token']:
+            encrypted_data['session_token'] = self.crypto.encrypt(encrypted_data['session_token'])
+        # ⭐ 加密 machine_info（机器码信息）- 转换为 machine_id_json
+        if 'machine_info' in encrypted_data and encrypted_data['machine_info']:
+            import json
+            machine_info_json = json.dumps(encrypted_data['machine_info'])
+            encrypted_data['machine_id_json'] = self.crypto.encrypt(machine_info_json)
+            # 移除原始的 machine_info 字段，避免尝试更新不存在的列
+            del encrypted_data['machine_info']
+        # ⭐ 模型费用详情（字典）在写入前序列化一次为 model_usage_json
+        if 'model_usage' in encrypted_data:
+            model_usage = encrypted_data.pop('model_usage')
+            if not model_usage:
+                encrypted_data['model_usage_json'] = None
+            else:
+                try:
+                    encrypted_data['model_usage_json'] = json_utils.dumps(model_usage)
+                except (TypeError, ValueError) as e:
+                    # ⭐ 无法序列化时保留数据库中原有的模型费用详情，不写入 NULL
+                    logger.warning(f"序列化模型费用详情失败，保留原有数据: {e}")
+        
+        # 字段名映射（处理 SQL 关键字和字段转换）
+        field_mapping = {
+            'limit': 'limit_value',  # limit 是 SQL 关键字
+        }
+        
+        # 需要跳过的字段（不存在于数据库中）
+        skip_fields = {'id', 'machine_info'}  # machine_info 已转换为 machine_id_json
+        
+        # 构建 UPDATE 语句
+        fields = []
+        values = []
+        for key, value in encrypted_data.items():
+            if key not in skip_fields:  # 跳过 ID 和不存在的字段
+                # 映射字段名
+                db_field = field_mapping.get(key, key)
+                fields.append(f"{db_field} = ?")
+                values.append(value)
+        
+        return fields, values
+    
     def update_account(self, account_id: int, data: Dict[str, Any]) -> bool:
         """
         更新账号信息
@@ -574,43 +860,7 @@ class AccountStorage:
         """
         conn = None
         try:
-            # 加密敏感字段
-            encrypted_data = data.copy()
-            if 'password' in encrypted_data and encrypted_data['password']:
-                encrypted_data['password'] = self.crypto.encrypt(encrypted_data['password'])
-            if 'access_token' in encrypted_data and encrypted_data['access_token']:
-                encrypted_data['access_token'] = self.crypto.encrypt(encrypted_data['access_token'])
-            if 'refresh_token' in encrypted_data and encrypted_data['refresh_token']:
-                encrypted_data['refresh_token'] = self.crypto.encrypt(encrypted_data['refresh_token'])
-            # ⭐ 加密 session_token
-            if 'session_token' in encrypted_data and encrypted_data['session_token']:
-                encrypted_data['session_token'] = self.crypto.encrypt(encrypted_data['session_token'])
-            # ⭐ 加密 machine_info（机器码信息）- 转换为 machine_id_json
-            if 'machine_info' in encrypted_data and encrypted_data['machine_info']:
-                import json
-                machine_info_json = json.dumps(encrypted_data['machine_info'])
-                encrypted_data['machine_id_json'] = self.crypto.encrypt(machine_info_json)
-                # 移除原始的 machine_info 字段，避免尝试更新不存在的列
-                del encrypted_data['machine_info']
-            
-            # 字段名映射（处理 SQL 关键字和字段转换）
-            field_mapping = {
-                'limit': 'limit_value',  # limit 是 SQL 关键字
-            }
-            
-            # 需要跳过的字段（不存在于数据库中）
-            skip_fields = {'id', 'machine_info'}  # machine_info 已转换为 machine_id_json
-            
-            # 构建 UPDATE 语句
-            fields = []
-            values = []
-            for key, value in encrypted_data.items():
-                if key not in skip_fields:  # 跳过 ID 和不存在的字段
-                    # 映射字段名
-                    db_field = field_mapping.get(key, key)
-                    fields.append(f"{db_field} = ?")
-                    values.append(value)
-            
+            fields, values = self._prepare_update(data)
             if not fields:
                 return False
             
@@ -623,6 +873,7 @@ class AccountStorage:
             cursor.execute(query, tuple(values))
             
             conn.commit()
+            self._invalidate_cache()
             success = cursor.rowcount > 0
             
             if success:
@@ -663,6 +914,7 @@ class AccountStorage:
             cursor.execute('DELETE FROM accounts WHERE id = ?', (account_id,))
             
             conn.commit()
+            self._invalidate_cache()
             success = cursor.rowcount > 0
             
             if success:
@@ -685,6 +937,46 @@ class AccountStorage:
                 except:
                     pass
     
+    def delete_accounts_bulk(self, account_ids: List[int]) -> int:
+        """
+        批量删除账号（单个事务）
+        
+        Args:
+            account_ids: 账号 ID 列表
+            
+        Returns:
+            int: 实际删除的账号数
+        """
+        if not account_ids:
+            return 0
+        
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.executemany('DELETE FROM accounts WHERE id = ?', [(account_id,) for account_id in account_ids])
+            deleted = cursor.rowcount
+            conn.commit()
+            self._invalidate_cache()
+            
+            logger.info(f"批量删除账号: {deleted}/{len(account_ids)} 个")
+            return deleted
+            
+        except Exception as e:
+            logger.error(f"批量删除账号失败: {e}")
+            if conn:
+                try:
+                    conn.rollback()
+                except:
+                    pass
+            return 0
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
     def update_last_used(self, account_id: int):
         """
         更新账号最后使用时间
@@ -696,23 +988,31 @@ class AccountStorage:
             'last_used': datetime.now().isoformat()
         })
     
-    def update_account_status(self, account_id: int, usage_info: Dict[str, Any]):
+    def update_account_status(self, account_id: int, usage_info: Dict[str, Any],
+                              extra_fields: Optional[Dict[str, Any]] = None):
         """
         更新账号状态信息（完整版，和检测当前账号一样）
         
         Args:
             account_id: 账号 ID
             usage_info: 使用情况信息（从 API 获取的完整信息）
+            extra_fields: 额外要在同一条 UPDATE 中写入的字段（如 is_invalid）
         """
-        # ⭐ 将模型费用转为JSON字符串
-        model_usage_json = None
-        if 'model_usage' in usage_info and usage_info['model_usage']:
-            import json
-            try:
-                model_usage_json = json.dumps(usage_info['model_usage'])
-            except:
-                pass
+        update_data = self._build_status_update(usage_info)
+        if extra_fields:
+            update_data.update(extra_fields)
+        self.update_account(account_id, update_data)
+    
+    def _build_status_update(self, usage_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        从 API 返回的使用情况构造账号状态更新数据
         
+        Args:
+            usage_info: 使用情况信息
+            
+        Returns:
+            Dict: 要更新的字段（已过滤 None 值）
+        """
         update_data = {
             'email': usage_info.get('email'),  # ⭐ 更新邮箱
             'user_id': usage_info.get('user_id'),  # ⭐ 更新用户ID
@@ -725,7 +1025,7 @@ class AccountStorage:
             'total_cost': usage_info.get('total_cost'),  # ⭐ 保存真实费用
             'total_tokens': usage_info.get('total_tokens'),  # ⭐ 保存总tokens
             'unpaid_amount': usage_info.get('unpaid_amount'),  # ⭐ 保存欠费金额
-            'model_usage_json': model_usage_json,  # ⭐ 保存模型费用详情
+            'model_usage': usage_info.get('model_usage') or None,  # ⭐ 保存模型费用详情（update_account 中序列化）
             'last_used': usage_info.get('last_used'),  # ⭐ 保存最后使用时间（从API获取）
             'last_refresh_time': usage_info.get('last_refresh_time'),  # ⭐ 保存最后刷新时间（增量刷新）
             'accumulated_cost': usage_info.get('accumulated_cost'),  # ⭐ 保存累计金额（增量刷新）
@@ -733,9 +1033,132 @@ class AccountStorage:
         }
         
         # 过滤掉 None 值
-        update_data = {k: v for k, v in update_data.items() if v is not None}
+        return {k: v for k, v in update_data.items() if v is not None}
+    
+    def update_accounts_status_bulk(self, results: List[Tuple[int, Optional[Dict[str, Any]]]]) -> int:
+        """
+        批量写入刷新结果（单个事务，批量刷新时避免每个账号各提交一次）
         
-        self.update_account(account_id, update_data)
+        Args:
+            results: [(账号 ID, 使用情况信息)]，使用情况为 None 表示刷新失败（标记失效）
+            
+        Returns:
+            int: 更新的账号数
+        """
+        if not results:
+            return 0
+        
+        # ⭐ 相同字段组合的 UPDATE 归为一组，用 executemany 执行
+        groups: Dict[Tuple[str, ...], List[tuple]] = {}
+        for account_id, usage_info in results:
+            if usage_info:
+                data = self._build_status_update(usage_info)
+                data['is_invalid'] = 0
+            else:
+                data = {'is_invalid': 1}
+            fields, values = self._prepare_update(data)
+            groups.setdefault(tuple(fields), []).append((*values, account_id))
+        
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            updated = 0
+            for fields, rows in groups.items():
+                query = f"UPDATE accounts SET {', '.join(fields)} WHERE id = ?"
+                try:
+                    cursor.executemany(query, rows)
+                    updated += cursor.rowcount
+                except sqlite3.IntegrityError as e:
+                    # ⭐ 个别账号的新邮箱与其他账号冲突（email 唯一）：该组逐行重试，只跳过冲突的账号
+                    logger.warning(f"批量更新账号状态遇到约束冲突，逐个重试: {e}")
+                    for row in rows:
+                        try:
+                            cursor.execute(query, row)
+                            updated += cursor.rowcount
+                        except sqlite3.IntegrityError as row_error:
+                            logger.error(f"更新账号失败 (ID: {row[-1]}): {row_error}")
+            conn.commit()
+            self._invalidate_cache()
+            logger.info(f"批量更新账号状态: {updated} 个")
+            return updated
+        except Exception as e:
+            logger.error(f"批量更新账号状态失败: {e}")
+            if conn:
+                try:
+                    conn.rollback()
+                except:
+                    pass
+            return 0
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+
+    
+    def get_cached_detection_result(self) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        获取缓存的启动检测结果
+        
+        Returns:
+            Tuple[Optional[Dict], float]: (账号信息, 缓存时间戳)，无缓存时返回 (None, 0.0)
+        """
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT account_json, cached_at FROM detection_cache WHERE id = 1')
+            row = cursor.fetchone()
+            
+            if not row or not row['account_json']:
+                return None, 0.0
+            
+            # 检测结果包含 Token，落盘时已加密
+            account = json.loads(self.crypto.decrypt(row['account_json']))
+            return account, row['cached_at'] or 0.0
+            
+        except Exception as e:
+            logger.debug(f"读取检测缓存失败: {e}")
+            return None, 0.0
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def set_cached_detection_result(self, account: Optional[Dict[str, Any]], timestamp: float):
+        """
+        保存启动检测结果到缓存
+        
+        Args:
+            account: 检测到的账号信息（None 表示清除缓存）
+            timestamp: 缓存时间戳
+        """
+        conn = None
+        try:
+            account_json = self.crypto.encrypt(json.dumps(account)) if account else None
+            
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute(
+                'INSERT OR REPLACE INTO detection_cache (id, account_json, cached_at) VALUES (1, ?, ?)',
+                (account_json, timestamp)
+            )
+            conn.commit()
+            
+        except Exception as e:
+            logger.debug(f"保存检测缓存失败: {e}")
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
 
 
 # 全局存储实例
@@ -86,6 +86,27 @@ class CursorConfigScanner:
         self.db_paths = existing_paths
         return existing_paths
     
+    def state_db_fingerprint(self) -> tuple:
+        """
+        获取 state.vscdb（含 WAL 文件）的修改时间和大小指纹（只 stat，不读取内容）
+        
+        Returns:
+            tuple: ((路径, 修改时间ns, 大小), ...)，未找到数据库时为空元组
+        """
+        if not self.db_paths:
+            self.detect_state_db_paths()
+        
+        fingerprint = []
+        for db_path in self.db_paths:
+            # ⭐ Cursor 以 WAL 模式写库，登录变化可能只落在 -wal 文件里
+            for path in (db_path, db_path.with_name(db_path.name + '-wal')):
+                try:
+                    st = path.stat()
+                    fingerprint.append((str(path), st.st_mtime_ns, st.st_size))
+                except OSError:
+                    fingerprint.append((str(path), None, None))
+        return tuple(fingerprint)
+    
     def read_state_vscdb(self, db_path: Path, max_retries: int = 3) -> Optional[Dict[str, str]]:
         """
         读取 state.vscdb 数据库
@@ -6,7 +6,7 @@
 """
 
 import time
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from concurrent.futures import ThreadPoolExecutor, Future
 from threading import Lock
 from PyQt6.QtCore import QThread, QObject, pyqtSignal, QTimer
@@ -197,6 +197,37 @@ class ThreadManager(QObject):
         logger.debug(f"任务已提交: {task_id} (队列中任务数: {len(self._futures)})")
         return task_id
     
+    def submit_batch(self, tasks: List[Tuple[str, Callable, Optional[Callable]]]) -> List[str]:
+        """
+        一次提交多个任务到线程池（状态信号只发射一次）
+        
+        Args:
+            tasks: [(任务ID, 要执行的函数, 完成回调或 None)]
+        
+        Returns:
+            List[str]: 已提交的任务ID
+        """
+        submitted = []
+        for task_id, func, callback in tasks:
+            if task_id in self._futures:
+                logger.warning(f"任务已存在: {task_id}")
+                continue
+            
+            if callback:
+                self._task_callbacks[task_id] = callback
+            
+            future = self._executor.submit(self._worker.execute_task, task_id, func)
+            self._futures[task_id] = future
+            future.add_done_callback(lambda f, tid=task_id: self._on_future_done(tid, f))
+            submitted.append(task_id)
+        
+        if submitted:
+            self._total_tasks += len(submitted)
+            self.pool_status_changed.emit(len(self._futures), self._max_workers)
+            logger.debug(f"批量提交 {len(submitted)} 个任务 (队列中任务数: {len(self._futures)})")
+        
+        return submitted
+    
     def _on_future_done(self, task_id: str, future):
         """
         Future完成时的回调处理
@@ -308,10 +339,10 @@ class ThreadManager(QObject):
         """任务完成处理"""
         self._completed_tasks += 1
         
-        # 调用回调函数
-        if task_id in self._task_callbacks:
+        # 调用回调函数（pop 保证与 _on_future_done 之间只有一方调用）
+        callback = self._task_callbacks.pop(task_id, None)
+        if callback:
             try:
-                callback = self._task_callbacks[task_id]
                 callback(task_id, result)
             except Exception as e:
                 logger.error(f"任务回调函数执行失败: {task_id} - {e}")
@@ -326,10 +357,10 @@ class ThreadManager(QObject):
         """任务失败处理"""
         self._failed_tasks += 1
         
-        # 调用回调函数
-        if task_id in self._task_callbacks:
+        # 调用回调函数（pop 保证与 _on_future_done 之间只有一方调用）
+        callback = self._task_callbacks.pop(task_id, None)
+        if callback:
             try:
-                callback = self._task_callbacks[task_id]
                 callback(task_id, None)  # 失败时传入None
             except Exception as e:
                 logger.error(f"任务回调函数执行失败: {task_id} - {e}")
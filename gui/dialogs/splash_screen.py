@@ -10,24 +10,84 @@ import time
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-    QProgressBar, QFrame, QApplication, QGraphicsOpacityEffect
+    QProgressBar, QFrame, QApplication
 )
 from PyQt6.QtCore import (
     Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, 
-    QEasingCurve, QRect
-)
-from PyQt6.QtGui import (
-    QPixmap, QFont, QPainter, QColor, QBrush, 
-    QPen, QLinearGradient, QPainterPath
+    QAbstractAnimation, QEasingCurve
 )
+from PyQt6.QtGui import QFont, QPixmap, QPainter, QPixmapCache
 
-# 添加项目根目录到路径
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# 添加项目根目录到路径（已存在时不重复插入）
+_root = str(Path(__file__).parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 from utils.logger import get_logger
 
 logger = get_logger("splash_screen")
 
+# 启动画面样式表（合并为一份，只解析一次）
+SPLASH_STYLESHEET = """
+    QFrame {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #ffffff, stop: 1 #f8f9fa);
+        border: 2px solid #e0e6ed;
+        border-radius: 15px;
+    }
+    QLabel#SplashTitle {
+        color: #2c3e50;
+        margin: 8px 0;
+        padding: 0px;
+    }
+    QLabel#SplashVersion {
+        color: #7f8c8d;
+        margin-bottom: 15px;
+        padding: 0px;
+    }
+    QLabel#SplashStatus {
+        color: #5d6d7e;
+        padding: 0px;
+    }
+    QLabel#SplashCopyright {
+        color: #95a5a6;
+        padding: 0px;
+    }
+    QProgressBar {
+        border: none;
+        border-radius: 4px;
+        background-color: #ecf0f1;
+    }
+    QProgressBar::chunk {
+        border-radius: 4px;
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #3498db, stop: 1 #2980b9);
+    }
+"""
+
+# 启动检测结果缓存有效期（秒），短时间内重复启动直接复用上次结果
+DETECTION_CACHE_TTL = 60
+
+
+def _get_logo_pixmap() -> QPixmap:
+    """获取预渲染的 Logo 图标（只排版/光栅化一次 emoji，之后直接贴图）"""
+    pixmap = QPixmapCache.find("splash_logo")
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    
+    ratio = QApplication.primaryScreen().devicePixelRatio() if QApplication.primaryScreen() else 1.0
+    pixmap = QPixmap(int(64 * ratio), int(64 * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setFont(QFont("Segoe UI Emoji", 32))
+    painter.drawText(0, 0, 64, 64, Qt.AlignmentFlag.AlignCenter, "🎯")
+    painter.end()
+    
+    QPixmapCache.insert("splash_logo", pixmap)
+    return pixmap
+
 
 class InitializationWorker(QThread):
     """初始化工作线程"""
@@ -58,12 +118,8 @@ class InitializationWorker(QThread):
             self._init_step(50, "加载邮箱配置...", self._init_email)
             self._init_step(60, "初始化 Cursor API...", self._init_api)
             self._init_step(70, "初始化线程管理器...", self._init_thread_manager)
-            # ⭐ 启动检测改为可选（失败不影响程序启动）
-            try:
-                self._init_step(75, "检测当前登录账号...", self._detect_current_account)
-            except Exception as e:
-                logger.warning(f"启动检测失败（跳过）: {e}")
-                self.progress_updated.emit(75, "启动检测失败（已跳过）")
+            # ⭐ 只读取本地检测缓存，网络检测延后到主窗口显示后在后台执行
+            self._init_step(75, "读取账号检测缓存...", self._load_cached_detection)
             self._init_step(85, "准备UI组件...", self._prepare_ui)
             self._init_step(95, "应用主题样式...", self._apply_theme)
             self._init_step(100, "启动完成!", lambda: None)
@@ -103,10 +159,6 @@ class InitializationWorker(QThread):
     def _load_config(self):
         """加载配置文件"""
         import json
-        from pathlib import Path
-        import sys
-        # 导入 get_config_file
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
         from utils.app_paths import get_config_file
         
         config_path = get_config_file()
@@ -162,33 +214,19 @@ class InitializationWorker(QThread):
         # 预加载一些UI资源
         logger.info("UI组件准备完成")
     
-    def _detect_current_account(self):
-        """检测当前登录账号"""
-        try:
-            from core.current_account_detector import get_detector
-            
-            # ⭐ 传递storage实例，让detector可以读取增量刷新信息
-            storage = getattr(self, 'storage', None)
-            if not storage:
-                logger.warning("storage 未初始化，无法使用增量刷新")
-            
-            detector = get_detector(storage=storage)
-            account = detector.detect_current_account()
-            
-            if account and account.get('status') == 'active':
-                self.detected_account = account
-                email = account.get('email', '未知')
-                plan = account.get('membership_type', 'free').upper()
-                logger.info(f"检测到当前账号: {email} ({plan})")
-            else:
-                logger.warning("未检测到活跃账号")
-                self.detected_account = None
-                
-        except Exception as e:
-            logger.warning(f"账号检测失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
-            self.detected_account = None
+    def _load_cached_detection(self):
+        """读取缓存的检测结果（不发起网络请求）"""
+        storage = getattr(self, 'storage', None)
+        if not storage:
+            return
+        
+        # ⭐ 缓存未过期时直接复用上次检测结果，否则交给主窗口后台检测
+        cached_account, cached_at = storage.get_cached_detection_result()
+        if cached_account and time.time() - cached_at < DETECTION_CACHE_TTL:
+            self.detected_account = cached_account
+            logger.info(f"使用缓存的检测结果: {cached_account.get('email', '未知')}")
+        else:
+            logger.info("无可用检测缓存，主窗口显示后将在后台检测当前账号")
     
     def _apply_theme(self):
         """应用主题样式"""
@@ -231,14 +269,8 @@ class SplashScreen(QDialog):
         
         # 创建主容器
         self.main_frame = QFrame()
-        self.main_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #ffffff, stop: 1 #f8f9fa);
-                border: 2px solid #e0e6ed;
-                border-radius: 15px;
-            }
-        """)
+        # ⭐ 整个启动画面只解析一次样式表（子控件通过 objectName 匹配）
+        self.main_frame.setStyleSheet(SPLASH_STYLESHEET)
         
         # 主布局
         layout = QVBoxLayout(self)
@@ -255,8 +287,8 @@ class SplashScreen(QDialog):
         logo_layout.addStretch()
         
         # Logo 图标（使用文字代替，可以替换为实际图标）
-        self.logo_label = QLabel("🎯")
-        self.logo_label.setFont(QFont("Segoe UI Emoji", 32))
+        self.logo_label = QLabel()
+        self.logo_label.setPixmap(_get_logo_pixmap())
         self.logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         logo_layout.addWidget(self.logo_label)
         
@@ -267,13 +299,7 @@ class SplashScreen(QDialog):
         self.title_label = QLabel("Zzx Cursor Auto Manager")
         self.title_label.setFont(QFont("Microsoft YaHei", 18, QFont.Weight.Bold))
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                margin: 8px 0;
-                padding: 0px;
-            }
-        """)
+        self.title_label.setObjectName("SplashTitle")
         self.title_label.setWordWrap(True)  # 允许文字换行
         content_layout.addWidget(self.title_label)
         
@@ -281,13 +307,7 @@ class SplashScreen(QDialog):
         self.version_label = QLabel("v2.5 - Cursor 账号自动化管理系统")
         self.version_label.setFont(QFont("Microsoft YaHei", 10))
         self.version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.version_label.setStyleSheet("""
-            QLabel {
-                color: #7f8c8d;
-                margin-bottom: 15px;
-                padding: 0px;
-            }
-        """)
+        self.version_label.setObjectName("SplashVersion")
         self.version_label.setWordWrap(True)  # 允许文字换行
         content_layout.addWidget(self.version_label)
         
@@ -299,12 +319,7 @@ class SplashScreen(QDialog):
         self.status_label = QLabel("正在启动...")
         self.status_label.setFont(QFont("Microsoft YaHei", 9))
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #5d6d7e;
-                padding: 0px;
-            }
-        """)
+        self.status_label.setObjectName("SplashStatus")
         self.status_label.setWordWrap(True)  # 允许文字换行
         progress_container.addWidget(self.status_label)
         
@@ -314,18 +329,6 @@ class SplashScreen(QDialog):
         self.progress_bar.setValue(0)
         self.progress_bar.setFixedHeight(8)
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 4px;
-                background-color: #ecf0f1;
-            }
-            QProgressBar::chunk {
-                border-radius: 4px;
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #3498db, stop: 1 #2980b9);
-            }
-        """)
         progress_container.addWidget(self.progress_bar)
         
         content_layout.addLayout(progress_container)
@@ -336,39 +339,32 @@ class SplashScreen(QDialog):
         self.copyright_label = QLabel("© 2025 Zzx Dev - All Rights Reserved")
         self.copyright_label.setFont(QFont("Microsoft YaHei", 8))
         self.copyright_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.copyright_label.setStyleSheet("""
-            QLabel {
-                color: #95a5a6;
-                padding: 0px;
-            }
-        """)
+        self.copyright_label.setObjectName("SplashCopyright")
         self.copyright_label.setWordWrap(True)  # 允许文字换行
         content_layout.addWidget(self.copyright_label)
     
     def _setup_animations(self):
         """设置动画效果"""
-        # 淡入动画
-        self.fade_effect = QGraphicsOpacityEffect()
-        self.setGraphicsEffect(self.fade_effect)
-        
-        self.fade_in_animation = QPropertyAnimation(self.fade_effect, b"opacity")
-        self.fade_in_animation.setDuration(500)
-        self.fade_in_animation.setStartValue(0.0)
-        self.fade_in_animation.setEndValue(1.0)
-        self.fade_in_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        # 淡出动画
-        self.fade_out_animation = QPropertyAnimation(self.fade_effect, b"opacity")
-        self.fade_out_animation.setDuration(400)
-        self.fade_out_animation.setStartValue(1.0)
-        self.fade_out_animation.setEndValue(0.0)
-        self.fade_out_animation.setEasingCurve(QEasingCurve.Type.InCubic)
-        self.fade_out_animation.finished.connect(self.accept)
+        # 淡入动画（直接驱动窗口透明度，由系统合成器混合，避免离屏缓冲）
+        self.setWindowOpacity(0.0)
+        
+        # ⭐ 淡入/淡出共用一个动画（淡出时反向播放）
+        self._fade_animation = QPropertyAnimation(self, b"windowOpacity")
+        self._fade_animation.setDuration(500)
+        self._fade_animation.setStartValue(0.0)
+        self._fade_animation.setEndValue(1.0)
+        self._fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._fade_animation.finished.connect(self._on_fade_finished)
+    
+    def _on_fade_finished(self):
+        """淡出（反向播放）结束后关闭对话框"""
+        if self._fade_animation.direction() == QAbstractAnimation.Direction.Backward:
+            self.accept()
     
     def _start_initialization(self):
         """开始初始化过程"""
         # 播放淡入动画
-        self.fade_in_animation.start()
+        self._fade_animation.start()
         
         # 创建并启动初始化线程
         self.init_worker = InitializationWorker()
@@ -381,8 +377,11 @@ class SplashScreen(QDialog):
     
     def _on_progress_updated(self, progress: int, status: str):
         """更新进度"""
+        # ⭐ 合并进度条和状态文本的重绘（一次 expose 事件）
+        self.main_frame.setUpdatesEnabled(False)
         self.progress_bar.setValue(progress)
         self.status_label.setText(status)
+        self.main_frame.setUpdatesEnabled(True)
         logger.debug(f"启动进度: {progress}% - {status}")
     
     def _on_initialization_finished(self, detected_account):
@@ -403,19 +402,24 @@ class SplashScreen(QDialog):
         """初始化错误"""
         logger.error(f"启动初始化失败: {error_message}")
         
+        self.main_frame.setUpdatesEnabled(False)
         self.status_label.setText(f"初始化失败: {error_message}")
         self.status_label.setStyleSheet("""
             QLabel {
                 color: #e74c3c;
             }
         """)
+        self.main_frame.setUpdatesEnabled(True)
         
         # 3秒后自动关闭
         QTimer.singleShot(3000, self.accept)
     
     def _close_with_animation(self):
         """带动画的关闭"""
-        self.fade_out_animation.start()
+        self._fade_animation.stop()
+        self._fade_animation.setDuration(400)
+        self._fade_animation.setDirection(QAbstractAnimation.Direction.Backward)
+        self._fade_animation.start()
     
     def closeEvent(self, event):
         """处理关闭事件"""
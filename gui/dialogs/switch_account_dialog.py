@@ -15,10 +15,29 @@ from typing import Dict, Any
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_root = str(Path(__file__).parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 from gui.dialogs.animated_dialog import AnimatedDialog
 
 
+# 套餐类型 → 颜色（按优先级排列，用于子串匹配如 free_trial / pro_trial）
+_MEMBERSHIP_COLORS = {
+    'pro': '#4CAF50',         # 绿色
+    'trial': '#4CAF50',       # 绿色
+    'team': '#2196F3',        # 蓝色
+    'enterprise': '#9C27B0',  # 紫色
+}
+_DEFAULT_MEMBERSHIP_COLOR = '#999'  # 灰色
+
+# 机器码单选按钮 ID → (机器码模式, 是否重置 Cursor 配置)
+_MACHINE_ID_MODES = {
+    1: ('use_bound', False),
+    2: ('generate_new', False),
+    3: ('reset_all', True),  # 完全重置时也重置配置
+}
+
+
 class SwitchAccountDialog(AnimatedDialog):
     """账号切换确认对话框"""
     
@@ -117,40 +136,34 @@ class SwitchAccountDialog(AnimatedDialog):
         # 单选按钮组
         self.machine_button_group = QButtonGroup(self)
         
-        # 选项1：使用绑定的机器码
-        self.use_bound_radio = QRadioButton("使用该账号绑定的机器码")
+        # 选项1 的提示取决于账号是否绑定了机器码
         has_machine_info = bool(self.account.get('machine_info'))
-        
         if has_machine_info:
             from core.machine_id_generator import MachineIdGenerator
             machine_info = self.account.get('machine_info', {})
             preview = MachineIdGenerator.get_machine_id_preview(machine_info, 35)
-            self.use_bound_radio.setToolTip(f"使用账号注册时的机器码\n预览: {preview}")
+            use_bound_tip = f"使用账号注册时的机器码\n预览: {preview}"
         else:
-            self.use_bound_radio.setEnabled(False)
-            self.use_bound_radio.setToolTip("该账号没有绑定机器码信息")
-        
-        self.machine_button_group.addButton(self.use_bound_radio, 1)
-        options_layout.addWidget(self.use_bound_radio)
-        
-        # 选项2：随机生成新的机器码（默认）
-        self.generate_new_radio = QRadioButton("随机生成新的机器码（推荐）")
-        self.generate_new_radio.setChecked(True)  # 默认选中
-        self.generate_new_radio.setToolTip(
-            "每次切换生成全新的设备标识\n"
-            "推荐使用，可避免账号关联"
+            use_bound_tip = "该账号没有绑定机器码信息"
+        
+        # (属性名, 文本, 提示, ID, 是否可用, 是否默认选中)
+        radio_options = (
+            ('use_bound_radio', "使用该账号绑定的机器码",
+             use_bound_tip, 1, has_machine_info, False),
+            ('generate_new_radio', "随机生成新的机器码（推荐）",
+             "每次切换生成全新的设备标识\n推荐使用，可避免账号关联", 2, True, True),
+            ('reset_all_radio', "完全重置 Cursor 配置",
+             "清空所有机器码和配置\n仅在出现问题时使用", 3, True, False),
         )
-        self.machine_button_group.addButton(self.generate_new_radio, 2)
-        options_layout.addWidget(self.generate_new_radio)
         
-        # 选项3：完全重置
-        self.reset_all_radio = QRadioButton("完全重置 Cursor 配置")
-        self.reset_all_radio.setToolTip(
-            "清空所有机器码和配置\n"
-            "仅在出现问题时使用"
-        )
-        self.machine_button_group.addButton(self.reset_all_radio, 3)
-        options_layout.addWidget(self.reset_all_radio)
+        for attr, text, tip, rid, enabled, default in radio_options:
+            radio = QRadioButton(text)
+            radio.setToolTip(tip)
+            radio.setEnabled(enabled)
+            radio.setChecked(default)
+            self.machine_button_group.addButton(radio, rid)
+            options_layout.addWidget(radio)
+            setattr(self, attr, radio)
         
         # 说明文字
         note_label = QLabel(
@@ -231,17 +244,11 @@ class SwitchAccountDialog(AnimatedDialog):
     
     def _on_confirm(self):
         """确认按钮点击"""
-        # 确定机器码模式
-        machine_id_mode = 'generate_new'  # 默认
-        reset_cursor_config = False
-        
-        if self.use_bound_radio.isChecked():
-            machine_id_mode = 'use_bound'
-        elif self.generate_new_radio.isChecked():
-            machine_id_mode = 'generate_new'
-        elif self.reset_all_radio.isChecked():
-            machine_id_mode = 'reset_all'
-            reset_cursor_config = True  # 完全重置时也重置配置
+        # 确定机器码模式（按单选按钮 ID 查表，默认生成新机器码）
+        machine_id_mode, reset_cursor_config = _MACHINE_ID_MODES.get(
+            self.machine_button_group.checkedId(),
+            _MACHINE_ID_MODES[2]
+        )
         
         # 收集用户选择的选项
         self.switch_options = {
@@ -261,14 +268,14 @@ class SwitchAccountDialog(AnimatedDialog):
         """根据套餐类型获取颜色"""
         membership_lower = membership.lower()
         
-        if 'pro' in membership_lower or 'trial' in membership_lower:
-            return '#4CAF50'  # 绿色
-        elif 'team' in membership_lower:
-            return '#2196F3'  # 蓝色
-        elif 'enterprise' in membership_lower:
-            return '#9C27B0'  # 紫色
-        else:
-            return '#999'  # 灰色
+        # 精确匹配直接查表，组合类型（如 free_trial）再回退到子串匹配
+        color = _MEMBERSHIP_COLORS.get(membership_lower)
+        if color:
+            return color
+        return next(
+            (c for k, c in _MEMBERSHIP_COLORS.items() if k in membership_lower),
+            _DEFAULT_MEMBERSHIP_COLOR
+        )
     
     def get_switch_options(self) -> Dict[str, bool]:
         """获取切换选项"""
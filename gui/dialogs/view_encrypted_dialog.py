@@ -7,18 +7,51 @@
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTextEdit, QGroupBox, QTabWidget, QWidget,
-    QScrollArea, QGridLayout
+    QPushButton, QPlainTextEdit, QLineEdit, QTabWidget, QWidget,
+    QScrollArea, QFormLayout
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QGuiApplication
 from typing import Dict, Any
-import json
+
+from utils import json_utils
+
+
+# Token 字段表：(显示名, 账号字段, 是否必显)
+TOKEN_FIELDS = (
+    ("AccessToken", "access_token", True),
+    ("RefreshToken", "refresh_token", False),
+    ("SessionToken (用于API)", "session_token", False),
+)
+
+# 机器码字段表：(配置键, 显示名)
+_MACHINE_FIELDS = (
+    ("telemetry.machineId", "Machine ID"),
+    ("telemetry.macMachineId", "Mac Machine ID"),
+    ("telemetry.devDeviceId", "Dev Device ID"),
+    ("telemetry.sqmId", "SQM ID"),
+    ("system.machineGuid", "Machine GUID"),
+)
+
+# 可选中文本的交互标志（避免重复解析枚举属性）
+_SELECT_FLAG = Qt.TextInteractionFlag.TextSelectableByMouse
+
+
+def _shorten(s: str, n: int = 256) -> str:
+    """截断过长文本用于显示（完整值仍通过复制按钮获取）"""
+    return s if len(s) <= n else s[:n] + f"…(+{len(s) - n} chars)"
 
 
 class ViewEncryptedDialog(QDialog):
     """解密查看对话框"""
     
+    # 共享样式与字体（避免每个控件重复构造）
+    _MONO_QSS = "font-family: 'Courier New'; font-size: 9pt;"
+    _BOLD_QSS = "font-weight: bold;"
+    _SECTION_QSS = "font-weight: bold; font-size: 11pt; margin-top: 6px;"
+    _MONO_LABEL_QSS = "QLabel[mono='true'] { font-family: 'Courier New'; font-size: 9pt; }"
+    _TITLE_FONT = None
+    
     def __init__(self, decrypted_data: Dict[str, Any], parent=None):
         """
         初始化对话框
@@ -30,6 +63,21 @@ class ViewEncryptedDialog(QDialog):
         super().__init__(parent)
         
         self.decrypted_data = decrypted_data
+        self._clipboard = QGuiApplication.clipboard()
+        
+        # 元数据文本只格式化一次
+        export_date = decrypted_data.get('export_date', 'N/A')
+        self._meta_str = (
+            f"版本: {decrypted_data.get('version', 'N/A')} | "
+            f"导出日期: {export_date[:19] if isinstance(export_date, str) else 'N/A'} | "
+            f"账号数量: {decrypted_data.get('count', 0)} | 已解密: ✅"
+        )
+        
+        if ViewEncryptedDialog._TITLE_FONT is None:
+            title_font = QFont()
+            title_font.setPointSize(14)
+            title_font.setBold(True)
+            ViewEncryptedDialog._TITLE_FONT = title_font
         
         self.setWindowTitle(f"🔓 解密查看 - {decrypted_data.get('app', 'Unknown')}")
         self.setMinimumWidth(800)
@@ -46,29 +94,27 @@ class ViewEncryptedDialog(QDialog):
         # 标题
         title_label = QLabel(f"📄 {self.decrypted_data.get('app', 'Unknown')}")
         title_label.setProperty("heading", True)
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(self._TITLE_FONT)
         layout.addWidget(title_label)
         
-        # 元数据
-        meta_layout = QHBoxLayout()
-        meta_layout.addWidget(QLabel(f"版本: {self.decrypted_data.get('version', 'N/A')}"))
-        meta_layout.addWidget(QLabel(f"导出日期: {self.decrypted_data.get('export_date', 'N/A')[:19]}"))
-        meta_layout.addWidget(QLabel(f"账号数量: {self.decrypted_data.get('count', 0)}"))
-        meta_layout.addWidget(QLabel(f"已解密: ✅"))
-        meta_layout.addStretch()
-        layout.addLayout(meta_layout)
+        # 元数据（合并为单个标签）
+        layout.addWidget(QLabel(self._meta_str))
         
         # 标签页
         self.tabs = QTabWidget()
         
+        # ⭐ 先添加占位页，标签页内容在首次切换到时才创建
+        self._accounts_pending = {}
         accounts = self.decrypted_data.get('accounts', [])
+        self.tabs.setUpdatesEnabled(False)
         for idx, account in enumerate(accounts):
             email = account.get('email', f'账号 {idx+1}')
-            account_widget = self._create_account_tab(account)
-            self.tabs.addTab(account_widget, f"📧 {email}")
+            self.tabs.addTab(QWidget(), f"📧 {email}")
+            self._accounts_pending[idx] = account
+        self.tabs.setUpdatesEnabled(True)
+        
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tabs.currentIndex())
         
         layout.addWidget(self.tabs)
         
@@ -83,169 +129,148 @@ class ViewEncryptedDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _ensure_tab_built(self, index: int):
+        """按需创建标签页内容（替换占位页）"""
+        account = self._accounts_pending.pop(index, None)
+        if account is None:
+            return
+        
+        label = self.tabs.tabText(index)
+        account_widget = self._create_account_tab(account)
+        
+        # 替换占位页时屏蔽 currentChanged，避免重入
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, account_widget, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+    
     def _create_account_tab(self, account: Dict[str, Any]) -> QWidget:
         """创建单个账号的标签页"""
+        # 一次性取出所需字段，后续只用局部变量
+        email = account.get('email', 'N/A')
+        uid = account.get('user_id', 'N/A')
+        mtype = account.get('membership_type', 'free').upper()
+        used = account.get('used', 0)
+        limit = account.get('limit_value', 1000)
+        pct = account.get('usage_percent', 0)
+        machine_info = account.get('machine_info')
+        
+        # 组装期间暂停绘制，完成后一次性刷新
         widget = QWidget()
+        widget.setUpdatesEnabled(False)
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(10, 10, 10, 10)
         
-        # 滚动区域
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QScrollArea.Shape.NoFrame)
-        
+        # 单个 QFormLayout 承载全部信息，分区用粗体标题行代替 QGroupBox
         content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
+        content_widget.setStyleSheet(self._MONO_LABEL_QSS)
+        form = QFormLayout(content_widget)
+        form.setSpacing(10)
         
         # === 基本信息 ===
-        basic_group = QGroupBox("基本信息")
-        basic_layout = QGridLayout(basic_group)
-        basic_layout.setSpacing(10)
-        
-        row = 0
-        self._add_info_row(basic_layout, row, "邮箱:", account.get('email', 'N/A'))
-        row += 1
-        self._add_info_row(basic_layout, row, "用户ID:", account.get('user_id', 'N/A'))
-        row += 1
-        self._add_info_row(basic_layout, row, "套餐类型:", account.get('membership_type', 'free').upper())
-        row += 1
-        self._add_info_row(basic_layout, row, "使用情况:", 
-                          f"{account.get('used', 0)} / {account.get('limit_value', 1000)} ({account.get('usage_percent', 0)}%)")
-        
-        content_layout.addWidget(basic_group)
+        form.addRow(self._section_label("基本信息"))
+        self._add_info_row(form, "邮箱:", email)
+        self._add_info_row(form, "用户ID:", uid)
+        self._add_info_row(form, "套餐类型:", mtype)
+        self._add_info_row(form, "使用情况:", f"{used} / {limit} ({pct}%)")
         
         # === Token 信息 ===
-        token_group = QGroupBox("Token 信息")
-        token_layout = QVBoxLayout(token_group)
-        
-        # AccessToken
-        token_layout.addWidget(QLabel("AccessToken:"))
-        access_token_text = QTextEdit()
-        access_token_text.setMaximumHeight(100)
-        access_token_text.setReadOnly(True)
-        access_token_text.setPlainText(account.get('access_token', ''))
-        access_token_text.setStyleSheet("font-family: 'Courier New'; font-size: 9pt;")
-        token_layout.addWidget(access_token_text)
-        
-        # 复制按钮
-        copy_token_layout = QHBoxLayout()
-        copy_access_btn = QPushButton("📋 复制 AccessToken")
-        copy_access_btn.clicked.connect(lambda: self._copy_to_clipboard(account.get('access_token', '')))
-        copy_token_layout.addWidget(copy_access_btn)
-        copy_token_layout.addStretch()
-        token_layout.addLayout(copy_token_layout)
-        
-        # RefreshToken
-        if account.get('refresh_token'):
-            token_layout.addWidget(QLabel("RefreshToken:"))
-            refresh_token_text = QTextEdit()
-            refresh_token_text.setMaximumHeight(100)
-            refresh_token_text.setReadOnly(True)
-            refresh_token_text.setPlainText(account.get('refresh_token', ''))
-            refresh_token_text.setStyleSheet("font-family: 'Courier New'; font-size: 9pt;")
-            token_layout.addWidget(refresh_token_text)
+        form.addRow(self._section_label("Token 信息"))
+        
+        # Token 字段（表驱动；可选 Token 缺失时跳过，只读单行显示无需 QTextEdit 的文档排版引擎）
+        for label, key, required in TOKEN_FIELDS:
+            val = account.get(key)
+            if not val and not required:
+                continue
+            val = val or ''
             
-            copy_refresh_btn = QPushButton("📋 复制 RefreshToken")
-            copy_refresh_btn.clicked.connect(lambda: self._copy_to_clipboard(account.get('refresh_token', '')))
-            copy_refresh_layout = QHBoxLayout()
-            copy_refresh_layout.addWidget(copy_refresh_btn)
-            copy_refresh_layout.addStretch()
-            token_layout.addLayout(copy_refresh_layout)
-        
-        # SessionToken
-        if account.get('session_token'):
-            token_layout.addWidget(QLabel("SessionToken (用于API):"))
-            session_token_text = QTextEdit()
-            session_token_text.setMaximumHeight(100)
-            session_token_text.setReadOnly(True)
-            session_token_text.setPlainText(account.get('session_token', ''))
-            session_token_text.setStyleSheet("font-family: 'Courier New'; font-size: 9pt;")
-            token_layout.addWidget(session_token_text)
+            token_text = QLineEdit(_shorten(val))
+            token_text.setReadOnly(True)
+            token_text.setCursorPosition(0)
+            token_text.setStyleSheet(self._MONO_QSS)
             
-            copy_session_btn = QPushButton("📋 复制 SessionToken")
-            copy_session_btn.clicked.connect(lambda: self._copy_to_clipboard(account.get('session_token', '')))
-            copy_session_layout = QHBoxLayout()
-            copy_session_layout.addWidget(copy_session_btn)
-            copy_session_layout.addStretch()
-            token_layout.addLayout(copy_session_layout)
-        
-        content_layout.addWidget(token_group)
+            # 复制按钮（值存于 payload 属性，所有按钮共用一个槽）
+            copy_btn = QPushButton(f"📋 复制 {label.split()[0]}")
+            copy_btn.setProperty("payload", val)
+            copy_btn.clicked.connect(self._on_copy_clicked)
+            
+            token_row = QHBoxLayout()
+            token_row.addWidget(token_text)
+            token_row.addWidget(copy_btn)
+            form.addRow(f"{label}:", token_row)
         
         # === 机器码信息 ===
-        if account.get('machine_info'):
-            machine_group = QGroupBox("机器码信息")
-            machine_layout = QVBoxLayout(machine_group)
-            
-            machine_info = account.get('machine_info')
+        if machine_info:
+            form.addRow(self._section_label("机器码信息"))
             
             if isinstance(machine_info, dict):
-                machine_grid = QGridLayout()
-                machine_grid.setSpacing(10)
-                
-                fields = [
-                    ("telemetry.machineId", "Machine ID"),
-                    ("telemetry.macMachineId", "Mac Machine ID"),
-                    ("telemetry.devDeviceId", "Dev Device ID"),
-                    ("telemetry.sqmId", "SQM ID"),
-                    ("system.machineGuid", "Machine GUID")
-                ]
-                
-                for idx, (key, label) in enumerate(fields):
-                    if key in machine_info:
-                        label_widget = QLabel(f"{label}:")
-                        value_widget = QLabel(machine_info[key])
-                        value_widget.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-                        value_widget.setStyleSheet("font-family: 'Courier New'; font-size: 9pt;")
-                        value_widget.setWordWrap(True)
-                        
-                        machine_grid.addWidget(label_widget, idx, 0)
-                        machine_grid.addWidget(value_widget, idx, 1)
-                
-                machine_layout.addLayout(machine_grid)
+                # 等宽样式由 content_widget 上的属性选择器统一提供，避免逐个控件解析 QSS
+                for key, label in _MACHINE_FIELDS:
+                    if key not in machine_info:
+                        continue
+                    value_widget = QLabel(machine_info[key])
+                    value_widget.setProperty("mono", True)
+                    value_widget.setWordWrap(True)
+                    value_widget.setTextInteractionFlags(_SELECT_FLAG)
+                    form.addRow(f"{label}:", value_widget)
                 
-                # 复制机器码JSON
+                # 复制机器码JSON（建页时序列化一次，点击时不再重复序列化）
+                machine_json = json_utils.dumps(machine_info, indent=True)
                 copy_machine_btn = QPushButton("📋 复制机器码 JSON")
-                copy_machine_btn.clicked.connect(
-                    lambda: self._copy_to_clipboard(json.dumps(machine_info, indent=2, ensure_ascii=False))
-                )
-                copy_machine_layout = QHBoxLayout()
-                copy_machine_layout.addWidget(copy_machine_btn)
-                copy_machine_layout.addStretch()
-                machine_layout.addLayout(copy_machine_layout)
+                copy_machine_btn.setProperty("payload", machine_json)
+                copy_machine_btn.clicked.connect(self._on_copy_clicked)
+                copy_machine_row = QHBoxLayout()
+                copy_machine_row.addWidget(copy_machine_btn)
+                copy_machine_row.addStretch()
+                form.addRow("", copy_machine_row)
             else:
-                machine_text = QTextEdit()
-                machine_text.setMaximumHeight(150)
+                # 纯文本内容用 QPlainTextEdit，省去富文本排版
+                machine_text = QPlainTextEdit()
                 machine_text.setReadOnly(True)
+                machine_text.setMaximumHeight(150)
+                machine_text.setCenterOnScroll(False)
+                machine_text.document().setDocumentMargin(2)
                 machine_text.setPlainText(str(machine_info))
-                machine_layout.addWidget(machine_text)
-            
-            content_layout.addWidget(machine_group)
-        
-        content_layout.addStretch()
+                form.addRow(machine_text)
         
-        scroll.setWidget(content_widget)
-        layout.addWidget(scroll)
+        # 内容放得下时直接加入，省去 QScrollArea 及其 viewport；否则仍用滚动区域
+        content_widget.adjustSize()
+        if content_widget.sizeHint().height() <= self.minimumHeight() - 150:
+            layout.addWidget(content_widget)
+        else:
+            scroll = QScrollArea()
+            scroll.setWidgetResizable(True)
+            scroll.setFrameShape(QScrollArea.Shape.NoFrame)
+            scroll.setWidget(content_widget)
+            layout.addWidget(scroll)
         
+        widget.setUpdatesEnabled(True)
         return widget
     
-    def _add_info_row(self, layout: QGridLayout, row: int, label: str, value: str):
+    def _section_label(self, title: str) -> QLabel:
+        """创建分区标题行"""
+        section = QLabel(title)
+        section.setStyleSheet(self._SECTION_QSS)
+        return section
+    
+    def _add_info_row(self, form: QFormLayout, label: str, value: str):
         """添加信息行"""
         label_widget = QLabel(label)
-        label_widget.setStyleSheet("font-weight: bold;")
+        label_widget.setStyleSheet(self._BOLD_QSS)
         
         value_widget = QLabel(str(value))
-        value_widget.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        value_widget.setTextInteractionFlags(_SELECT_FLAG)
         
-        layout.addWidget(label_widget, row, 0)
-        layout.addWidget(value_widget, row, 1)
+        form.addRow(label_widget, value_widget)
+    
+    def _on_copy_clicked(self):
+        """复制按钮共用槽：从按钮的 payload 属性读取待复制内容"""
+        self._copy_to_clipboard(self.sender().property("payload"))
     
     def _copy_to_clipboard(self, text: str):
         """复制文本到剪贴板"""
-        from PyQt6.QtWidgets import QApplication
-        
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
-        
-        # 简单提示（可以改进）
-        self.statusBar().showMessage("✅ 已复制到剪贴板", 2000) if hasattr(self, 'statusBar') else None
+        self._clipboard.setText(text)
 
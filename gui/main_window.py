@@ -8,22 +8,27 @@ Zzx-Cursor-Auto 的主界面
 import sys
 import json
 import time
+import base64
+import bisect
+import itertools
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QScrollArea, QMessageBox, QToolBar,
-    QLabel, QSplitter, QSizePolicy, QTabWidget, QDialog
+    QLabel, QSplitter, QSizePolicy, QTabWidget, QDialog, QFileDialog
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QTimer, QEvent
 from PyQt6.QtGui import QAction
 
 # 添加项目根目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.account_storage import get_storage
-from core.cursor_api import get_api_client
+from core.cursor_api import get_api_client, CursorServerError
 from core.cursor_switcher import get_switcher
 from core.email_generator import init_email_generator  # 保留（无限邮箱功能）
 from gui.widgets.account_card import AccountCard
@@ -38,106 +43,227 @@ from gui.dialogs.payment_config_dialog import PaymentConfigDialog
 from core.thread_manager import get_thread_manager
 from utils.error_handler import get_error_handler, safe_execute
 from utils.logger import get_logger
+from utils import json_utils
 from utils.theme_manager import get_theme_manager
 from utils.app_paths import get_config_file
 
 logger = get_logger("main_window")
 
+# 账号卡片尺寸（用于在创建卡片前估算视口可容纳的数量）
+CARD_WIDTH = 270
+CARD_ESTIMATED_HEIGHT = 214
 
-class RefreshThread(QThread):
-    """刷新账号线程（优化版：增强异常处理和资源清理）"""
+# 日志分隔线
+_SEP_60 = "=" * 60
+_SEP_50 = "=" * 50
+_SEP_40 = "=" * 40
+
+# 非重建的列表刷新防抖间隔（毫秒）
+REFRESH_DEBOUNCE_MS = 100
+
+# 筛选/排序/搜索变化的待处理标记（共用一个防抖定时器，重叠的修改只重建一次）
+PENDING_FILTER = 1
+PENDING_SORT = 2
+PENDING_SEARCH = 4
+
+# 各类变化的防抖间隔（毫秒）
+VIEW_CHANGE_DEBOUNCE_MS = {
+    PENDING_FILTER: 250,
+    PENDING_SORT: 250,
+    PENDING_SEARCH: 300,
+}
+
+# 批量刷新结果写入数据库的合并间隔 / 单批最大条数（先到先写）
+STATUS_FLUSH_INTERVAL_MS = 500
+STATUS_FLUSH_BATCH_SIZE = 32
+
+# 批量刷新进度（对话框/状态栏）的界面合并刷新间隔（毫秒，约一帧）
+BATCH_UI_UPDATE_INTERVAL_MS = 16
+
+# 拖动多选时工具栏计数的合并刷新间隔（毫秒，约一帧）
+TOOLBAR_REFRESH_INTERVAL_MS = 16
+
+# 自动检测：Cursor 数据库未变化时跳过检测，但最长间隔该秒数仍强制检测一次（同步用量数据）
+AUTO_DETECT_MAX_SKIP_SECONDS = 300
+
+
+@lru_cache(maxsize=256)
+def _build_temp_session_format(access_token: str) -> Optional[str]:
+    """
+    从 AccessToken（JWT）解析用户 ID，构造临时 session 格式（仅用于 API 调用）
+    
+    同一个 Token 只解析一次（批量刷新时避免重复 base64/JSON 解码）
+    
+    Args:
+        access_token: AccessToken
+        
+    Returns:
+        Optional[str]: "user_id::access_token"，解析失败返回 None
+    """
+    try:
+        parts = access_token.split('.')
+        if len(parts) < 2:
+            return None
+        payload = parts[1]
+        padding = len(payload) % 4
+        if padding:
+            payload += '=' * (4 - padding)
+        token_data = json.loads(base64.urlsafe_b64decode(payload))
+        user_id = token_data.get('sub', '').replace('auth0|', '')
+        return f"{user_id}::{access_token}"
+    except Exception:
+        return None
+
+
+# 检测到的账号中直接原样保存的字段（email/token 类字段单独处理）
+_DETECTED_PASSTHROUGH_FIELDS = (
+    'user_id', 'membership_type', 'usage_percent', 'used', 'limit',
+    'subscription_status',  # ⭐ 订阅状态
+    'total_cost',           # ⭐ 真实费用
+    'total_tokens',         # ⭐ 总tokens
+    'unpaid_amount',        # ⭐ 欠费金额
+    'model_usage',          # ⭐ 模型费用详情（字典直接传入，由存储层序列化）
+    'last_used',            # ⭐ 最后使用时间
+    'machine_info',         # ⭐ 保留机器码
+)
+
+
+def _detected_account_record(account_data: dict) -> dict:
+    """
+    把检测到的账号信息转换为写入数据库的记录（每个字段只查找一次）
+    
+    Args:
+        account_data: 检测结果
+        
+    Returns:
+        dict: 传给 upsert_account 的数据
+    """
+    get = account_data.get
+    access_token = get('access_token')
+    
+    record = {key: get(key) for key in _DETECTED_PASSTHROUGH_FIELDS}
+    record.update(
+        email=get('email'),
+        access_token=access_token,
+        # ⭐ 如果 refresh_token 为空，用 access_token 填充（通常相同）
+        refresh_token=get('refresh_token') or access_token,
+        # ⚠️ 过滤掉构造的 session_token，设为空字符串（导出时转为 null）
+        session_token='',
+        days_remaining=get('days_remaining', 0),
+    )
+    return record
+
+
+class AccountsQuerySignals(QObject):
+    """账号列表查询信号"""
     
-    progress = pyqtSignal(int, int, str)
-    finished = pyqtSignal(int, dict)
+    result = pyqtSignal(int, list, list)  # 查询代号, 账号列表, 小写邮箱列表（与账号列表一一对应）
+
+
+class AccountsQueryRunnable(QRunnable):
+    """在线程池中查询账号列表（避免 SQLite 查询和解密阻塞界面）"""
     
-    def __init__(self, account_id: int, session_token: str = None, access_token: str = None, is_batch: bool = False):
+    def __init__(self, generation: int, signals: AccountsQuerySignals, **query):
+        """
+        Args:
+            generation: 查询代号（用于丢弃过期结果）
+            signals: 结果信号对象（由主窗口持有）
+            **query: 传给 get_all_accounts 的筛选/排序参数
+        """
         super().__init__()
-        self.account_id = account_id
-        # ⭐ 优先使用 SessionToken (type=web) 调用 API
-        # SessionToken 格式: user_xxx::jwt (用于 API 调用获取账号信息)
-        # AccessToken 格式: eyJhbGc... (type=session，用于客户端登录)
-        self.session_token = session_token
-        self.access_token = access_token
-        self.is_batch = is_batch  # ⭐ 是否为批量刷新（快速模式）
-        self._is_running = True
-        
-    def stop(self):
-        """停止线程"""
-        self._is_running = False
-        self.quit()
+        self.generation = generation
+        self.signals = signals
+        self.query = query
     
     def run(self):
-        """执行刷新"""
+        """执行查询"""
         try:
-            if not self._is_running:
-                return
-                
-            api = get_api_client()
-            
-            # ⭐ 日志：准备调用 API
-            logger.debug(f"  ↳ [线程] 准备调用 API (account_id={self.account_id})")
-            if self._is_running:
-                self.progress.emit(self.account_id, 30, "连接 API...")
-            
-            # ⭐ 优先使用 SessionToken 调用 API（用于获取账号信息）
-            # 如果没有 SessionToken，则使用 AccessToken
-            token = self.session_token or self.access_token
-            
-            if not token:
-                logger.error(f"  ↳ [线程] 没有可用的 Token (account_id={self.account_id})")
-                if self._is_running:
-                    self.progress.emit(self.account_id, 0, "缺少 Token")
-                    self.finished.emit(self.account_id, {})
-                return
+            accounts = get_storage().get_all_accounts(**self.query)
+        except Exception as e:
+            logger.error(f"查询账号列表失败: {e}")
+            accounts = []
+        # ⭐ 搜索用的小写邮箱在后台预先算好，主线程过滤时不再逐个 lower()
+        lower_emails = [(acc.get('email') or '').lower() for acc in accounts]
+        try:
+            self.signals.result.emit(self.generation, accounts, lower_emails)
+        except RuntimeError:
+            # 查询期间主窗口已关闭，信号对象已被销毁
+            pass
+
+
+class FingerprintBrowserSignals(QObject):
+    """指纹浏览器生成信号"""
+    
+    log = pyqtSignal(list)  # 一组日志行（每个阶段合并发送一次）
+    done = pyqtSignal(str)  # 用户数据目录
+    error = pyqtSignal(str)
+
+
+class FingerprintBrowserRunnable(QRunnable):
+    """在线程池中生成设备指纹并启动浏览器（避免启动浏览器时阻塞界面）"""
+    
+    def __init__(self, signals: FingerprintBrowserSignals):
+        """
+        Args:
+            signals: 信号对象（由主窗口持有）
+        """
+        super().__init__()
+        self.signals = signals
+    
+    def run(self):
+        """执行生成"""
+        # ⭐ 每个阶段的日志先收集，再通过一次信号发送（减少跨线程信号和日志控件刷新）
+        emit_lines = self.signals.log.emit
+        try:
+            from core.browser_manager import BrowserManager
+            from core.machine_id_generator import generate_machine_info
+            import tempfile
             
-            if not self._is_running:
-                return
+            # 1. 生成随机设备指纹
+            machine_info = generate_machine_info()
+            emit_lines([
+                "\n📌 生成随机设备指纹...",
+                "✅ 设备指纹已生成:",
+                f"  machineId: {machine_info.get('telemetry.machineId', 'N/A')[:50]}...",
+                f"  macMachineId: {machine_info.get('telemetry.macMachineId', 'N/A')}",
+                f"  devDeviceId: {machine_info.get('telemetry.devDeviceId', 'N/A')}",
+                f"  sqmId: {machine_info.get('telemetry.sqmId', 'N/A')}",
+                f"  machineGuid: {machine_info.get('system.machineGuid', 'N/A')}",
+            ])
             
-            # ⭐ 日志：调用 API
-            mode = "快速模式" if self.is_batch else "详细模式"
-            logger.debug(f"  ↳ [线程] 调用 get_account_details ({mode})...")
-            if self._is_running:
-                self.progress.emit(self.account_id, 50, "获取账号信息...")
+            # 2. 创建独立的用户数据目录
+            temp_dir = tempfile.mkdtemp(prefix="fingerprint_browser_")
             
-            # ⭐ 根据是否批量刷新决定是否获取详细数据
-            detailed = not self.is_batch  # 批量刷新时不获取详细数据
-            details = api.get_account_details(token, detailed=detailed)
+            # 3. 初始化浏览器（只生成，不访问页面；启动前先输出，避免等待期间无提示）
+            emit_lines([
+                f"\n📂 用户数据目录: {temp_dir}",
+                "\n🌐 启动浏览器...",
+            ])
+            browser_manager = BrowserManager()
+            browser_manager.init_browser(
+                incognito=False,  # 不使用无痕模式，保留指纹
+                headless=False,   # 可见模式
+                user_data_dir=temp_dir
+            )
             
-            if not self._is_running:
-                return
+            self.signals.done.emit(temp_dir)
             
-            if details:
-                # ⭐ 日志：API 返回成功
-                logger.debug(f"  ↳ [线程] API 返回成功")
-                if self._is_running:
-                    self.progress.emit(self.account_id, 100, "刷新成功")
-                    self.finished.emit(self.account_id, details)
-            else:
-                # ⭐ 日志：API 返回失败
-                logger.warning(f"  ↳ [线程] API 返回空数据")
-                if self._is_running:
-                    self.progress.emit(self.account_id, 0, "API 返回空")
-                    self.finished.emit(self.account_id, {})
-                
         except Exception as e:
-            logger.error(f"  ↳ [线程] 刷新异常: {e}", exc_info=True)
-            # ⭐ 即使出错也发送完成信号，确保批量刷新继续
-            if self._is_running:
-                try:
-                    self.progress.emit(self.account_id, 0, f"错误: {e}")
-                    self.finished.emit(self.account_id, {})
-                except:
-                    pass
-        finally:
-            # ⭐ 确保清理标志
-            self._is_running = False
+            logger.error(f"生成指纹浏览器失败: {e}", exc_info=True)
+            try:
+                self.signals.error.emit(str(e))
+            except RuntimeError:
+                # 生成期间主窗口已关闭，信号对象已被销毁
+                pass
 
 
 class MainWindow(QMainWindow):
     """主窗口类"""
     
     # 定义信号（确保在主线程中处理刷新完成）
-    refresh_finished_signal = pyqtSignal(int, dict)
+    refresh_finished_signal = pyqtSignal(int, dict, object)  # (账号 ID, 刷新结果, 刷新上下文)
+    switch_step_done_signal = pyqtSignal(str, bool, object)  # 切换步骤完成（步骤名, 是否成功, 切换上下文）
+    server_error_signal = pyqtSignal()  # ⭐ 刷新任务遇到 Cursor 服务器错误（工作线程发射，主线程显示提示）
     
     def __init__(self, pre_detected_account=None):
         """初始化主窗口
@@ -168,18 +294,92 @@ class MainWindow(QMainWindow):
         
         # UI组件
         self.account_cards = {}
-        self.refresh_callbacks = {}  # 刷新回调函数 {account_id: callback}
+        self._card_pool = []  # ⭐ 回收的卡片（重建时复用，避免销毁/重建控件树）
+        self._deferred_card_accounts = []  # ⭐ 尚未创建卡片的账号（滚动到附近时再创建）
+        self._filtered_out_deferred = 0  # ⭐ 被可见性筛选排除、尚未创建卡片的账号数（计入总数）
+        self._first_card_email = None  # ⭐ 当前列表第一个卡片的邮箱（判断是否需要重新排序）
+        self._visible_ids = set()  # ⭐ 未隐藏卡片的账号 ID（显隐切换时增量维护，避免逐个 isVisible()）
+        # ⭐ 卡片信号名 → 处理方法（每张卡片只连接一个 action 信号，由此分发）
+        self._card_action_handlers = {
+            'switch_clicked': self._on_switch_account,
+            'detail_clicked': self._on_refresh_detail,  # ⭐ 详情按钮触发详细刷新
+            'delete_clicked': self._on_delete_account,
+            'refresh_clicked': self._on_refresh_account,
+            'selection_changed': self._on_card_selection_changed,
+            'drag_select_start': self._on_drag_select_start,  # ⭐ 拖动多选
+            'drag_select_move': self._on_drag_select_move,
+            'drag_select_end': self._on_drag_select_end,
+        }
+        # ⭐ 界面控件在 _setup_ui 中创建，这里预先声明（用 is not None 判断，替代 hasattr）
+        self.toolbar = None
+        self.current_panel = None
+        self.status_bar = None
+        self.account_list_widget = None
+        self.account_list_layout = None
+        self.main_splitter = None
+        self.server_error_label = None
+        # ⭐ 服务器错误提示框（在主线程创建一次，之后复用）
+        self._server_error_dialog = QMessageBox(
+            QMessageBox.Icon.Warning,
+            "🚨 Cursor服务器错误",
+            "检测到 Cursor API 返回500错误\n\n"
+            "这是Cursor服务器的问题，不是代码问题。\n\n"
+            "建议操作：\n"
+            "1. 等待5-10分钟\n"
+            "2. 或重新登录Cursor编辑器\n"
+            "3. 然后重启程序\n\n"
+            "批量刷新已自动停止。",
+            QMessageBox.StandardButton.Ok,
+            self
+        )
+        self.theme_toggle_action = None
+        
         self.selected_account_ids = set()  # 选中的账号 ID 集合
+        self._task_seq = itertools.count(1)  # ⭐ 线程池任务ID序号（保证同一账号的多次任务ID不重复）
         self.current_login_email = None  # 当前登录的邮箱地址
         self._is_closing = False  # ⭐ 关闭标志
+        self._switch_in_progress = False  # ⭐ 账号切换进行中（异步步骤未完成前不接受新的切换）
         self._first_load = True  # ⭐ 是否首次加载（只在首次播放动画）
         
         # 连接信号，确保刷新完成在主线程处理
         self.refresh_finished_signal.connect(self._on_refresh_finished)
+        self.switch_step_done_signal.connect(self._on_switch_step_done)
+        self.server_error_signal.connect(self._show_server_error_warning)
+        
+        # ⭐ 账号列表查询在后台线程执行，结果通过信号回到主线程
+        self._query_generation = 0
+        self._pending_force_rebuild = False
+        self._accounts_query_signals = AccountsQuerySignals()
+        self._accounts_query_signals.result.connect(self._on_accounts_query_result)
+        
+        # ⭐ 指纹浏览器在后台线程生成，日志和结果通过信号回到主线程
+        self._fingerprint_signals = FingerprintBrowserSignals()
+        self._fingerprint_signals.log.connect(self._on_fingerprint_log)
+        self._fingerprint_signals.done.connect(self._on_fingerprint_browser_ready)
+        self._fingerprint_signals.error.connect(self._on_fingerprint_browser_failed)
         
         # ⭐ 拖动多选功能
         self.is_drag_selecting = False  # 是否正在拖动多选
         self.drag_start_card = None  # 拖动起始的卡片
+        self._drag_hit_index = None  # ⭐ 拖动命中测试索引（按行分组的卡片矩形，拖动开始时构建）
+        # ⭐ 拖动多选时工具栏计数合并到定时器中刷新（每帧最多一次）
+        self._toolbar_refresh_timer = QTimer(self)
+        self._toolbar_refresh_timer.setSingleShot(True)
+        self._toolbar_refresh_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._toolbar_refresh_timer.setInterval(TOOLBAR_REFRESH_INTERVAL_MS)
+        self._toolbar_refresh_timer.timeout.connect(self._flush_toolbar_counts)
+        
+        # 批量刷新状态（_on_batch_refresh 开始时重置）
+        self.batch_refresh_queue = deque()
+        self.batch_refresh_total = 0
+        self.batch_refresh_current = 0
+        self.batch_refresh_active = 0
+        self.batch_refresh_success = 0
+        self.batch_refresh_failed = 0
+        self.batch_refresh_dialog = None
+        self.batch_refresh_max_concurrent = 2
+        self._batch_last_email = ''  # ⭐ 最近完成的账号邮箱（进度界面合并刷新时显示）
+        self._batch_completed_ids = []  # ⭐ 批量刷新成功的账号（卡片数据在批量结束后统一更新）
         
         # 筛选和排序状态
         self.current_filter = {}
@@ -187,38 +387,68 @@ class MainWindow(QMainWindow):
         
         # 自动检测定时器（已禁用，只在启动时检测一次）
         self.auto_detect_timer = None
+        self._last_detect_fingerprint = None  # ⭐ 上次自动检测时 state.vscdb 的 stat 指纹
+        self._last_detect_time = 0.0
+        
+        # ⭐ 检测到当前账号后延迟重建列表（复用同一个定时器，连续检测只重建一次）
+        self._post_detect_refresh_timer = QTimer(self)
+        self._post_detect_refresh_timer.setSingleShot(True)
+        self._post_detect_refresh_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._post_detect_refresh_timer.setInterval(500)
+        self._post_detect_refresh_timer.timeout.connect(self._rebuild_after_detection)
         
         # 记录上一次窗口宽度，用于判断是否需要调整分割器
         self.last_window_width = 0
         
-        # ⭐ 搜索防抖定时器（避免频繁刷新）
-        # 搜索防抖定时器
-        self.search_debounce_timer = QTimer()
-        self.search_debounce_timer.setSingleShot(True)
-        self.search_debounce_timer.timeout.connect(self._do_search_refresh)
+        # ⚠️ 防抖定时器显式使用 CoarseTimer：间隔低于 2000ms 的单次定时器默认会
+        # 切换为 PreciseTimer，在 Windows 上会提高系统定时器分辨率（耗电）
         
-        # ⭐ 筛选防抖定时器（防止筛选时闪烁）
-        self.filter_debounce_timer = QTimer()
-        self.filter_debounce_timer.setSingleShot(True)
-        self.filter_debounce_timer.timeout.connect(self._do_filter_refresh)
+        # ⭐ 筛选/排序/搜索共用的防抖定时器（待处理的变化记录在位标记中，到期后统一刷新一次）
+        self._pending_view_ops = 0
+        self._view_change_timer = QTimer()
+        self._view_change_timer.setSingleShot(True)
+        self._view_change_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._view_change_timer.timeout.connect(self._do_view_change_refresh)
         
-        # ⭐ 排序防抖定时器（防止排序时闪烁）
-        self.sort_debounce_timer = QTimer()
-        self.sort_debounce_timer.setSingleShot(True)
-        self.sort_debounce_timer.timeout.connect(self._do_sort_refresh)
+        # ⭐ 列表刷新防抖定时器（短时间内多次非重建刷新合并为一次查询）
+        self._refresh_debounce_timer = QTimer(self)
+        self._refresh_debounce_timer.setSingleShot(True)
+        self._refresh_debounce_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._refresh_debounce_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_debounce_timer.timeout.connect(self._do_refresh_accounts)
         
         # ⭐ 新增：批量更新管理器
         self._batch_update_manager = {
-            'pending_cards': {},      # {account_id: account_data}
+            'pending_cards': {},      # {account_id: account_data 或 None（None 表示刷新时从数据库读取）}
             'timer': QTimer()
         }
         self._batch_update_manager['timer'].setSingleShot(True)
+        self._batch_update_manager['timer'].setTimerType(Qt.TimerType.CoarseTimer)
         self._batch_update_manager['timer'].timeout.connect(self._flush_card_updates)
         
+        # ⭐ 批量刷新结果的数据库写入缓冲（合并为单个事务，避免每个账号各提交一次）
+        self._pending_status_updates = []  # [(account_id, usage_info 或 None（失败）)]
+        self._status_flush_timer = QTimer()
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._status_flush_timer.setInterval(STATUS_FLUSH_INTERVAL_MS)
+        self._status_flush_timer.timeout.connect(self._flush_pending_updates)
+        
+        # ⭐ 批量刷新进度的界面更新合并到定时器中（每个账号只更新计数，每帧最多重绘一次）
+        self._batch_ui_timer = QTimer(self)
+        self._batch_ui_timer.setSingleShot(True)
+        self._batch_ui_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._batch_ui_timer.setInterval(BATCH_UI_UPDATE_INTERVAL_MS)
+        self._batch_ui_timer.timeout.connect(self._flush_batch_ui)
+        
+        # ⭐ 每个邮箱上次检测写入的模型费用详情（未变化时跳过序列化和写入）
+        self._last_model_usage_by_email = {}
+        
         # 处理预检测的账号信息
         self._handle_pre_detected_account(pre_detected_account)
         
         # 加载配置
+        self._config_mtime = None  # ⭐ 已加载配置文件的 (修改时间, 大小)，未变化时跳过重新解析
         self._load_config()
         
         # 设置 UI
@@ -227,21 +457,18 @@ class MainWindow(QMainWindow):
         # 应用主题（替代原来的 _load_stylesheet）
         self.theme_manager.force_reload_current_theme()
         
-        # 加载账号
-        self.refresh_accounts()
+        # 加载账号（首次加载不经过防抖）
+        self._do_refresh_accounts()
         
-        # ⭐ 如果有预检测的账号信息，更新右侧面板
-        if pre_detected_account:
-            # 延迟更新右侧面板，确保UI完全初始化
-            QTimer.singleShot(1000, lambda: self._update_current_panel_from_predetected(pre_detected_account))
-            logger.info(f"⏰ 已安排右侧面板更新任务，1秒后执行")
+        # ⭐ 如果有预检测的账号信息，窗口首次显示时更新右侧面板（见 showEvent）
+        self._pre_detected_pending = pre_detected_account
+        if not pre_detected_account:
+            # ⭐ 启动画面不再阻塞网络检测：窗口显示后在后台检测当前账号
+            QTimer.singleShot(0, self._start_deferred_detection)
         
         # ⚠️ 禁用自动检测 - 启动时已完成检测
         # self._start_auto_detection()
         
-        # ⚠️ 禁用启动后的自动检测 - 启动画面已完成检测
-        # QTimer.singleShot(1000, self._auto_detect_account)
-        
         # 设置窗口焦点策略，确保能接收键盘事件
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         
@@ -270,41 +497,7 @@ class MainWindow(QMainWindow):
                 storage = get_storage()
                 
                 # 处理账号数据格式
-                access_token = detected_account.get('access_token')
-                refresh_token = detected_account.get('refresh_token')
-                
-                # 如果 refresh_token 为空，用 access_token 填充
-                if not refresh_token and access_token:
-                    refresh_token = access_token
-                
-                # 将模型费用转为JSON
-                model_usage_json = None
-                if 'model_usage' in detected_account and detected_account['model_usage']:
-                    import json
-                    try:
-                        model_usage_json = json.dumps(detected_account['model_usage'])
-                    except:
-                        pass
-                
-                filtered_data = {
-                    'email': detected_account.get('email'),
-                    'access_token': access_token,
-                    'refresh_token': refresh_token,
-                    'session_token': '',  # 空字符串
-                    'user_id': detected_account.get('user_id'),
-                    'membership_type': detected_account.get('membership_type'),
-                    'usage_percent': detected_account.get('usage_percent'),
-                    'used': detected_account.get('used'),
-                    'limit': detected_account.get('limit'),
-                    'days_remaining': detected_account.get('days_remaining', 0),
-                    'subscription_status': detected_account.get('subscription_status'),
-                    'total_cost': detected_account.get('total_cost'),
-                    'total_tokens': detected_account.get('total_tokens'),
-                    'unpaid_amount': detected_account.get('unpaid_amount'),
-                    'model_usage_json': model_usage_json,
-                    'last_used': detected_account.get('last_used'),
-                    'machine_info': detected_account.get('machine_info')
-                }
+                filtered_data = _detected_account_record(detected_account)
                 
                 # 保存到数据库
                 account_id = storage.upsert_account(filtered_data)
@@ -315,17 +508,22 @@ class MainWindow(QMainWindow):
         else:
             logger.info("无预检测账号信息")
     
+    def showEvent(self, event):
+        """窗口显示事件（首次显示后用预检测的账号信息更新右侧面板）"""
+        super().showEvent(event)
+        if self._pre_detected_pending:
+            detected_account = self._pre_detected_pending
+            self._pre_detected_pending = None
+            # 推迟到首次绘制之后执行，不再固定等待 1 秒
+            QTimer.singleShot(0, lambda: self._update_current_panel_from_predetected(detected_account))
+    
     def _update_current_panel_from_predetected(self, detected_account):
         """使用预检测的账号信息更新右侧当前账号面板"""
         try:
             logger.debug("开始更新右侧面板...")
             
-            if not hasattr(self, 'current_panel'):
-                logger.warning("current_panel 未找到")
-                return
-                
-            if not self.current_panel:
-                logger.warning("current_panel 为空")
+            if self.current_panel is None:
+                logger.warning("current_panel 未创建")
                 return
                 
             if not detected_account:
@@ -339,22 +537,23 @@ class MainWindow(QMainWindow):
                 logger.warning("email_label 未找到，UI可能未初始化")
                 return
             
-            # 更新右侧面板显示
-            self.current_panel.update_account_info(detected_account)
-            
             email = detected_account.get('email', '未知')
             plan = detected_account.get('membership_type', 'free').upper()
             usage = detected_account.get('usage_percent', 0)
             
-            logger.info(f"✨ 右侧面板已更新: {email} ({plan}, {usage}%)")
-            
-            # 强制刷新UI
-            self.current_panel.update()
-            self.current_panel.repaint()
+            # ⭐ 暂停渲染：面板更新和日志输出合并为重新启用后的一次重绘
+            self.current_panel.setUpdatesEnabled(False)
+            try:
+                # 更新右侧面板显示
+                self.current_panel.update_account_info(detected_account)
+                
+                # 输出检测日志到面板
+                self.current_panel.log(f"[启动检测] 检测成功: {email}")
+                self.current_panel.log(f"[启动检测] 套餐: {plan} | 使用率: {usage}%")
+            finally:
+                self.current_panel.setUpdatesEnabled(True)
             
-            # 输出检测日志到面板
-            self.current_panel.log(f"[启动检测] 检测成功: {email}")
-            self.current_panel.log(f"[启动检测] 套餐: {plan} | 使用率: {usage}%")
+            logger.info(f"✨ 右侧面板已更新: {email} ({plan}, {usage}%)")
             
             # 验证更新结果
             current_email_text = self.current_panel.email_label.text()
@@ -365,6 +564,14 @@ class MainWindow(QMainWindow):
             import traceback
             logger.error(traceback.format_exc())
     
+    def _start_deferred_detection(self):
+        """后台检测当前登录账号（结果通过 account_detected 信号回到主线程）"""
+        try:
+            self.current_panel.email_label.setText("📧 正在检测当前账号...")
+            self.current_panel.start_detection()
+        except Exception as e:
+            logger.error(f"启动后台账号检测失败: {e}")
+    
     def _load_config(self):
         """加载配置文件"""
         try:
@@ -372,10 +579,16 @@ class MainWindow(QMainWindow):
             config_path = get_config_file()
             
             if config_path.exists():
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
+                # ⭐ 文件未修改时跳过重新解析（设置保存等场景会频繁重载）
+                stat = config_path.stat()
+                config_key = (stat.st_mtime_ns, stat.st_size)
+                if config_key == self._config_mtime:
+                    return
+                self.config = json_utils.loads(config_path.read_bytes())
+                self._config_mtime = config_key
             else:
                 self.config = {"email": {"domain": "yourdomain.com"}}
+                self._config_mtime = None
             
             # 初始化邮箱生成器
             domain = self.config.get('email', {}).get('domain', 'yourdomain.com')
@@ -393,6 +606,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"加载配置失败: {e}")
             self.config = {}
+            self._config_mtime = None
             self.enable_animations = True
             self.animation_speed = 'normal'
             self.reduce_motion = False
@@ -411,7 +625,6 @@ class MainWindow(QMainWindow):
         main_layout.setContentsMargins(0, 0, 0, 0)
         
         # 创建标签页
-        from PyQt6.QtWidgets import QTabWidget
         tabs = QTabWidget()
         self.main_tabs = tabs  # 保存引用
         self.current_tab_index = 0  # 记录当前标签页索引
@@ -428,25 +641,19 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Aug账号管理面板加载失败: {e}")
         
-        # 邮箱配置标签页
-        from gui.widgets.email_test_panel import EmailTestPanel
-        self.email_panel = EmailTestPanel()  # 保存引用
-        tabs.addTab(self.email_panel, "📧 邮箱配置")
-        
-        # 手机验证配置标签页（新增）
-        from gui.widgets.phone_verification_panel import PhoneVerificationPanel
-        self.phone_panel = PhoneVerificationPanel()  # 保存引用
-        tabs.addTab(self.phone_panel, "📱 手机验证")
-        
-        # 绑卡配置标签页（新增）
-        try:
-            from gui.widgets.payment_panel import PaymentPanel
-            self.payment_panel = PaymentPanel()  # 保存引用
-            self.payment_panel.config_changed.connect(self._on_payment_config_changed)
-            tabs.addTab(self.payment_panel, "💳 绑卡配置")
-        except Exception as e:
-            logger.error(f"绑卡配置面板加载失败: {e}")
-            self.payment_panel = None
+        # ⭐ 配置类标签页延迟创建：先放占位页，首次切换到该页时才导入并构建面板
+        self.email_panel = None
+        self.phone_panel = None
+        self.payment_panel = None
+        self.settings_panel = None
+        self._lazy_tabs = {}  # {标签索引: 面板工厂方法}
+        for title, factory in (
+            ("📧 邮箱配置", self._create_email_panel),
+            ("📱 手机验证", self._create_phone_panel),  # 手机验证配置标签页（新增）
+            ("💳 绑卡配置", self._create_payment_panel),  # 绑卡配置标签页（新增）
+            ("⚙️ 设置", self._create_settings_panel),
+        ):
+            self._lazy_tabs[tabs.addTab(QWidget(), title)] = factory
         
         # 浏览器设置标签页（已删除，等待重新实现）
         # browser_tab = self._create_browser_settings_tab()
@@ -459,15 +666,6 @@ class MainWindow(QMainWindow):
         # 系统监控标签页（已删除）
         # 功能已移除，减少依赖
         
-        # ⭐ 设置标签页
-        try:
-            from gui.widgets.settings_panel import SettingsPanel
-            settings_panel = SettingsPanel()
-            settings_panel.settings_changed.connect(self._on_settings_changed)
-            tabs.addTab(settings_panel, "⚙️ 设置")
-        except Exception as e:
-            logger.error(f"设置面板加载失败: {e}")
-        
         main_layout.addWidget(tabs)
         
         # ⭐ 双重保护：事件过滤器 + 切换后检查
@@ -478,6 +676,64 @@ class MainWindow(QMainWindow):
         self.status_bar = CustomStatusBar()
         self.setStatusBar(self.status_bar)
     
+    def _create_email_panel(self):
+        """创建邮箱配置面板"""
+        from gui.widgets.email_test_panel import EmailTestPanel
+        self.email_panel = EmailTestPanel()  # 保存引用
+        return self.email_panel
+    
+    def _create_phone_panel(self):
+        """创建手机验证配置面板"""
+        from gui.widgets.phone_verification_panel import PhoneVerificationPanel
+        self.phone_panel = PhoneVerificationPanel()  # 保存引用
+        return self.phone_panel
+    
+    def _create_payment_panel(self):
+        """创建绑卡配置面板"""
+        from gui.widgets.payment_panel import PaymentPanel
+        self.payment_panel = PaymentPanel()  # 保存引用
+        self.payment_panel.config_changed.connect(self._on_payment_config_changed)
+        return self.payment_panel
+    
+    def _create_settings_panel(self):
+        """创建设置面板"""
+        from gui.widgets.settings_panel import SettingsPanel
+        self.settings_panel = SettingsPanel()
+        self.settings_panel.settings_changed.connect(self._on_settings_changed)
+        return self.settings_panel
+    
+    def _materialize_tab(self, index: int):
+        """
+        首次切换到延迟标签页时创建真实面板并替换占位页
+        
+        Args:
+            index: 标签页索引
+        """
+        factory = self._lazy_tabs.pop(index, None)
+        if factory is None:
+            return
+        
+        title = self.main_tabs.tabText(index)
+        try:
+            panel = factory()
+        except Exception as e:
+            logger.error(f"{title} 面板加载失败: {e}")
+            return
+        
+        # ⭐ 替换期间屏蔽信号，避免移除当前页触发递归的 currentChanged
+        placeholder = self.main_tabs.widget(index)
+        self.main_tabs.setUpdatesEnabled(False)
+        self.main_tabs.blockSignals(True)
+        try:
+            self.main_tabs.removeTab(index)
+            self.main_tabs.insertTab(index, panel, title)
+            self.main_tabs.setCurrentIndex(index)
+        finally:
+            self.main_tabs.blockSignals(False)
+            self.main_tabs.setUpdatesEnabled(True)
+        placeholder.deleteLater()
+        logger.debug(f"延迟创建标签页: {title}")
+    
     def _create_toolbar(self):
         """创建工具栏"""
         toolbar = QToolBar("主工具栏")
@@ -622,18 +878,71 @@ class MainWindow(QMainWindow):
         scroll_area.setWidget(self.account_list_widget)
         layout.addWidget(scroll_area)
         
+        # ⭐ 滚动接近底部时再创建剩余卡片
+        self.account_scroll_area = scroll_area
+        scroll_area.verticalScrollBar().valueChanged.connect(self._materialize_visible_cards)
+        
         return panel
     
     def refresh_accounts(self, force_rebuild: bool = False):
         """
-        刷新账号列表（防闪烁版：只在需要时重建，否则只更新数据）
+        刷新账号列表（非重建刷新经过防抖，100ms 内的多次调用合并为一次）
+        
+        Args:
+            force_rebuild: 是否强制重建所有卡片（筛选、排序时需要，立即执行）
+        """
+        if force_rebuild:
+            self._do_refresh_accounts(force_rebuild=True)
+        else:
+            self._refresh_debounce_timer.start()
+    
+    def _do_refresh_accounts(self, force_rebuild: bool = False):
+        """
+        执行账号列表刷新（异步查询数据库，结果返回后在主线程更新卡片）
         
         Args:
+            force_rebuild: 是否强制重建所有卡片
+        """
+        # 立即执行的刷新会覆盖等待中的防抖刷新
+        self._refresh_debounce_timer.stop()
+        
+        # ⭐ 只应用最后一次查询的结果；被丢弃的查询所要求的重建会保留到下一次应用
+        self._query_generation += 1
+        self._pending_force_rebuild = self._pending_force_rebuild or force_rebuild
+        
+        sort_by, ascending = self.current_sort
+        QThreadPool.globalInstance().start(AccountsQueryRunnable(
+            self._query_generation,
+            self._accounts_query_signals,
+            filter_type=self.current_filter.get('type'),
+            filter_status=self.current_filter.get('status'),
+            filter_month=self.current_filter.get('month'),
+            sort_by=sort_by,
+            ascending=ascending
+        ))
+    
+    @pyqtSlot(int, list, list)
+    def _on_accounts_query_result(self, generation: int, accounts: list, lower_emails: list):
+        """账号查询完成（主线程），丢弃过期结果"""
+        if generation != self._query_generation or self._is_closing:
+            return
+        
+        force_rebuild = self._pending_force_rebuild
+        self._pending_force_rebuild = False
+        self._apply_accounts_list(accounts, force_rebuild, lower_emails)
+    
+    def _apply_accounts_list(self, accounts: list, force_rebuild: bool = False, lower_emails: list = None):
+        """
+        用查询结果刷新账号列表（防闪烁版：只在需要时重建，否则只更新数据）
+        
+        Args:
+            accounts: 已筛选、排序的账号列表
             force_rebuild: 是否强制重建所有卡片（筛选、排序时需要）
+            lower_emails: 与 accounts 对应的小写邮箱（为 None 时现场计算）
         """
         try:
             # ⭐ 调试：输出左侧面板实际宽度
-            if hasattr(self, 'account_list_widget') and self.account_list_widget:
+            if self.account_list_widget is not None:
                 actual_width = self.account_list_widget.width()
                 logger.info(f"🔍 [调试] 账号列表容器实际宽度: {actual_width}px")
                 # 计算理论上可显示的列数
@@ -648,148 +957,132 @@ class MainWindow(QMainWindow):
             # ⭐ 禁用界面更新，避免中间状态显示导致卡片分离
             self.account_list_widget.setUpdatesEnabled(False)
             
-            # 获取所有账号（应用筛选和排序）
-            sort_by, ascending = self.current_sort
-            accounts = self.storage.get_all_accounts(
-                filter_type=self.current_filter.get('type'),
-                filter_status=self.current_filter.get('status'),
-                filter_month=self.current_filter.get('month'),
-                sort_by=sort_by,
-                ascending=ascending
-            )
-            
             # 检查是否需要重建（首次加载、筛选、排序、搜索、账号数量变化）
             need_rebuild = (
                 force_rebuild or
                 not self.account_cards or  # 首次加载
-                len(self.account_cards) != len(accounts)  # 账号数量变化
+                len(self.account_cards) + len(self._deferred_card_accounts) != len(accounts)  # 账号数量变化
             )
             
             # 应用搜索过滤
-            if hasattr(self, 'toolbar') and self.toolbar.search_box.text():
-                search_text = self.toolbar.search_box.text().lower()
-                accounts = [acc for acc in accounts if search_text in acc.get('email', '').lower()]
+            search_text = self.toolbar.search_box.text().lower() if self.toolbar is not None else ''
+            if search_text:
+                if lower_emails is None:
+                    lower_emails = [(acc.get('email') or '').lower() for acc in accounts]
+                accounts = [acc for acc, email in zip(accounts, lower_emails) if search_text in email]
                 need_rebuild = True  # 搜索时需要重建
             
             # ⭐ 将当前登录的账号排到首位（无论是否重建都要排序）
             if self.current_login_email:
-                current_account = None
-                other_accounts = []
-                
-                for acc in accounts:
-                    if acc.get('email') == self.current_login_email:
-                        current_account = acc
-                    else:
-                        other_accounts.append(acc)
+                current_index = next(
+                    (i for i, acc in enumerate(accounts) if acc.get('email') == self.current_login_email),
+                    -1
+                )
                 
-                # 重新组合：当前账号在最前
-                if current_account:
-                    old_first = accounts[0].get('email', '') if accounts else ''
-                    accounts = [current_account] + other_accounts
-                    logger.info(f"🔝 账号置顶: {old_first} → {self.current_login_email}")
+                # 当前账号移到最前（找到即停止，其余账号保持原有顺序）
+                if current_index >= 0:
+                    if current_index > 0:
+                        old_first = accounts[0].get('email', '')
+                        accounts.insert(0, accounts.pop(current_index))
+                        logger.info(f"🔝 账号置顶: {old_first} → {self.current_login_email}")
                     
                     # ⭐ 检查是否需要重建（当前账号不在第一位时需要重建）
                     if self.account_cards and len(accounts) > 0:
                         # 直接检查排序后的第一个账号是否是当前登录账号
                         first_account_email = accounts[0].get('email')
                         
-                        # 获取当前显示的第一个卡片（通过布局顺序）
-                        current_first_card_email = None
-                        if hasattr(self, 'account_list_layout') and self.account_list_layout.count() > 0:
-                            first_widget = self.account_list_layout.itemAt(0).widget()
-                            if hasattr(first_widget, 'account_data'):
-                                current_first_card_email = first_widget.account_data.get('email')
-                        
                         # 如果排序后的第一个账号与当前显示的第一个卡片不同，需要重建
-                        if (current_first_card_email and 
-                            current_first_card_email != first_account_email):
+                        if first_account_email != self._first_card_email:
                             need_rebuild = True
-                            logger.info(f"🔄 需要重新排序: {current_first_card_email} → {first_account_email}")
+                            logger.info(f"🔄 需要重新排序: {self._first_card_email} → {first_account_email}")
             
             # ⭐ 防闪烁核心逻辑：只在需要时重建，否则只更新数据
             if need_rebuild:
-                # 需要重建：清空现有卡片
+                # 需要重建：按新结果增量调整卡片（保留仍在列表中的卡片，只增删差异部分）
                 logger.info("🔄 重建卡片列表")
                 
-                # ⭐ 冻结布局（防止中间状态触发重排）
-                if hasattr(self, 'account_list_layout'):
-                    self.account_list_layout.freeze()
-                
-                for card in self.account_cards.values():
-                    card.deleteLater()
-                self.account_cards.clear()
-                
-                # 创建新卡片
-                for i, account in enumerate(accounts):
-                    card = AccountCard(account, enable_animation=False)
-                    
-                    # 连接信号
-                    card.switch_clicked.connect(self._on_switch_account)
-                    card.detail_clicked.connect(lambda aid=account['id']: self._on_refresh_detail(aid))  # ⭐ 详情按钮触发详细刷新
-                    card.delete_clicked.connect(self._on_delete_account)
-                    card.refresh_clicked.connect(self._on_refresh_account)
-                    card.selection_changed.connect(self._on_card_selection_changed)
+                # ⭐ 冻结布局（防止中间状态触发重排），所有卡片调整完成后统一重排
+                with self.account_list_layout.frozen():
+                    # ⭐ 只为视口附近的账号创建卡片，其余账号在滚动到底部时再创建
+                    budget = self._card_materialize_budget()
+                    head = accounts[:budget]
+                    old_cards = self.account_cards
+                    self.account_cards = {}
                     
-                    # ⭐ 连接拖动多选信号
-                    card.drag_select_start.connect(self._on_drag_select_start)
-                    card.drag_select_move.connect(self._on_drag_select_move)
-                    card.drag_select_end.connect(self._on_drag_select_end)
+                    # 重建时清空选择（与卡片状态保持一致）
+                    self.selected_account_ids.clear()
                     
-                    # 检查是否为当前登录账号并设置高亮
-                    if self.current_login_email and account.get('email') == self.current_login_email:
-                        card.set_current(True)
-                        logger.debug(f"✨ 设置当前登录账号高亮: {account.get('email')}")
+                    # ⭐ 回收不再显示的卡片到卡片池（不销毁，后续重新绑定数据）
+                    head_ids = {acc['id'] for acc in head}
+                    for account_id, card in old_cards.items():
+                        if account_id not in head_ids:
+                            self.account_list_layout.removeWidget(card)
+                            self._set_card_visible(card, False)
+                            self._card_pool.append(card)
                     
-                    # ⭐ 读取并应用失效状态（从数据库恢复）
-                    if account.get('is_invalid') == 1:
-                        card.set_invalid(True)
-                        logger.debug(f"🔴 账号已从数据库恢复失效状态: {account.get('email')}")
+                    # ⭐ 保留的卡片只在内容变化时更新，新增的账号才创建/复用卡片
+                    ordered_cards = []
+                    for account in head:
+                        card = old_cards.get(account['id'])
+                        if card is None:
+                            card = self._add_account_card(account)
+                        else:
+                            self._reuse_account_card(card, account)
+                        ordered_cards.append(card)
                     
-                    # 添加到流式布局
-                    self.account_list_layout.addWidget(card)
-                    self.account_cards[account['id']] = card
-                
-                # ⭐ 解冻布局（所有卡片创建完成后统一重排）
-                if hasattr(self, 'account_list_layout'):
-                    self.account_list_layout.unfreeze()
-                    logger.debug("✅ 布局已解冻，准备统一重排")
+                    # 按新顺序重排布局项（不移除/重新添加控件）
+                    self.account_list_layout.reorder(ordered_cards)
+                    self._deferred_card_accounts = accounts[budget:]
+                    self._filtered_out_deferred = 0
+                    self._first_card_email = accounts[0].get('email') if accounts else None
+                    if self._deferred_card_accounts:
+                        logger.debug(f"延迟创建 {len(self._deferred_card_accounts)} 个卡片")
             else:
                 # 不需要重建：只更新现有卡片的数据（防闪烁，批量更新）
                 logger.info("🔄 只更新卡片数据（批量静默更新）")
                 
-                # ⭐ 冻结布局（防止中途触发重排）
-                if hasattr(self, 'account_list_layout'):
-                    self.account_list_layout.freeze()
-                
-                for account in accounts:
-                    account_id = account['id']
-                    if account_id in self.account_cards:
-                        card = self.account_cards[account_id]
+                # ⭐ 冻结布局（防止中途触发重排），所有卡片更新完后解冻并标记为脏
+                with self.account_list_layout.frozen():
+                    cards = self.account_cards
+                    current_email = self.current_login_email
+                    for account in accounts:
+                        card = cards.get(account['id'])
+                        if not card:
+                            continue
+                        is_current = (account.get('email') == current_email)
+                    
+                        # ⭐ 显示内容未变化：只替换数据引用（保持令牌等字段最新），跳过样式和重绘
+                        if AccountCard.content_signature(account) == card._content_sig:
+                            card.account_data = account
+                            if card.is_current != is_current:
+                                card.set_current_silent(is_current)
+                            continue
+                    
                         # ⭐ 使用静默更新（不触发重排）
                         card.update_account_data_silent(account)
                         # ⭐ 使用静默设置当前状态（不触发重排）
-                        is_current = (account.get('email') == self.current_login_email)
                         card.set_current_silent(is_current)
-                        if is_current:
-                            logger.debug(f"✨ 更新当前登录账号高亮: {account.get('email')}")
                 
-                # ⭐ 解冻布局并标记为脏（所有卡片更新完后统一重排）
-                if hasattr(self, 'account_list_layout'):
-                    self.account_list_layout.unfreeze()
-            
-            # ⭐ 重新启用界面更新（一次性重绘）
-            self.account_list_widget.setUpdatesEnabled(True)
-            self.account_list_widget.update()
+                    # 尚未创建卡片的账号也同步最新数据
+                    if self._deferred_card_accounts:
+                        latest = {acc['id']: acc for acc in accounts}
+                        self._deferred_card_accounts = [
+                            latest.get(acc['id'], acc) for acc in self._deferred_card_accounts
+                        ]
             
             # 启动瀑布流动画（完全禁用，避免任何闪烁）
             # if enable_card_animation and cards_to_animate:
             #     self._animate_cards_in(cards_to_animate)
             
-            # 更新工具栏和状态栏
-            if hasattr(self, 'toolbar'):
+            # 视口未填满时继续创建延迟的卡片
+            if self._deferred_card_accounts:
+                QTimer.singleShot(0, self._materialize_visible_cards)
+            
+            # 更新工具栏和状态栏（仍在暂停渲染期间，和卡片一起重绘）
+            if self.toolbar is not None:
                 # 计算可见账号数
-                visible_count = sum(1 for card in self.account_cards.values() if card.isVisible())
-                self.toolbar.update_counts(0, len(self.account_cards), visible_count)
+                total_count, visible_count = self._card_counts()
+                self.toolbar.update_counts(0, total_count, visible_count)
             
             self.status_bar.update_account_count(len(accounts))
             self.status_bar.update_last_refresh()
@@ -798,11 +1091,169 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             logger.error(f"刷新账号列表失败: {e}")
-            # 确保即使出错也要重新启用界面更新
+        finally:
+            # ⭐ 所有写入完成后只重新启用一次界面更新（一次性重绘，出错也会恢复）
             self.account_list_widget.setUpdatesEnabled(True)
+            self.account_list_widget.update()
+    
+    @pyqtSlot(str, object)
+    def _on_card_action(self, name: str, args: tuple):
+        """
+        账号卡片汇总信号分发
+        
+        Args:
+            name: 卡片信号名
+            args: 信号参数
+        """
+        handler = self._card_action_handlers.get(name)
+        if handler:
+            handler(*args)
+    
+    def _add_account_card(self, account: dict):
+        """为账号创建（或从卡片池复用）卡片并加入流式布局"""
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.rebind(account)
+        else:
+            card = AccountCard(account, enable_animation=False)
+            
+            # 连接汇总信号（仅首次创建时连接，复用的卡片保留原连接）
+            card.action.connect(self._on_card_action)
+        
+        # 检查是否为当前登录账号并设置高亮
+        if self.current_login_email and account.get('email') == self.current_login_email:
+            card.set_current(True)
+            logger.debug(f"✨ 设置当前登录账号高亮: {account.get('email')}")
+        
+        # ⭐ 读取并应用失效状态（从数据库恢复）
+        if account.get('is_invalid') == 1:
+            card.set_invalid(True)
+            logger.debug(f"🔴 账号已从数据库恢复失效状态: {account.get('email')}")
+        
+        # ⭐ 延迟创建的卡片同步已按 ID 记录的选中状态（全选时尚未创建的账号）
+        if account['id'] in self.selected_account_ids:
+            card.set_selected(True)
+        
+        # 添加到流式布局
+        self.account_list_layout.addWidget(card)
+        self._set_card_visible(card, True)
+        self.account_cards[account['id']] = card
+        return card
+    
+    def _reuse_account_card(self, card, account: dict):
+        """
+        重建列表时保留已有卡片，只同步变化的数据与状态
+        
+        Args:
+            card: 已有的账号卡片
+            account: 最新的账号数据
+        """
+        if card.is_selected():
+            card.set_selected(False)
+        
+        is_current = bool(self.current_login_email) and account.get('email') == self.current_login_email
+        if AccountCard.content_signature(account) == card._content_sig:
+            card.account_data = account
+        else:
+            card.update_account_data_silent(account)
+        if card.is_current != is_current:
+            card.set_current_silent(is_current)
+        
+        is_invalid = account.get('is_invalid') == 1
+        if card._is_invalid != is_invalid:
+            card.set_invalid(is_invalid)
+        
+        self._set_card_visible(card, True)
+        self.account_cards[account['id']] = card
+    
+    def _card_materialize_budget(self) -> int:
+        """根据视口大小估算需要立即创建的卡片数（可见行 + 2 行余量）"""
+        viewport = self.account_scroll_area.viewport()
+        columns = self.account_list_layout.columns_for_width(viewport.width(), CARD_WIDTH)
+        row_height = CARD_ESTIMATED_HEIGHT + max(self.account_list_layout.spacing(), 0)
+        rows = viewport.height() // row_height + 2
+        return columns * rows
+    
+    def _materialize_cards(self, count: int = None):
+        """
+        为延迟的账号创建卡片
+        
+        Args:
+            count: 创建数量（None 表示全部）
+        """
+        if not self._deferred_card_accounts:
+            return
+        
+        if count is None:
+            batch, self._deferred_card_accounts = self._deferred_card_accounts, []
+        else:
+            batch = self._deferred_card_accounts[:count]
+            self._deferred_card_accounts = self._deferred_card_accounts[count:]
+        
+        self.account_list_widget.setUpdatesEnabled(False)
+        try:
+            with self.account_list_layout.frozen():
+                for account in batch:
+                    self._add_account_card(account)
+            self.account_list_layout.invalidate()
+        finally:
+            self.account_list_widget.setUpdatesEnabled(True)
+        
+        self._drag_hit_index = None  # 新卡片加入后需重建拖动命中索引
+        logger.debug(f"创建延迟卡片 {len(batch)} 个，剩余 {len(self._deferred_card_accounts)} 个")
+    
+    def _materialize_visible_cards(self, *_):
+        """滚动接近底部（或视口未填满）时创建下一批卡片"""
+        if not self._deferred_card_accounts or self._is_closing:
+            return
+        
+        scrollbar = self.account_scroll_area.verticalScrollBar()
+        viewport_height = self.account_scroll_area.viewport().height()
+        if scrollbar.value() < scrollbar.maximum() - viewport_height:
+            return
+        
+        self._materialize_cards(self._card_materialize_budget())
+        
+        # 布局完成后再检查一次，直到视口被填满
+        if self._deferred_card_accounts:
+            QTimer.singleShot(0, self._materialize_visible_cards)
+    
+    def _set_card_visible(self, card, visible: bool) -> bool:
+        """
+        设置卡片显隐并维护可见账号 ID 集合
+        
+        Args:
+            card: 账号卡片
+            visible: 是否显示
+            
+        Returns:
+            bool: 显隐状态是否发生变化
+        """
+        changed = card.isHidden() == visible
+        if changed:
+            if visible:
+                self._visible_ids.add(card.account_id)
+            else:
+                self._visible_ids.discard(card.account_id)
+            card.setVisible(visible)
+        return changed
+    
+    def _card_counts(self):
+        """
+        返回 (总账号数, 可见账号数)，包含尚未创建卡片的账号
+        
+        Returns:
+            tuple: (total, visible)
+        """
+        deferred = len(self._deferred_card_accounts)
+        total = len(self.account_cards) + deferred + self._filtered_out_deferred
+        return total, len(self._visible_ids) + deferred
     
     def _on_switch_account(self, account_id: int):
         """切换账号"""
+        if self._switch_in_progress:
+            self.status_bar.show_message("⏳ 正在切换账号，请等待当前切换完成", 3000)
+            return
         try:
             account = self.storage.get_account_by_id(account_id)
             if not account:
@@ -856,109 +1307,200 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "错误", f"切换失败:\n{e}")
     
     def _execute_switch(self, account_id: int, account: Dict[str, Any], options: Dict[str, Any]):
-        """执行账号切换（快速版，3秒完成）"""
+        """
+        执行账号切换（快速版，3秒完成）
+        
+        切换按步骤推进：关闭 → 写入 → 更新记录 → 启动 → 完成。
+        关闭/写入/启动等耗时操作提交到线程池，完成后通过 switch_step_done_signal
+        回到主线程继续下一步，界面在整个过程中保持响应。
+        切换期间 _switch_in_progress 为 True，任一步骤结束（完成、取消、失败）时清除。
+        """
+        if self._switch_in_progress:
+            logger.warning("已有账号切换正在进行，忽略新的切换请求")
+            return
+        self._switch_in_progress = True
         try:
-            import time
-            start_time = time.time()
-            
-            logger.info("="*60)
-            logger.info(f"开始切换账号: {account['email']}")
-            logger.info(f"机器码模式: {options.get('machine_id_mode', 'generate_new')}")
-            logger.info(f"自动关闭: {options.get('auto_kill', False)}")
-            logger.info(f"自动重启: {options.get('auto_restart', False)}")
-            logger.info("="*60)
+            # 切换参数合并为一条日志（只做一次级别判断和格式化）
+            logger.info(
+                f"{_SEP_60}\n"
+                f"开始切换账号: {account['email']}\n"
+                f"机器码模式: {options.get('machine_id_mode', 'generate_new')}\n"
+                f"自动关闭: {options.get('auto_kill', False)}\n"
+                f"自动重启: {options.get('auto_restart', False)}\n"
+                f"{_SEP_60}"
+            )
             
-            auto_kill = options.get('auto_kill', False)
-            auto_restart = options.get('auto_restart', False)
+            context = {
+                'account_id': account_id,
+                'account': account,
+                'options': options,
+                'start_time': time.time(),
+            }
             
             # 步骤 1：关闭 Cursor（如果勾选且正在运行）
-            if auto_kill:
+            if options.get('auto_kill', False):
                 if self.switcher.check_cursor_running():
                     self.status_bar.show_message("【1/5】关闭 Cursor...", 0)
+                    self._submit_switch_step('close', self.switcher.close_cursor_gracefully, context)
+                    return
+                logger.info("【1/5】Cursor 未运行，跳过关闭步骤")
+            
+            self._switch_write_config(context)
+                
+        except Exception as e:
+            self._switch_in_progress = False
+            logger.error(f"执行切换失败: {e}", exc_info=True)
+            QMessageBox.critical(self, "错误", f"切换失败:\n{e}")
+            self.status_bar.show_message("切换失败", 3000)
+    
+    def _submit_switch_step(self, step: str, func, context: dict):
+        """
+        在线程池中执行切换步骤，完成后发射 switch_step_done_signal 回到主线程
+        
+        Args:
+            step: 步骤名（close/write/start）
+            func: 要执行的函数（返回是否成功）
+            context: 切换上下文
+        """
+        def step_callback(task_id, result):
+            # 回调在工作线程中执行，通过信号切回主线程
+            self.switch_step_done_signal.emit(step, bool(result), context)
+        
+        self.thread_manager.submit_task(
+            task_id=f"switch_{step}_{context['account_id']}_{next(self._task_seq)}",
+            func=func,
+            callback=step_callback
+        )
+    
+    @pyqtSlot(str, bool, object)
+    def _on_switch_step_done(self, step: str, success: bool, context: dict):
+        """
+        切换步骤完成（主线程），推进到下一步
+        
+        Args:
+            step: 完成的步骤名
+            success: 是否成功
+            context: 切换上下文
+        """
+        try:
+            if step == 'close':
+                if not success:
+                    reply = QMessageBox.warning(
+                        self,
+                        "关闭失败",
+                        "无法关闭 Cursor 进程\n\n"
+                        "请手动关闭 Cursor 后点击「重试」\n"
+                        "或点击「取消」放弃切换",
+                        QMessageBox.StandardButton.Retry | QMessageBox.StandardButton.Cancel
+                    )
                     
-                    close_success = self.switcher.close_cursor_gracefully()
-                    
-                    if not close_success:
-                        reply = QMessageBox.warning(
-                            self,
-                            "关闭失败",
-                            "无法关闭 Cursor 进程\n\n"
-                            "请手动关闭 Cursor 后点击「重试」\n"
-                            "或点击「取消」放弃切换",
-                            QMessageBox.StandardButton.Retry | QMessageBox.StandardButton.Cancel
-                        )
-                        
-                        if reply == QMessageBox.StandardButton.Cancel:
-                            logger.info("用户取消切换")
-                            self.status_bar.show_message("切换已取消", 3000)
+                    if reply == QMessageBox.StandardButton.Cancel:
+                        self._switch_in_progress = False
+                        logger.info("用户取消切换")
+                        self.status_bar.show_message("切换已取消", 3000)
+                        return
+                    elif reply == QMessageBox.StandardButton.Retry:
+                        if self.switcher.check_cursor_running():
+                            self._switch_in_progress = False
+                            QMessageBox.critical(self, "错误", "Cursor 仍在运行，切换取消")
+                            self.status_bar.show_message("切换失败", 3000)
                             return
-                        elif reply == QMessageBox.StandardButton.Retry:
-                            if self.switcher.check_cursor_running():
-                                QMessageBox.critical(self, "错误", "Cursor 仍在运行，切换取消")
-                                self.status_bar.show_message("切换失败", 3000)
-                                return
-                else:
-                    logger.info("【1/5】Cursor 未运行，跳过关闭步骤")
-            
-            # 步骤 2：写入账号配置
-            logger.info("【2/5】正在写入账号配置...")
-            self.status_bar.show_message("【2/5】写入配置...", 0)
-            
-            success = self.switcher.switch_account(
-                account,
+                self._switch_write_config(context)
+            elif step == 'write':
+                self._on_switch_config_written(success, context)
+            elif step == 'start':
+                self._finish_switch(context, success)
+        except Exception as e:
+            self._switch_in_progress = False
+            logger.error(f"执行切换失败: {e}", exc_info=True)
+            QMessageBox.critical(self, "错误", f"切换失败:\n{e}")
+            self.status_bar.show_message("切换失败", 3000)
+    
+    def _switch_write_config(self, context: dict):
+        """切换步骤 2：在后台写入账号配置"""
+        logger.info("【2/5】正在写入账号配置...")
+        self.status_bar.show_message("【2/5】写入配置...", 0)
+        
+        options = context['options']
+        self._submit_switch_step(
+            'write',
+            lambda: self.switcher.switch_account(
+                context['account'],
                 machine_id_mode=options.get('machine_id_mode', 'generate_new'),
                 reset_cursor_config=options.get('reset_cursor_config', False)
+            ),
+            context
+        )
+    
+    def _on_switch_config_written(self, success: bool, context: dict):
+        """切换步骤 3：配置写入后更新使用记录，并安排启动 Cursor"""
+        if not success:
+            self._switch_in_progress = False
+            logger.error("写入配置失败")
+            QMessageBox.critical(
+                self,
+                "切换失败",
+                "写入配置文件失败\n\n"
+                "可能原因:\n"
+                "• 配置文件被锁定\n"
+                "• 磁盘空间不足\n"
+                "• 权限不足\n\n"
+                "请查看日志了解详情"
             )
+            self.status_bar.show_message("切换失败", 3000)
+            return
+        
+        logger.info("  ✅ 配置写入成功")
+        
+        # 步骤 3：更新最后使用时间和当前登录邮箱
+        account = context['account']
+        logger.info("【3/5】更新账号使用记录...")
+        self.storage.update_last_used(context['account_id'])
+        # ⭐ 登录账号已变化，清除启动检测缓存
+        self.storage.set_cached_detection_result(None, 0.0)
+        
+        # 更新当前登录邮箱
+        self.current_login_email = account.get('email')
+        logger.info(f"  ✅ 记录已更新，当前登录: {self.current_login_email}")
+        
+        # 步骤 4：重启 Cursor（如果勾选）
+        if context['options'].get('auto_restart', False):
+            logger.info("【4/5】正在启动 Cursor...")
+            self.status_bar.show_message("【4/5】启动 Cursor...", 0)
+            # ⭐ 短暂等待配置写入：用定时器继续后续步骤，不阻塞界面线程
+            QTimer.singleShot(500, lambda: self._submit_switch_step('start', self.switcher.start_cursor, context))
+        else:
+            logger.info("【4/5】跳过自动重启")
+            self._finish_switch(context, False)
+    
+    def _finish_switch(self, context: dict, restart_success: bool):
+        """
+        完成账号切换（步骤 5：更新界面）
+        
+        Args:
+            context: 切换上下文
+            restart_success: Cursor 是否已自动重启
+        """
+        # 切换步骤已全部结束，允许发起新的切换
+        self._switch_in_progress = False
+        try:
+            account_id = context['account_id']
+            account = context['account']
+            auto_restart = context['options'].get('auto_restart', False)
+            start_time = context['start_time']
             
-            if not success:
-                logger.error("写入配置失败")
-                QMessageBox.critical(
-                    self,
-                    "切换失败",
-                    "写入配置文件失败\n\n"
-                    "可能原因:\n"
-                    "• 配置文件被锁定\n"
-                    "• 磁盘空间不足\n"
-                    "• 权限不足\n\n"
-                    "请查看日志了解详情"
-                )
-                self.status_bar.show_message("切换失败", 3000)
-                return
-            
-            logger.info("  ✅ 配置写入成功")
-            
-            # 步骤 3：更新最后使用时间和当前登录邮箱
-            logger.info("【3/5】更新账号使用记录...")
-            self.storage.update_last_used(account_id)
-            
-            # 更新当前登录邮箱
-            self.current_login_email = account.get('email')
-            logger.info(f"  ✅ 记录已更新，当前登录: {self.current_login_email}")
-            
-            # 步骤 4：重启 Cursor（如果勾选）
             if auto_restart:
-                logger.info("【4/5】正在启动 Cursor...")
-                self.status_bar.show_message("【4/5】启动 Cursor...", 0)
-                
-                time.sleep(0.5)  # 短暂等待配置写入
-                
-                restart_success = self.switcher.start_cursor()
-                
                 if restart_success:
                     logger.info("  ✅ Cursor 已启动")
                 else:
                     logger.warning("  ⚠️  自动启动失败")
-            else:
-                logger.info("【4/5】跳过自动重启")
             
             # 步骤 5：完成
             elapsed = time.time() - start_time
-            logger.info("【5/5】✅ 切换完成！")
-            logger.info(f"总耗时: {elapsed:.1f}秒")
-            logger.info("="*60)
+            logger.info(f"【5/5】✅ 切换完成！\n总耗时: {elapsed:.1f}秒\n{_SEP_60}")
             
             # ⭐ 更新右侧当前账号面板并刷新最新数据
-            if hasattr(self, 'current_panel') and self.current_panel:
+            if self.current_panel is not None:
                 # 先用数据库数据更新（立即显示基本信息）
                 self.current_panel.update_account_info(account)
                 
@@ -967,24 +1509,25 @@ class MainWindow(QMainWindow):
                 usage = account.get('usage_percent', 0)
                 days = account.get('days_remaining', 0)
                 
-                self.current_panel.log("="*50)
-                self.current_panel.log(f"✅ 账号切换成功")
-                self.current_panel.log(f"📧 新账号: {account['email']}")
-                self.current_panel.log(f"🎫 套餐: {plan} | 使用率: {usage}% | 剩余: {days}天")
-                self.current_panel.log(f"⏱️ 切换耗时: {elapsed:.1f}秒")
-                if auto_restart and restart_success:
-                    self.current_panel.log("✅ Cursor 已自动重启")
-                elif auto_restart:
-                    self.current_panel.log("⚠️ 请手动启动 Cursor")
-                else:
-                    self.current_panel.log("📌 请手动重启 Cursor 以应用更改")
-                self.current_panel.log("="*50)
-                
-                # ⭐ 立即刷新账号获取最新使用情况
-                self.current_panel.log("🔄 正在获取最新使用情况...")
+                # ⭐ 连续多行日志合并为一次重绘
+                with self.current_panel.log_batch():
+                    self.current_panel.log(_SEP_50)
+                    self.current_panel.log(f"✅ 账号切换成功")
+                    self.current_panel.log(f"📧 新账号: {account['email']}")
+                    self.current_panel.log(f"🎫 套餐: {plan} | 使用率: {usage}% | 剩余: {days}天")
+                    self.current_panel.log(f"⏱️ 切换耗时: {elapsed:.1f}秒")
+                    if auto_restart and restart_success:
+                        self.current_panel.log("✅ Cursor 已自动重启")
+                    elif auto_restart:
+                        self.current_panel.log("⚠️ 请手动启动 Cursor")
+                    else:
+                        self.current_panel.log("📌 请手动重启 Cursor 以应用更改")
+                    self.current_panel.log(_SEP_50)
+                    
+                    # ⭐ 立即刷新账号获取最新使用情况
+                    self.current_panel.log("🔄 正在获取最新使用情况...")
                 
                 # 延迟1秒后刷新（等待Cursor重启）
-                from PyQt6.QtCore import QTimer
                 QTimer.singleShot(1000, lambda: self._refresh_switched_account(account_id))
             
             # 刷新账号列表以更新高亮状态（不需要重建，只更新数据）
@@ -1010,7 +1553,7 @@ class MainWindow(QMainWindow):
                 )
                 
         except Exception as e:
-            logger.error(f"执行切换失败: {e}", exc_info=True)
+            logger.error(f"完成切换失败: {e}", exc_info=True)
             QMessageBox.critical(self, "错误", f"切换失败:\n{e}")
             self.status_bar.show_message("切换失败", 3000)
     
@@ -1024,7 +1567,7 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             logger.error(f"刷新切换账号失败: {e}")
-            if hasattr(self, 'current_panel') and self.current_panel:
+            if self.current_panel is not None:
                 self.current_panel.log(f"⚠️ 刷新使用情况失败: {str(e)}")
     
     def _on_show_detail(self, account_id: int):
@@ -1069,8 +1612,9 @@ class MainWindow(QMainWindow):
         if self.storage.delete_account(account_id):
             card = self.account_cards.pop(account_id, None)
             if card:
+                self._visible_ids.discard(account_id)
                 card.deleteLater()
-            self.status_bar.update_account_count(len(self.account_cards))
+            self.status_bar.update_account_count(self._card_counts()[0])
             self.status_bar.show_message("✅ 账号已删除", 3000)
     
     def _on_refresh_account(self, account_id: int):
@@ -1114,7 +1658,8 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"打开详情对话框失败: {e}")
     
-    def _on_refresh_account_with_callback(self, account_id: int, callback=None, is_batch: bool = False):
+    def _on_refresh_account_with_callback(self, account_id: int, callback=None, is_batch: bool = False,
+                                          account: Optional[dict] = None, pending_tasks: Optional[list] = None):
         """
         刷新账号（带回调）
         
@@ -1122,9 +1667,12 @@ class MainWindow(QMainWindow):
             account_id: 账号ID
             callback: 完成回调函数
             is_batch: 是否为批量刷新（批量时使用快速模式）
+            account: 调用方已读取的账号数据（为 None 时从数据库读取）
+            pending_tasks: 不为 None 时只把任务加入该列表，由调用方统一批量提交
         """
         try:
-            account = self.storage.get_account_by_id(account_id)
+            if account is None:
+                account = self.storage.get_account_by_id(account_id)
             if not account:
                 if callback:
                     callback(account_id, False)
@@ -1154,24 +1702,7 @@ class MainWindow(QMainWindow):
             
             # ⚠️ 从 AccessToken 临时构造格式用于 API 调用
             # 不使用数据库中的 session_token（如果有的话也忽略）
-            import base64, json
-            try:
-                parts = access_token.split('.')
-                if len(parts) >= 2:
-                    payload = parts[1]
-                    padding = len(payload) % 4
-                    if padding:
-                        payload += '=' * (4 - padding)
-                    decoded = base64.urlsafe_b64decode(payload)
-                    token_data = json.loads(decoded)
-                    user_id = token_data.get('sub', '').replace('auth0|', '')
-                    
-                    # 构造临时格式（仅用于 API 调用）
-                    temp_session_format = f"{user_id}::{access_token}"
-                else:
-                    temp_session_format = None
-            except:
-                temp_session_format = None
+            temp_session_format = _build_temp_session_format(access_token)
             
             card = self.account_cards.get(account_id)
             if card:
@@ -1182,15 +1713,10 @@ class MainWindow(QMainWindow):
             if not callback:  # 只有非批量刷新才输出到面板
                 self.current_panel.log(f"  ↳ 调用 API...")
             
-            # 保存回调函数
-            if callback:
-                self.refresh_callbacks[account_id] = callback
-            
             # 使用线程管理器执行刷新任务
             def refresh_task():
                 """刷新任务函数（支持增量刷新）"""
                 try:
-                    from core.cursor_api import CursorServerError
                     api = get_api_client()
                     
                     # 优先使用 SessionToken 调用 API
@@ -1200,10 +1726,9 @@ class MainWindow(QMainWindow):
                         logger.error(f"没有可用的 Token (account_id={account_id})")
                         return {}
                     
-                    # ⭐ 获取数据库中的增量刷新信息
-                    account_data = self.storage.get_account_by_id(account_id)
-                    last_refresh_time = account_data.get('last_refresh_time') if account_data else None
-                    accumulated_cost = account_data.get('accumulated_cost', 0) if account_data else 0
+                    # ⭐ 增量刷新信息直接取自发起刷新时读取的账号数据（不再重复查询数据库）
+                    last_refresh_time = account.get('last_refresh_time')
+                    accumulated_cost = account.get('accumulated_cost', 0)
                     
                     # ⭐ 调用API获取账号详情（使用增量刷新）
                     if last_refresh_time:
@@ -1229,25 +1754,33 @@ class MainWindow(QMainWindow):
                 except CursorServerError as e:
                     # ⭐ Cursor服务器500错误 - 停止批量刷新
                     logger.error(f"🚨 Cursor服务器错误: {e}")
-                    # 显示服务器错误提示
-                    self._show_server_error_warning()
-                    # 停止批量刷新
-                    if hasattr(self, 'batch_refresh_queue'):
-                        self.batch_refresh_queue.clear()
+                    # 显示服务器错误提示并停止批量刷新（界面和定时器操作通过信号交给主线程）
+                    self.server_error_signal.emit()
                     return {'_server_error': True}
                 except Exception as e:
                     logger.error(f"刷新任务失败 (account_id={account_id}): {e}")
                     raise
             
             # 提交任务到线程池
-            task_id = f"refresh_account_{account_id}_{int(time.time())}"
+            task_id = f"refresh_account_{account_id}_{next(self._task_seq)}"
             logger.info(f"📤 提交刷新任务到线程池: task_id={task_id}, is_batch={is_batch}")
             
+            # ⭐ 刷新上下文随结果一起传回主线程（不经过共享状态，完成时也无需再查询账号）
+            context = {
+                'account': account,
+                'callback': callback,
+                'is_batch': is_batch,
+            }
+            
             # ⭐ 定义回调包装器，添加日志
             def task_callback(tid, result):
                 logger.info(f"📥 线程池回调触发: task_id={tid}, account_id={account_id}, has_result={bool(result)}")
-                # 直接调用，但确保回调在主线程执行
-                self._on_refresh_finished_wrapper(account_id, result or {})
+                # 直接调用，但确保回调在主线程执行（回调随结果一起传递，不经过共享状态）
+                self._on_refresh_finished_wrapper(account_id, result or {}, context)
+            
+            if pending_tasks is not None:
+                pending_tasks.append((task_id, refresh_task, task_callback))
+                return
             
             self.thread_manager.submit_task(
                 task_id=task_id,
@@ -1265,142 +1798,140 @@ class MainWindow(QMainWindow):
             if callback:
                 callback(account_id, False)
     
-    def _on_refresh_finished_wrapper(self, account_id: int, result: dict):
+    def _on_refresh_finished_wrapper(self, account_id: int, result: dict, context: dict):
         """刷新完成的包装器（确保在主线程执行）"""
         # 发射信号，Qt会自动确保在主线程中处理
-        self.refresh_finished_signal.emit(account_id, result)
+        self.refresh_finished_signal.emit(account_id, result, context)
     
-    def _on_refresh_finished(self, account_id: int, result: dict):
-        """刷新完成（优化版：增强错误处理和线程清理）"""
-        logger.info(f"=" * 50)
-        logger.info(f"🎯 _on_refresh_finished 被调用: account_id={account_id}, has_result={bool(result)}")
-        logger.info(f"=" * 50)
+    @pyqtSlot(int, dict, object)
+    def _on_refresh_finished(self, account_id: int, result: dict, context: Optional[dict] = None):
+        """
+        刷新完成（优化版：增强错误处理和线程清理）
+        
+        Args:
+            account_id: 账号 ID
+            result: 刷新结果（空字典表示失败）
+            context: 刷新上下文
+                - account: 发起刷新时读取的账号数据
+                - callback: 完成回调（批量刷新、详情对话框），None 表示普通单个刷新
+                - is_batch: 是否为批量刷新（批量时数据库写入先缓冲再合并提交）
+        """
+        context = context or {}
+        callback = context.get('callback')
+        is_batch = context.get('is_batch', False)
+        logger.info(f"{_SEP_50}\n🎯 _on_refresh_finished 被调用: account_id={account_id}, has_result={bool(result)}\n{_SEP_50}")
         try:
             # ⭐ 不再需要清理线程（现在使用线程池）
             # 线程池会自动管理线程生命周期
             
+            # ⭐ 界面更新都是普通方法调用，不再逐个包 try/except（异常由最外层统一处理）
             card = self.account_cards.get(account_id)
             if card:
-                try:
-                    card.set_loading(False)
-                except:
-                    pass
+                card.set_loading(False)
             
-            # 获取账号信息用于日志
-            account = self.storage.get_account_by_id(account_id)
+            # 获取账号信息用于日志（优先使用发起刷新时已读取的数据）
+            account = context.get('account') or self.storage.get_account_by_id(account_id)
             email = account.get('email', 'unknown') if account else 'unknown'
+            # 刷新前的失效标记（状态未变化时不再重复写入）
+            prev_invalid = account.get('is_invalid') if account else None
             
             # 检查是否为批量刷新
-            has_callback = account_id in self.refresh_callbacks
+            has_callback = callback is not None
+            
+            # ⭐ 界面输出只在非批量刷新时进行，入口处一次性绑定（None 表示不输出）
+            panel_log = None
+            show_message = None
+            if not has_callback:
+                if self.current_panel is not None:
+                    panel_log = self.current_panel.log
+                if self.status_bar is not None:
+                    show_message = self.status_bar.show_message
             
             # ⭐ 检查是否是服务器错误
             if result and result.get('_server_error'):
                 logger.error(f"❌ 服务器错误，停止刷新: {email}")
                 # 调用回调（通知批量刷新停止）
-                callback = self.refresh_callbacks.pop(account_id, None)
                 if callback:
-                    callback(account_id, False)
+                    pending_callback, callback = callback, None
+                    pending_callback(account_id, False)
                 return
             
             if result:
                 # ⭐ 日志：刷新成功
-                plan = result.get('membership_type', 'free').upper()
-                usage = result.get('usage_percent', 0)
-                days = result.get('days_remaining', 0)
-                
                 logger.info(f"✅ 刷新成功: {email}")
-                logger.info(f"  ↳ 套餐: {plan} | 使用率: {usage}% | 剩余: {days}天")
                 
-                # ⭐ 输出到界面日志（仅非批量刷新）
-                if not has_callback:
+                # ⭐ 套餐/使用率明细只在非批量刷新时格式化（批量刷新不输出明细）
+                if not is_batch:
+                    plan = result.get('membership_type', 'free').upper()
+                    usage = result.get('usage_percent', 0)
+                    days = result.get('days_remaining', 0)
+                    logger.info(f"  ↳ 套餐: {plan} | 使用率: {usage}% | 剩余: {days}天")
+                    
+                    # ⭐ 输出到界面日志（仅非批量刷新）
+                    if panel_log:
+                        panel_log(f"✅ 刷新成功: {email}")
+                        panel_log(f"  ↳ {plan} | {usage}% | {days}天")
+                
+                # 更新数据库（批量刷新时先缓冲，合并写入；状态与有效标记一起写入）
+                if is_batch:
+                    self._queue_status_update(account_id, result)
+                else:
                     try:
-                        if hasattr(self, 'current_panel') and self.current_panel:
-                            self.current_panel.log(f"✅ 刷新成功: {email}")
-                            self.current_panel.log(f"  ↳ {plan} | {usage}% | {days}天")
+                        # ⭐ 状态与有效标记在同一条 UPDATE 中写入（原本就有效时不带失效标记）
+                        extra_fields = {'is_invalid': 0} if prev_invalid != 0 else None
+                        self.storage.update_account_status(account_id, result, extra_fields=extra_fields)
+                        logger.debug(f"💾 状态及有效标记已保存到数据库: {email}")
                     except Exception as e:
-                        logger.debug(f"输出日志失败: {e}")
-                
-                # 更新数据库
-                try:
-                    self.storage.update_account_status(account_id, result)
-                except Exception as e:
-                    logger.error(f"更新数据库失败: {e}")
+                        logger.error(f"更新数据库失败: {e}")
                 
                 # ⭐ 清除失效标记（刷新成功后）
-                try:
-                    if hasattr(self, 'account_cards') and account_id in self.account_cards:
-                        card = self.account_cards[account_id]
-                        card.set_invalid(False)
-                except Exception as e:
-                    logger.debug(f"清除失效标记失败: {e}")
-                
-                # ⭐ 持久化保存有效状态到数据库
-                try:
-                    self.storage.update_account(account_id, {'is_invalid': 0})
-                    logger.debug(f"💾 有效状态已保存到数据库: {email}")
-                except Exception as e:
-                    logger.error(f"保存有效状态失败: {e}")
-                
-                # ⭐ 关键改动：收集更新而非立即更新
-                account = self.storage.get_account_by_id(account_id)
-                if account:
-                    self._collect_card_update(account_id, account)
+                if card:
+                    card.set_invalid(False)
                 
-                # ⭐ 如果刷新的是当前登录账号，同步更新右侧面板
-                if email == self.current_login_email and account:
-                    def update_panel(acc=account):
-                        try:
-                            self._safe_update_current_panel(acc)
-                        except:
-                            pass
-                    try:
-                        QTimer.singleShot(150, update_panel)
-                    except:
-                        pass
+                # ⭐ 关键改动：只登记待更新ID，数据在批量刷新时一次性读取
+                # （当前登录账号的右侧面板也在批量刷新时同步）
+                # 批量刷新期间只记录ID，全部完成后统一更新一次卡片
+                if is_batch:
+                    self._batch_completed_ids.append(account_id)
+                else:
+                    self._collect_card_update(account_id)
                 
-                # 更新状态栏（仅非批量刷新）
-                if not has_callback:
-                    try:
-                        if hasattr(self, 'status_bar') and self.status_bar:
-                            self.status_bar.show_message(f"✅ {email} 刷新成功 ({plan}, {usage}%)", 3000)
-                    except Exception as e:
-                        logger.debug(f"更新状态栏失败: {e}")
+                # 更新状态栏（仅非批量刷新，show_message 存在时 plan/usage 已计算）
+                if show_message:
+                    show_message(f"✅ {email} 刷新成功 ({plan}, {usage}%)", 3000)
             else:
                 # ⭐ 日志：刷新失败
                 logger.warning(f"❌ 刷新失败: {email} - API 返回空数据")
                 
                 # ⭐ 标记账号卡片为失效（显示大红×）
-                try:
-                    if hasattr(self, 'account_cards') and account_id in self.account_cards:
-                        card = self.account_cards[account_id]
-                        card.set_invalid(True)
-                        logger.info(f"🔴 账号卡片已标记为失效: {email}")
-                except Exception as e:
-                    logger.error(f"标记失效卡片失败: {e}")
-                
-                # ⭐ 持久化保存失效状态到数据库
-                try:
-                    self.storage.update_account(account_id, {'is_invalid': 1})
-                    logger.info(f"💾 失效状态已保存到数据库: {email}")
-                except Exception as e:
-                    logger.error(f"保存失效状态失败: {e}")
-                
-                if not has_callback:
+                if card:
+                    card.set_invalid(True)
+                    logger.info(f"🔴 账号卡片已标记为失效: {email}")
+                
+                # ⭐ 持久化保存失效状态到数据库（已是失效状态时跳过写入）
+                if prev_invalid == 1:
+                    logger.debug(f"失效状态未变化，跳过写入: {email}")
+                elif is_batch:
+                    self._queue_status_update(account_id, None)
+                else:
                     try:
-                        if hasattr(self, 'current_panel') and self.current_panel:
-                            self.current_panel.log(f"❌ 刷新失败: {email} (可能已被删除)")
-                        if hasattr(self, 'status_bar') and self.status_bar:
-                            self.status_bar.show_message(f"❌ {email} 刷新失败 (可能已被删除)", 5000)
+                        self.storage.update_account(account_id, {'is_invalid': 1})
+                        logger.info(f"💾 失效状态已保存到数据库: {email}")
                     except Exception as e:
-                        logger.debug(f"输出失败信息失败: {e}")
+                        logger.error(f"保存失效状态失败: {e}")
+                
+                if panel_log:
+                    panel_log(f"❌ 刷新失败: {email} (可能已被删除)")
+                if show_message:
+                    show_message(f"❌ {email} 刷新失败 (可能已被删除)", 5000)
             
-            # ⭐ 调用回调函数（用于批量刷新）
-            callback = self.refresh_callbacks.pop(account_id, None)
+            # ⭐ 调用回调函数（用于批量刷新；调用后置空，避免异常路径重复调用）
             if callback:
+                pending_callback, callback = callback, None
                 try:
                     success = bool(result)  # 有结果就是成功
                     logger.info(f"🔔 准备调用批量刷新回调: account_id={account_id}, success={success}")
-                    callback(account_id, success)
+                    pending_callback(account_id, success)
                     logger.info(f"✅ 批量刷新回调已执行: account_id={account_id}")
                 except Exception as e:
                     logger.error(f"回调函数执行失败: {e}", exc_info=True)
@@ -1410,15 +1941,11 @@ class MainWindow(QMainWindow):
                 
         except Exception as e:
             logger.error(f"❌ 处理刷新结果失败: {e}", exc_info=True)
-            try:
-                if hasattr(self, 'status_bar') and self.status_bar:
-                    self.status_bar.show_message(f"❌ 刷新失败", 3000)
-            except:
-                pass
+            if self.status_bar is not None:
+                self.status_bar.show_message(f"❌ 刷新失败", 3000)
             
             # 即使出错也要调用回调
             try:
-                callback = self.refresh_callbacks.pop(account_id, None)
                 if callback:
                     callback(account_id, False)
             except Exception as e2:
@@ -1496,9 +2023,6 @@ class MainWindow(QMainWindow):
         """事件过滤器，拦截标签页切换"""
         try:
             # 检查是否是 QTabWidget 且是鼠标释放事件
-            from PyQt6.QtCore import QEvent
-            from PyQt6.QtWidgets import QTabWidget
-            
             if isinstance(obj, QTabWidget) and event.type() == QEvent.Type.MouseButtonRelease:
                 # 获取点击的标签索引
                 tab_bar = obj.tabBar()
@@ -1530,6 +2054,9 @@ class MainWindow(QMainWindow):
     def _on_tab_changed_backup(self, index):
         """标签页切换后的备用检查（双重保护）"""
         try:
+            # ⭐ 延迟标签页首次打开时创建真实面板
+            self._materialize_tab(index)
+            
             # 如果索引不同，说明事件过滤器没有成功拦截
             if index != self.current_tab_index:
                 # 再次检查是否有未保存的修改
@@ -1574,6 +2101,7 @@ class MainWindow(QMainWindow):
             logger.error(f"一键注册功能错误: {e}")
             self.current_panel.log(f"错误: {e}")
     
+    @pyqtSlot(int)
     def _on_registration_completed(self, success_count: int):
         """
         注册完成回调
@@ -1587,16 +2115,21 @@ class MainWindow(QMainWindow):
         # 显示提示
         self.status_bar.show_message(f"✅ 成功注册 {success_count} 个账号", 5000)
     
+    @pyqtSlot()
     def _show_server_error_warning(self):
-        """显示Cursor服务器错误警告"""
+        """显示Cursor服务器错误警告（主线程执行）"""
         try:
             # 显示工具栏中的警告标签
-            if hasattr(self, 'server_error_label'):
+            if self.server_error_label is not None:
                 self.server_error_label.setVisible(True)
                 logger.info("🚨 已显示服务器错误警告")
                 
+            # 停止批量刷新（定时器只能在所属的主线程停止；先丢弃尚未执行的进度更新，避免覆盖错误提示）
+            self.batch_refresh_queue.clear()
+            self._batch_ui_timer.stop()
+            
             # 关闭批量刷新对话框
-            if hasattr(self, 'batch_refresh_dialog') and self.batch_refresh_dialog:
+            if self.batch_refresh_dialog is not None:
                 try:
                     self.batch_refresh_dialog.update_progress(
                         self.batch_refresh_current,
@@ -1607,83 +2140,61 @@ class MainWindow(QMainWindow):
                 except:
                     pass
             
-            # 显示消息框
-            QTimer.singleShot(100, lambda: QMessageBox.warning(
-                self,
-                "🚨 Cursor服务器错误",
-                "检测到 Cursor API 返回500错误\n\n"
-                "这是Cursor服务器的问题，不是代码问题。\n\n"
-                "建议操作：\n"
-                "1. 等待5-10分钟\n"
-                "2. 或重新登录Cursor编辑器\n"
-                "3. 然后重启程序\n\n"
-                "批量刷新已自动停止。"
-            ))
+            # 显示消息框（复用同一个提示框；已显示时不再重复弹出）
+            if not self._server_error_dialog.isVisible():
+                QTimer.singleShot(100, self._server_error_dialog.show)
         except Exception as e:
             logger.error(f"显示服务器错误警告失败: {e}")
     
     def _on_create_fingerprint_browser(self):
-        """生成指纹浏览器（简化版，只生成不访问）"""
-        try:
-            from core.browser_manager import BrowserManager
-            from core.machine_id_generator import generate_machine_info
-            import tempfile
-            
-            self.current_panel.log("=" * 60)
+        """生成指纹浏览器（简化版，只生成不访问；在后台线程执行）"""
+        with self.current_panel.log_batch():
+            self.current_panel.log(_SEP_60)
             self.current_panel.log("🖐️ 生成指纹浏览器...")
-            self.current_panel.log("=" * 60)
-            
-            # 1. 生成随机设备指纹
-            self.current_panel.log("\n📌 生成随机设备指纹...")
-            machine_info = generate_machine_info()
-            
-            self.current_panel.log(f"✅ 设备指纹已生成:")
-            self.current_panel.log(f"  machineId: {machine_info.get('telemetry.machineId', 'N/A')[:50]}...")
-            self.current_panel.log(f"  macMachineId: {machine_info.get('telemetry.macMachineId', 'N/A')}")
-            self.current_panel.log(f"  devDeviceId: {machine_info.get('telemetry.devDeviceId', 'N/A')}")
-            self.current_panel.log(f"  sqmId: {machine_info.get('telemetry.sqmId', 'N/A')}")
-            self.current_panel.log(f"  machineGuid: {machine_info.get('system.machineGuid', 'N/A')}")
-            
-            # 2. 创建独立的用户数据目录
-            temp_dir = tempfile.mkdtemp(prefix="fingerprint_browser_")
-            self.current_panel.log(f"\n📂 用户数据目录: {temp_dir}")
-            
-            # 3. 初始化浏览器（只生成，不访问页面）
-            self.current_panel.log("\n🌐 启动浏览器...")
-            browser_manager = BrowserManager()
-            browser = browser_manager.init_browser(
-                incognito=False,  # 不使用无痕模式，保留指纹
-                headless=False,   # 可见模式
-                user_data_dir=temp_dir
-            )
-            
-            # ⭐ 只生成浏览器，不访问任何页面（避免连接断开错误）
-            self.current_panel.log("✅ 浏览器已打开（空白页）")
+            self.current_panel.log(_SEP_60)
+        
+        QThreadPool.globalInstance().start(FingerprintBrowserRunnable(self._fingerprint_signals))
+    
+    @pyqtSlot(list)
+    def _on_fingerprint_log(self, lines: list):
+        """指纹浏览器生成进度日志（主线程，一组日志行只滚动/重绘一次）"""
+        with self.current_panel.log_batch():
+            for line in lines:
+                self.current_panel.log(line)
+    
+    @pyqtSlot(str)
+    def _on_fingerprint_browser_ready(self, temp_dir: str):
+        """指纹浏览器已启动（主线程）"""
+        # ⭐ 只生成浏览器，不访问任何页面（避免连接断开错误）
+        with self.current_panel.log_batch():
+            log = self.current_panel.log
+            log("✅ 浏览器已打开（空白页）")
             
             # 4. 显示完成信息
-            self.current_panel.log("\n" + "=" * 60)
-            self.current_panel.log("✅ 指纹浏览器生成完成！")
-            self.current_panel.log("=" * 60)
-            self.current_panel.log("\n💡 提示:")
-            self.current_panel.log("  • 浏览器已打开，可手动操作")
-            self.current_panel.log("  • 每次生成都是新的随机指纹")
-            self.current_panel.log("  • 普通模式（非无痕），支持安装Chrome扩展")
-            self.current_panel.log("  • 可以访问 chrome://extensions/ 安装扩展")
-            self.current_panel.log("  • 关闭后数据不保留")
-            self.current_panel.log(f"  • 用户数据目录: {temp_dir}")
-            
-            # Toast通知
-            from gui.widgets.toast_notification import show_toast
-            show_toast(self, "✅ 指纹浏览器已生成！", duration=2000)
-            
-        except Exception as e:
-            logger.error(f"生成指纹浏览器失败: {e}", exc_info=True)
-            self.current_panel.log(f"\n❌ 生成失败: {e}")
-            QMessageBox.critical(
-                self,
-                "生成失败",
-                f"生成指纹浏览器时出错：\n\n{e}\n\n请查看日志获取详细信息。"
-            )
+            log("\n" + _SEP_60)
+            log("✅ 指纹浏览器生成完成！")
+            log(_SEP_60)
+            log("\n💡 提示:")
+            log("  • 浏览器已打开，可手动操作")
+            log("  • 每次生成都是新的随机指纹")
+            log("  • 普通模式（非无痕），支持安装Chrome扩展")
+            log("  • 可以访问 chrome://extensions/ 安装扩展")
+            log("  • 关闭后数据不保留")
+            log(f"  • 用户数据目录: {temp_dir}")
+        
+        # Toast通知
+        from gui.widgets.toast_notification import show_toast
+        show_toast(self, "✅ 指纹浏览器已生成！", duration=2000)
+    
+    @pyqtSlot(str)
+    def _on_fingerprint_browser_failed(self, error: str):
+        """指纹浏览器生成失败（主线程）"""
+        self.current_panel.log(f"\n❌ 生成失败: {error}")
+        QMessageBox.critical(
+            self,
+            "生成失败",
+            f"生成指纹浏览器时出错：\n\n{error}\n\n请查看日志获取详细信息。"
+        )
     
     def _on_about(self):
         """关于"""
@@ -1720,19 +2231,34 @@ class MainWindow(QMainWindow):
     def _auto_detect_account(self):
         """自动检测当前账号（后台静默检测）"""
         try:
-            # 检查是否已经在检测中
-            if (hasattr(self.current_panel, 'detection_thread') and 
-                self.current_panel.detection_thread and 
-                self.current_panel.detection_thread.isRunning()):
+            # 检查是否已经在检测中（detection_thread 在面板初始化时即为 None）
+            detection_thread = self.current_panel.detection_thread
+            if detection_thread and detection_thread.isRunning():
                 logger.debug("检测正在进行中，跳过本次自动检测")
                 return
             
+            # ⭐ Cursor 数据库（修改时间/大小）未变化时跳过本次检测，避免每次都启动线程并请求 API
+            from core.cursor_config_scanner import get_scanner
+            fingerprint = get_scanner().state_db_fingerprint()
+            now = time.monotonic()
+            if (fingerprint and fingerprint == self._last_detect_fingerprint
+                    and now - self._last_detect_time < AUTO_DETECT_MAX_SKIP_SECONDS):
+                logger.debug("Cursor 数据库未变化，跳过本次自动检测")
+                return
+            self._last_detect_fingerprint = fingerprint
+            self._last_detect_time = now
+            
             # 触发静默检测（不输出日志，不禁用按钮）
             self.current_panel.start_detection(silent=True)
             
         except Exception as e:
             logger.error(f"自动检测失败: {e}")
     
+    def _rebuild_after_detection(self):
+        """检测到当前账号后重建列表（置顶当前账号）"""
+        self.refresh_accounts(force_rebuild=True)
+    
+    @pyqtSlot(dict)
     def _on_account_detected(self, account_data: dict):
         """账号检测完成回调"""
         detected_email = account_data.get('email', '未知')
@@ -1742,42 +2268,13 @@ class MainWindow(QMainWindow):
         self.current_login_email = detected_email
         
         try:
-            # ⚠️ 过滤掉构造的 session_token，设为空字符串
-            access_token = account_data.get('access_token')
-            refresh_token = account_data.get('refresh_token')
-            
-            # ⭐ 如果 refresh_token 为空，用 access_token 填充（通常相同）
-            if not refresh_token and access_token:
-                refresh_token = access_token
-            
-            # ⭐ 将模型费用转为JSON
-            model_usage_json = None
-            if 'model_usage' in account_data and account_data['model_usage']:
-                import json
-                try:
-                    model_usage_json = json.dumps(account_data['model_usage'])
-                except:
-                    pass
+            # ⭐ 一次性取出需要保存的字段
+            filtered_data = _detected_account_record(account_data)
             
-            filtered_data = {
-                'email': account_data.get('email'),
-                'access_token': access_token,
-                'refresh_token': refresh_token,  # ⭐ 确保有值
-                'session_token': '',  # ⭐ 空字符串（导出时转为 null）
-                'user_id': account_data.get('user_id'),
-                'membership_type': account_data.get('membership_type'),
-                'usage_percent': account_data.get('usage_percent'),
-                'used': account_data.get('used'),
-                'limit': account_data.get('limit'),
-                'days_remaining': account_data.get('days_remaining', 0),
-                'subscription_status': account_data.get('subscription_status'),  # ⭐ 订阅状态
-                'total_cost': account_data.get('total_cost'),  # ⭐ 真实费用
-                'total_tokens': account_data.get('total_tokens'),  # ⭐ 总tokens
-                'unpaid_amount': account_data.get('unpaid_amount'),  # ⭐ 欠费金额
-                'model_usage_json': model_usage_json,  # ⭐ 模型费用详情
-                'last_used': account_data.get('last_used'),  # ⭐ 最后使用时间
-                'machine_info': account_data.get('machine_info')  # ⭐ 保留机器码
-            }
+            # ⭐ 模型费用详情与上次检测写入的相同时不再写入（跳过序列化）
+            model_usage = filtered_data['model_usage']
+            if model_usage and self._last_model_usage_by_email.get(detected_email) == model_usage:
+                del filtered_data['model_usage']
             
             logger.debug("保存数据：refresh_token 已填充, session_token 设为空, machine_info 已保留")
             
@@ -1786,10 +2283,11 @@ class MainWindow(QMainWindow):
             
             if account_id:
                 logger.info(f"✅ 账号已保存到数据库 (ID: {account_id})")
+                self._last_model_usage_by_email[detected_email] = model_usage
                 
                 # ⭐ 当前登录账号检测完成后，必须重建列表以实现置顶功能
                 logger.info(f"🔄 当前登录账号检测完成，重建列表以置顶: {detected_email}")
-                QTimer.singleShot(500, lambda: self.refresh_accounts(force_rebuild=True))
+                self._post_detect_refresh_timer.start()
                 
                 # ⭐ 静默提示（仅状态栏，无弹窗）
                 email = filtered_data.get('email', '')
@@ -1814,35 +2312,39 @@ class MainWindow(QMainWindow):
             # ⭐ 静默提示（仅状态栏和日志，无弹窗）
             self.status_bar.show_message(f"❌ 检测错误: {str(e)[:50]}", 5000)
     
+    @pyqtSlot(dict)
     def _on_filter_changed(self, filter_dict: dict):
         """筛选条件改变（使用防抖，避免闪烁）"""
         self.current_filter = filter_dict
         logger.info(f"筛选条件改变: {filter_dict}")
         
         # ⭐ 使用防抖定时器（避免频繁重建）
-        if hasattr(self, 'filter_debounce_timer'):
-            self.filter_debounce_timer.stop()
-            self.filter_debounce_timer.start(150)  # 150ms延迟
-        else:
-            self.refresh_accounts(force_rebuild=True)
+        self._schedule_view_change(PENDING_FILTER)
     
+    @pyqtSlot(str, bool)
     def _on_sort_changed(self, sort_by: str, ascending: bool):
         """排序改变（使用防抖，避免闪烁）"""
         self.current_sort = (sort_by, ascending)
         logger.info(f"排序条件改变: {sort_by} ({'升序' if ascending else '降序'})")
         
         # ⭐ 使用防抖定时器（避免频繁重建）
-        if hasattr(self, 'sort_debounce_timer'):
-            self.sort_debounce_timer.stop()
-            self.sort_debounce_timer.start(150)  # 150ms延迟
-        else:
-            self.refresh_accounts(force_rebuild=True)
+        self._schedule_view_change(PENDING_SORT)
     
+    @pyqtSlot(str)
     def _on_search_changed(self, text: str):
         """搜索文本改变（使用防抖，避免频繁刷新）"""
         # ⭐ 重启防抖定时器（300ms 后才真正刷新）
-        self.search_debounce_timer.stop()
-        self.search_debounce_timer.start(300)
+        self._schedule_view_change(PENDING_SEARCH)
+    
+    def _schedule_view_change(self, op: int):
+        """
+        记录待处理的筛选/排序/搜索变化并重启共用的防抖定时器
+        
+        Args:
+            op: PENDING_FILTER / PENDING_SORT / PENDING_SEARCH
+        """
+        self._pending_view_ops |= op
+        self._view_change_timer.start(VIEW_CHANGE_DEBOUNCE_MS[op])  # start 会重启计时
     
     def _can_use_visibility_filter(self) -> bool:
         """
@@ -1856,7 +2358,7 @@ class MainWindow(QMainWindow):
             return False
         
         # 条件2：不能有搜索条件（搜索需要重建）
-        if hasattr(self, 'toolbar') and self.toolbar.search_box.text():
+        if self.toolbar is not None and self.toolbar.search_box.text():
             return False
         
         # 条件3：必须是纯筛选操作（不改变排序）
@@ -1871,9 +2373,6 @@ class MainWindow(QMainWindow):
         try:
             logger.info("🎯 使用智能筛选（隐藏/显示模式，无闪烁）")
             
-            # ⭐ 禁用界面更新
-            self.account_list_widget.setUpdatesEnabled(False)
-            
             # 获取符合筛选条件的账号
             sort_by, ascending = self.current_sort
             filtered_accounts = self.storage.get_all_accounts(
@@ -1887,37 +2386,47 @@ class MainWindow(QMainWindow):
             # 构建符合条件的账号ID集合
             filtered_ids = {acc['id'] for acc in filtered_accounts}
             
-            # 只改变卡片的可见性（不删除不创建）
-            visible_count = 0
-            hidden_count = 0
-            for account_id, card in self.account_cards.items():
-                if account_id in filtered_ids:
-                    if not card.isVisible():
-                        card.setVisible(True)
-                        visible_count += 1
-                else:
-                    if card.isVisible():
-                        card.setVisible(False)
-                        hidden_count += 1
+            # ⭐ 禁用界面更新并冻结布局：逐个显隐卡片不触发重排，结束后只重排/重绘一次
+            self.account_list_widget.setUpdatesEnabled(False)
+            try:
+                with self.account_list_layout.frozen():
+                    # 只改变卡片的可见性（不删除不创建）
+                    # ⭐ 用集合运算直接算出需要切换显隐的卡片，显隐不变的卡片完全不触碰
+                    cards = self.account_cards
+                    to_show = (filtered_ids & cards.keys()) - self._visible_ids
+                    to_hide = self._visible_ids - filtered_ids
+                    for account_id in to_show:
+                        cards[account_id].setVisible(True)
+                    for account_id in to_hide:
+                        cards[account_id].setVisible(False)
+                    self._visible_ids |= to_show
+                    self._visible_ids -= to_hide
                     
-                    # ⭐ 隐藏卡片时，自动取消选中（避免状态混乱）
-                    if account_id in self.selected_account_ids:
-                        card.set_selected(False)
-                        self.selected_account_ids.discard(account_id)
-                        logger.debug(f"取消隐藏账号的选中状态: {card.account_data.get('email')}")
+                    # ⭐ 隐藏卡片时，自动取消选中（避免状态混乱；set_selected 不发射选择信号）
+                    for account_id in self.selected_account_ids & to_hide:
+                        cards[account_id].set_selected(False)
+                    self.selected_account_ids &= filtered_ids
+                    
+                    # ⭐ 尚未创建卡片的账号不创建卡片：延迟列表改为筛选结果中还没有卡片的账号（保持排序）
+                    total_count, _ = self._card_counts()
+                    self._deferred_card_accounts = [acc for acc in filtered_accounts if acc['id'] not in cards]
+                    self._filtered_out_deferred = total_count - len(cards) - len(self._deferred_card_accounts)
+                self.account_list_layout.invalidate()
+            finally:
+                # ⭐ 重新启用界面更新
+                self.account_list_widget.setUpdatesEnabled(True)
+                self.account_list_widget.update()
             
-            logger.info(f"✅ 筛选完成：显示 {len(filtered_ids)} 个，隐藏 {len(self.account_cards) - len(filtered_ids)} 个")
+            total_count, visible_count = self._card_counts()
+            logger.info(f"✅ 筛选完成：显示 {visible_count} 个，隐藏 {total_count - visible_count} 个")
             
-            # ⭐ 重新启用界面更新
-            self.account_list_widget.setUpdatesEnabled(True)
-            self.account_list_widget.update()
+            # 视口未填满时继续创建延迟的卡片
+            if self._deferred_card_accounts:
+                QTimer.singleShot(0, self._materialize_visible_cards)
             
-            # 更新工具栏计数
-            if hasattr(self, 'toolbar'):
-                total_count = len(self.account_cards)  # 总账号数
-                visible_count = len(filtered_ids)  # 可见账号数
-                selected_count = len(self.selected_account_ids)  # 选中数
-                self.toolbar.update_counts(selected_count, total_count, visible_count)
+            # 更新工具栏计数（可见数直接取增量维护的计数）
+            if self.toolbar is not None:
+                self.toolbar.update_counts(len(self.selected_account_ids), total_count, visible_count)
             
             # 更新状态栏
             self.status_bar.update_account_count(len(filtered_ids))
@@ -1926,26 +2435,22 @@ class MainWindow(QMainWindow):
             logger.error(f"智能筛选失败，回退到重建模式: {e}")
             self.refresh_accounts(force_rebuild=True)
     
-    def _do_search_refresh(self):
-        """执行搜索刷新（防抖后的实际操作）"""
-        self.refresh_accounts(force_rebuild=True)  # 搜索需要重建（内部也会检测）
-    
-    def _do_filter_refresh(self):
-        """执行筛选刷新（防抖后的实际操作）- 使用智能筛选"""
-        logger.info(f"⏰ 防抖完成，应用筛选: {self.current_filter}")
+    def _do_view_change_refresh(self):
+        """执行筛选/排序/搜索刷新（防抖后的实际操作，多种变化合并为一次刷新）"""
+        ops, self._pending_view_ops = self._pending_view_ops, 0
+        
+        if ops & PENDING_FILTER:
+            logger.info(f"⏰ 防抖完成，应用筛选: {self.current_filter}")
+        if ops & PENDING_SORT:
+            sort_by, ascending = self.current_sort
+            logger.info(f"⏰ 防抖完成，应用排序: {sort_by} ({'升序' if ascending else '降序'})")
         
-        # ⭐ 智能筛选：优先使用隐藏/显示，避免重建
-        if self._can_use_visibility_filter():
+        # ⭐ 只有筛选变化时优先使用隐藏/显示（智能筛选）；排序/搜索需要重建（顺序或结果集变化）
+        if ops == PENDING_FILTER and self._can_use_visibility_filter():
             self._apply_filter_by_visibility()
         else:
             self.refresh_accounts(force_rebuild=True)
     
-    def _do_sort_refresh(self):
-        """执行排序刷新（防抖后的实际操作）"""
-        sort_by, ascending = self.current_sort
-        logger.info(f"⏰ 防抖完成，应用排序: {sort_by} ({'升序' if ascending else '降序'})")
-        self.refresh_accounts(force_rebuild=True)  # 排序需要重建（因为顺序变化）
-    
     def _on_card_selection_changed(self, account_id: int, selected: bool):
         """账号卡片选择状态改变"""
         if selected:
@@ -1954,31 +2459,31 @@ class MainWindow(QMainWindow):
             self.selected_account_ids.discard(account_id)
         
         # 更新工具栏计数
-        if hasattr(self, 'toolbar'):
-            total = len(self.account_cards)
-            visible_count = sum(1 for card in self.account_cards.values() if card.isVisible())
+        if self.toolbar is not None:
+            total, visible_count = self._card_counts()
             self.toolbar.update_counts(len(self.selected_account_ids), total, visible_count)
     
+    @pyqtSlot(bool)
     def _on_select_all(self, select: bool):
-        """全选/取消全选（只选择当前可见的卡片）"""
-        visible_count = 0
-        
-        for account_id, card in self.account_cards.items():
-            # ⭐ 只操作可见的卡片（筛选后显示的）
-            if card.isVisible():
-                card.set_selected(select)
-                visible_count += 1
-                # 手动更新选中状态集合（因为 set_selected 阻塞了信号）
-                if select:
-                    self.selected_account_ids.add(account_id)
-                else:
-                    self.selected_account_ids.discard(account_id)
+        """全选/取消全选（只选择当前可见的账号，尚未创建卡片的账号只按 ID 记录）"""
+        # ⭐ 只操作未被筛选隐藏的卡片（直接取增量维护的可见 ID 集合，无需逐个查询显隐）
+        visible_ids = self._visible_ids
+        for account_id in visible_ids:
+            self.account_cards[account_id].set_selected(select)
+        
+        # 批量更新选中状态集合（set_selected 阻塞了信号，需手动同步）
+        # ⭐ 延迟账号不创建卡片，创建时由 _add_account_card 按集合恢复选中状态
+        target_ids = visible_ids.union(acc['id'] for acc in self._deferred_card_accounts)
+        if select:
+            self.selected_account_ids |= target_ids
+        else:
+            self.selected_account_ids -= target_ids
         
+        total_count, visible_count = self._card_counts()
         logger.info(f"{'✅ 全选' if select else '❌ 取消全选'} {visible_count} 个可见账号")
         
         # 更新工具栏计数
-        if hasattr(self, 'toolbar'):
-            total_count = len(self.account_cards)  # 总账号数
+        if self.toolbar is not None:
             self.toolbar.update_counts(
                 len(self.selected_account_ids),  # 选中数
                 total_count,  # 总数
@@ -2026,7 +2531,6 @@ class MainWindow(QMainWindow):
     
     def _on_import_accounts(self):
         """导入账号"""
-        from PyQt6.QtWidgets import QFileDialog
         from core.account_exporter import get_exporter
         
         file_path, _ = QFileDialog.getOpenFileName(
@@ -2053,12 +2557,8 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "导入失败", "无法识别文件格式")
                 return
             
-            # 导入到数据库
-            success_count = 0
-            for account in accounts:
-                account_id = self.storage.add_account(account)
-                if account_id:
-                    success_count += 1
+            # 导入到数据库（单个事务批量插入，已存在的账号自动跳过）
+            success_count = self.storage.add_accounts_bulk(accounts)
             
             QMessageBox.information(
                 self,
@@ -2074,19 +2574,14 @@ class MainWindow(QMainWindow):
     
     def _on_export_selected(self):
         """导出选中的账号"""
-        from PyQt6.QtWidgets import QFileDialog
         from core.account_exporter import get_exporter
         
         if not self.selected_account_ids:
             QMessageBox.warning(self, "提示", "请先选择要导出的账号")
             return
         
-        # 获取选中的账号数据
-        selected_accounts = []
-        for account_id in self.selected_account_ids:
-            account = self.storage.get_account_by_id(account_id)
-            if account:
-                selected_accounts.append(account)
+        # 获取选中的账号数据（单次查询）
+        selected_accounts = list(self.storage.get_accounts_by_ids(self.selected_account_ids).values())
         
         if not selected_accounts:
             return
@@ -2141,10 +2636,8 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            for account_id in list(self.selected_account_ids):
-                if self.storage.delete_account(account_id):
-                    success_count += 1
+            # ⭐ 单个事务批量删除
+            success_count = self.storage.delete_accounts_bulk(list(self.selected_account_ids))
             
             QMessageBox.information(
                 self,
@@ -2161,12 +2654,14 @@ class MainWindow(QMainWindow):
             return
         
         # 初始化批量刷新状态
-        self.batch_refresh_queue = list(self.selected_account_ids)
+        self.batch_refresh_queue = deque(self.selected_account_ids)
         self.batch_refresh_total = len(self.batch_refresh_queue)
         self.batch_refresh_current = 0
         self.batch_refresh_active = 0  # 当前正在刷新的数量
         self.batch_refresh_success = 0  # ⭐ 成功数量
         self.batch_refresh_failed = 0  # ⭐ 失败数量
+        self._batch_last_email = ''
+        self._batch_completed_ids = []
         
         # ⭐ 从配置读取并发数（用于对话框显示）
         performance_config = self.config.get('performance', {})
@@ -2189,47 +2684,58 @@ class MainWindow(QMainWindow):
         performance_config = self.config.get('performance', {})
         self.batch_refresh_max_concurrent = performance_config.get('batch_concurrent', 2)
         
-        logger.info("="*60)
+        logger.info(_SEP_60)
         logger.info(f"📊 开始批量刷新 {self.batch_refresh_total} 个账号（并发数: {self.batch_refresh_max_concurrent}）")
-        logger.info("="*60)
+        logger.info(_SEP_60)
         
         # 安全输出日志
         try:
             if self.current_panel:
-                self.current_panel.log("="*40)
-                self.current_panel.log(f"📊 批量刷新 {self.batch_refresh_total} 个账号")
-                self.current_panel.log(f"⚡ 并发数: {self.batch_refresh_max_concurrent}")
-                self.current_panel.log("="*40)
+                with self.current_panel.log_batch():
+                    self.current_panel.log(_SEP_40)
+                    self.current_panel.log(f"📊 批量刷新 {self.batch_refresh_total} 个账号")
+                    self.current_panel.log(f"⚡ 并发数: {self.batch_refresh_max_concurrent}")
+                    self.current_panel.log(_SEP_40)
         except Exception as e:
             logger.debug(f"输出批量刷新日志失败: {e}")
         
         self.status_bar.show_message(f"🔄 批量刷新中 (0/{self.batch_refresh_total})...", 0)
         
-        # 启动初始批次（启动多个并发任务）
+        # 启动初始批次（先收集多个并发任务，再一次性提交到线程池）
+        initial_tasks = []
         for _ in range(min(self.batch_refresh_max_concurrent, len(self.batch_refresh_queue))):
-            self._start_next_batch_refresh()
+            self._start_next_batch_refresh(initial_tasks)
+        self.thread_manager.submit_batch(initial_tasks)
     
-    def _start_next_batch_refresh(self):
-        """启动下一个批量刷新任务（优化版：添加关闭检查）"""
+    def _start_next_batch_refresh(self, pending_tasks: Optional[list] = None):
+        """
+        启动下一个批量刷新任务（优化版：添加关闭检查）
+        
+        Args:
+            pending_tasks: 不为 None 时只收集任务，由调用方统一批量提交
+        """
         try:
             # ⭐ 检查是否正在关闭
-            if hasattr(self, '_is_closing') and self._is_closing:
+            if self._is_closing:
                 logger.info("窗口正在关闭，停止批量刷新")
                 return
             
-            if not hasattr(self, 'batch_refresh_queue') or not self.batch_refresh_queue:
+            if not self.batch_refresh_queue:
                 # 队列为空，检查是否全部完成
-                if hasattr(self, 'batch_refresh_active') and self.batch_refresh_active == 0:
-                    # 没有正在运行的任务了，完成
-                    if hasattr(self, 'batch_refresh_total'):
-                        success_count = getattr(self, 'batch_refresh_success', 0)
-                        failed_count = getattr(self, 'batch_refresh_failed', 0)
+                if self.batch_refresh_active == 0:
+                    # 没有正在运行的任务了，完成（丢弃尚未执行的进度更新，避免覆盖完成状态）
+                    self._batch_ui_timer.stop()
+                    self._flush_pending_updates()
+                    self._apply_batch_card_updates()
+                    if self.batch_refresh_total:
+                        success_count = self.batch_refresh_success
+                        failed_count = self.batch_refresh_failed
                         
                         logger.info(f"✅ 批量刷新完成，共 {self.batch_refresh_total} 个账号（成功: {success_count}, 失败: {failed_count}）")
-                        logger.info("="*60)
+                        logger.info(_SEP_60)
                         
                         # ⭐ 更新对话框为完成状态
-                        if hasattr(self, 'batch_refresh_dialog') and self.batch_refresh_dialog:
+                        if self.batch_refresh_dialog is not None:
                             try:
                                 self.batch_refresh_dialog.update_progress(
                                     self.batch_refresh_total,
@@ -2242,20 +2748,20 @@ class MainWindow(QMainWindow):
                         
                         # 安全调用日志输出
                         try:
-                            if hasattr(self, 'current_panel') and self.current_panel:
+                            if self.current_panel is not None:
                                 self.current_panel.log(f"✅ 批量刷新完成 (成功:{success_count}/失败:{failed_count})")
                         except Exception as e:
                             logger.debug(f"输出日志失败: {e}")
                         
                         try:
-                            if hasattr(self, 'status_bar') and self.status_bar:
+                            if self.status_bar is not None:
                                 self.status_bar.show_message(f"✅ 批量刷新完成 (成功:{success_count}/失败:{failed_count})", 5000)
                         except Exception as e:
                             logger.debug(f"更新状态栏失败: {e}")
                 return
             
             # 获取下一个账号
-            account_id = self.batch_refresh_queue.pop(0)
+            account_id = self.batch_refresh_queue.popleft()
             self.batch_refresh_current += 1
             self.batch_refresh_active += 1
             
@@ -2265,7 +2771,7 @@ class MainWindow(QMainWindow):
             if not account:
                 logger.warning(f"账号 ID {account_id} 不存在，跳过")
                 self.batch_refresh_active -= 1
-                self._start_next_batch_refresh()
+                self._start_next_batch_refresh(pending_tasks)
                 return
             
             email = account.get('email', 'unknown')
@@ -2274,62 +2780,76 @@ class MainWindow(QMainWindow):
             
             # 安全调用日志输出
             try:
-                if hasattr(self, 'current_panel') and self.current_panel:
+                if self.current_panel is not None:
                     self.current_panel.log(f"[{self.batch_refresh_current}/{self.batch_refresh_total}] {email}")
             except Exception as e:
                 logger.debug(f"输出日志失败: {e}")
             
-            try:
-                if hasattr(self, 'status_bar') and self.status_bar:
-                    self.status_bar.show_message(
-                        f"🔄 批量刷新中 ({self.batch_refresh_current}/{self.batch_refresh_total}, 并发: {self.batch_refresh_active})...", 
-                        0
-                    )
-            except Exception as e:
-                logger.debug(f"更新状态栏失败: {e}")
+            self._schedule_batch_ui()
             
             # ⭐ 启动刷新（批量模式 - 快速）
             # 现在 _on_refresh_finished 会在主线程中执行，所以回调也会在主线程执行
-            self._on_refresh_account_with_callback(account_id, self._on_batch_refresh_item_finished, is_batch=True)
+            self._on_refresh_account_with_callback(account_id, self._on_batch_refresh_item_finished, is_batch=True,
+                                                   account=account, pending_tasks=pending_tasks)
             
         except Exception as e:
             logger.error(f"启动批量刷新任务异常: {e}", exc_info=True)
             # 确保继续处理
-            if hasattr(self, 'batch_refresh_active'):
-                self.batch_refresh_active = max(0, self.batch_refresh_active - 1)
+            self.batch_refresh_active = max(0, self.batch_refresh_active - 1)
             # 尝试继续下一个
             try:
                 QTimer.singleShot(100, self._start_next_batch_refresh)
             except:
                 pass
     
+    def _schedule_batch_ui(self):
+        """标记批量刷新进度需要更新（定时器未启动时才启动，同一帧内的多次变化只更新一次界面）"""
+        if not self._batch_ui_timer.isActive():
+            self._batch_ui_timer.start()
+    
+    def _flush_batch_ui(self):
+        """按当前计数一次性更新批量刷新对话框和状态栏"""
+        current, total = self.batch_refresh_current, self.batch_refresh_total
+        
+        if self.batch_refresh_dialog is not None and self._batch_last_email:
+            try:
+                self.batch_refresh_dialog.update_progress(
+                    current,
+                    f"正在刷新: {current}/{total} - {self._batch_last_email}"
+                )
+            except Exception as e:
+                logger.debug(f"更新对话框进度失败: {e}")
+        
+        try:
+            if self.status_bar is not None:
+                self.status_bar.show_message(
+                    f"🔄 批量刷新中 ({current}/{total}, 并发: {self.batch_refresh_active})...",
+                    0
+                )
+        except Exception as e:
+            logger.debug(f"更新状态栏失败: {e}")
+    
     def _safe_update_current_panel(self, account_data: dict):
         """安全更新右侧当前账号面板"""
         try:
-            if hasattr(self, 'current_panel') and self.current_panel and account_data:
+            if self.current_panel is not None and account_data:
                 self.current_panel.update_account_info(account_data)
         except Exception as e:
             logger.debug(f"更新当前面板失败: {e}")
     
     def _on_batch_refresh_item_finished(self, account_id: int, success: bool):
         """单个批量刷新任务完成的回调（优化版：增强日志和错误处理）"""
-        logger.info("=" * 40)
-        logger.info(f"🔔 回调触发: account_id={account_id}, success={success}")
-        logger.info("=" * 40)
-        
         try:
             # ⭐ 检查是否遇到服务器错误，如果是，停止后续刷新
-            if hasattr(self, 'batch_refresh_queue') and len(self.batch_refresh_queue) == 0 and not success:
+            if not self.batch_refresh_queue and not success:
                 logger.warning("检测到服务器错误或队列已清空，停止批量刷新")
             
             # 检查窗口是否还存在
-            if not self or not hasattr(self, 'batch_refresh_active'):
+            if not self:
                 logger.warning("窗口已关闭，停止批量刷新")
                 return
             
             # ⭐ 确保计数不会出错
-            logger.info(f"当前状态: active={self.batch_refresh_active}, current={self.batch_refresh_current}, total={self.batch_refresh_total}")
-            
             if self.batch_refresh_active > 0:
                 self.batch_refresh_active -= 1
             else:
@@ -2338,37 +2858,33 @@ class MainWindow(QMainWindow):
             
             # ⭐ 记录刷新结果
             if success:
-                self.batch_refresh_success = getattr(self, 'batch_refresh_success', 0) + 1
+                self.batch_refresh_success += 1
             else:
-                self.batch_refresh_failed = getattr(self, 'batch_refresh_failed', 0) + 1
+                self.batch_refresh_failed += 1
             
-            # ⭐ 获取账号信息用于日志
-            account = self.storage.get_account_by_id(account_id)
-            email = account.get('email', 'unknown') if account else 'unknown'
+            # ⭐ 账号邮箱直接取卡片上的数据（不为日志单独查询数据库）
+            card = self.account_cards.get(account_id)
+            email = card.account_data.get('email', 'unknown') if card is not None else f"ID {account_id}"
             status_text = "✅ 成功" if success else "❌ 失败"
             
-            logger.info(f"[{self.batch_refresh_current}/{self.batch_refresh_total}] {email} 刷新{status_text} (active={self.batch_refresh_active})")
+            # ⭐ 每个账号只记录一条汇总日志（文件日志为 DEBUG 级别，每条记录都会格式化并写盘）
+            logger.info(
+                f"[{self.batch_refresh_current}/{self.batch_refresh_total}] {email} 刷新{status_text} "
+                f"(active={self.batch_refresh_active}, 队列剩余={len(self.batch_refresh_queue)})"
+            )
             
-            # ⭐ 更新批量刷新对话框的进度
-            if hasattr(self, 'batch_refresh_dialog') and self.batch_refresh_dialog:
-                try:
-                    self.batch_refresh_dialog.update_progress(
-                        self.batch_refresh_current,
-                        f"正在刷新: {self.batch_refresh_current}/{self.batch_refresh_total} - {email}"
-                    )
-                except Exception as e:
-                    logger.debug(f"更新对话框进度失败: {e}")
+            # ⭐ 批量刷新对话框的进度由定时器合并更新
+            self._batch_last_email = email
+            self._schedule_batch_ui()
             
             # ⭐ 无论成功失败都立即启动下一个（关键：确保第5个账号能开始）
-            logger.info(f"准备启动下一个任务，队列剩余: {len(self.batch_refresh_queue)}")
             self._start_next_batch_refresh()
             
         except Exception as e:
             logger.error(f"批量刷新回调异常: {e}", exc_info=True)
             # ⭐ 确保即使出错也继续下一个（防止队列卡死）
             try:
-                if hasattr(self, 'batch_refresh_active'):
-                    self.batch_refresh_active = max(0, self.batch_refresh_active - 1)
+                self.batch_refresh_active = max(0, self.batch_refresh_active - 1)
                 QTimer.singleShot(100, self._start_next_batch_refresh)
             except Exception as e2:
                 logger.error(f"恢复处理失败: {e2}")
@@ -2379,12 +2895,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "提示", "请先选择要绑卡的账号")
             return
         
-        # 获取选中的账号信息
-        selected_accounts = []
-        for account_id in self.selected_account_ids:
-            account = self.storage.get_account_by_id(account_id)
-            if account:
-                selected_accounts.append(account)
+        # 获取选中的账号信息（单次查询）
+        selected_accounts = list(self.storage.get_accounts_by_ids(self.selected_account_ids).values())
         
         if not selected_accounts:
             QMessageBox.warning(self, "提示", "未找到有效的账号")
@@ -2427,7 +2939,7 @@ class MainWindow(QMainWindow):
     
     def _get_theme_icon(self) -> str:
         """获取主题切换按钮的图标"""
-        if hasattr(self, 'theme_manager') and self.theme_manager.is_dark_theme():
+        if self.theme_manager.is_dark_theme():
             return "☀️ 浅色"
         else:
             return "🌙 深色"
@@ -2481,11 +2993,11 @@ class MainWindow(QMainWindow):
             
             # ⭐ 阶段1：立即更新关键UI组件（用户最先看到的）
             # 更新按钮图标
-            if hasattr(self, 'theme_toggle_action'):
+            if self.theme_toggle_action is not None:
                 self.theme_toggle_action.setText(self._get_theme_icon())
             
             # 更新当前账号面板
-            if hasattr(self, 'current_panel'):
+            if self.current_panel is not None:
                 try:
                     self.current_panel._apply_theme_styles()
                     logger.debug("当前账号面板已更新")
@@ -2503,7 +3015,7 @@ class MainWindow(QMainWindow):
     def _update_cards_theme_staged(self, theme_name: str):
         """分阶段更新卡片主题（优先渲染可见卡片）"""
         try:
-            if not hasattr(self, 'account_cards') or not self.account_cards:
+            if not self.account_cards:
                 return
             
             cards_list = list(self.account_cards.values())
@@ -2512,10 +3024,10 @@ class MainWindow(QMainWindow):
             logger.debug(f"分阶段更新 {total_cards} 个卡片主题")
             
             # ⭐ 冻结布局（防止中途重排）
-            if hasattr(self, 'account_list_layout'):
+            if self.account_list_layout is not None:
                 self.account_list_layout.freeze()
             
-            if hasattr(self, 'account_list_widget'):
+            if self.account_list_widget is not None:
                 self.account_list_widget.setUpdatesEnabled(False)
             
             # ⭐ 第一批：前20个卡片（可见区域）立即更新
@@ -2554,11 +3066,11 @@ class MainWindow(QMainWindow):
         """主题更新完成回调（解冻并一次性重绘）"""
         try:
             # ⭐ 解冻布局并标记为脏
-            if hasattr(self, 'account_list_layout'):
+            if self.account_list_layout is not None:
                 self.account_list_layout.unfreeze()
             
             # ⭐ 恢复渲染（一次性重绘）
-            if hasattr(self, 'account_list_widget'):
+            if self.account_list_widget is not None:
                 self.account_list_widget.setUpdatesEnabled(True)
                 self.account_list_widget.update()
             
@@ -2567,7 +3079,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"主题更新完成回调失败: {e}")
             # 确保恢复状态
-            if hasattr(self, 'account_list_widget'):
+            if self.account_list_widget is not None:
                 self.account_list_widget.setUpdatesEnabled(True)
     
     def _load_stylesheet(self):
@@ -2586,8 +3098,6 @@ class MainWindow(QMainWindow):
         Returns:
             bool: 是否拦截事件
         """
-        from PyQt6.QtCore import QEvent
-        
         # ⭐ 处理键盘事件
         if event.type() == QEvent.Type.KeyPress:
             # Delete 键 - 删除选中的账号
@@ -2622,6 +3132,7 @@ class MainWindow(QMainWindow):
         """拖动多选开始"""
         self.is_drag_selecting = True
         self.drag_start_card = card
+        self._drag_hit_index = None
         
         # 更新选中集合
         if card.is_selected():
@@ -2630,57 +3141,93 @@ class MainWindow(QMainWindow):
             self.selected_account_ids.discard(card.account_id)
         
         # 更新工具栏计数
-        if hasattr(self, 'toolbar'):
-            visible_count = sum(1 for c in self.account_cards.values() if c.isVisible())
-            self.toolbar.update_counts(len(self.selected_account_ids), len(self.account_cards), visible_count)
+        if self.toolbar is not None:
+            total_count, visible_count = self._card_counts()
+            self.toolbar.update_counts(len(self.selected_account_ids), total_count, visible_count)
         
         logger.info(f"✅ 开始拖动多选，起始卡片: {card.account_data.get('email')}")
     
     def _on_drag_select_move(self, card, event):
-        """拖动多选移动（优化版：添加详细日志和简化逻辑）"""
+        """拖动多选移动（按行索引命中测试，不逐个遍历卡片）"""
         if not self.is_drag_selecting:
             return
         
-        # 获取鼠标全局位置
-        global_pos = card.mapToGlobal(event.pos())
-        logger.debug(f"拖动移动 - 鼠标全局位置: {global_pos}")
+        # 获取鼠标全局位置，命中测试找出鼠标下的卡片
+        self._drag_select_at(card.mapToGlobal(event.pos()))
+    
+    def _build_drag_hit_index(self):
+        """
+        构建拖动命中测试索引：可见卡片按行分组，坐标取卡片在列表容器中的位置（滚动不影响）
         
-        # 统计经过的卡片数量
-        selected_count = 0
+        Returns:
+            tuple: (各行顶部坐标列表, [(行底部坐标, [(左, 右, 账号ID), ...]), ...])
+        """
+        # 先完成挂起的布局计算，确保刚创建/显示的卡片已有正确位置
+        self.account_list_layout.activate()
+        
+        rows = {}
+        for account_id in self._visible_ids:
+            rect = self.account_cards[account_id].geometry()
+            rows.setdefault(rect.top(), []).append((rect.left(), rect.right(), rect.bottom(), account_id))
+        
+        tops = sorted(rows)
+        row_cells = []
+        for top in tops:
+            cells = rows[top]
+            row_cells.append((max(cell[2] for cell in cells), [(l, r, aid) for l, r, _, aid in cells]))
+        return tops, row_cells
+    
+    def _drag_hit_test(self, global_pos) -> Optional[int]:
+        """
+        返回鼠标所在卡片的账号 ID（二分查找所在行，只检查该行的卡片）
         
-        # 遍历所有卡片，判断鼠标是否经过
-        for account_id, other_card in self.account_cards.items():
-            try:
-                # ⭐ 简化：直接使用 geometry 获取卡片矩形
-                card_rect = other_card.geometry()
-                
-                # 获取卡片在父容器中的位置
-                card_parent_pos = other_card.pos()
-                
-                # 转换为全局坐标
-                card_global_pos = other_card.parentWidget().mapToGlobal(card_parent_pos)
-                
-                # 创建全局矩形
-                from PyQt6.QtCore import QRect
-                card_global_rect = QRect(card_global_pos, card_rect.size())
-                
-                # 判断鼠标是否在这个卡片内
-                if card_global_rect.contains(global_pos):
-                    # 如果这个卡片还没有被选中，则选中它
-                    if not other_card.is_selected():
-                        other_card.set_selected(True)
-                        self.selected_account_ids.add(account_id)
-                        selected_count += 1
-                        
-                        logger.info(f"✅ 拖动经过并选中: {other_card.account_data.get('email')}")
-            except Exception as e:
-                logger.error(f"处理卡片鼠标移动异常: {e}", exc_info=True)
-                continue
+        Args:
+            global_pos: 鼠标全局坐标
+            
+        Returns:
+            Optional[int]: 账号 ID，不在任何卡片上时为 None
+        """
+        if self._drag_hit_index is None:
+            self._drag_hit_index = self._build_drag_hit_index()
+        tops, row_cells = self._drag_hit_index
+        
+        pos = self.account_list_widget.mapFromGlobal(global_pos)
+        x, y = pos.x(), pos.y()
+        row = bisect.bisect_right(tops, y) - 1
+        if row < 0:
+            return None
+        bottom, cells = row_cells[row]
+        if y > bottom:
+            return None
+        for left, right, account_id in cells:
+            if left <= x <= right:
+                return account_id
+        return None
+    
+    def _drag_select_at(self, global_pos):
+        """拖动经过时选中鼠标下的卡片"""
+        account_id = self._drag_hit_test(global_pos)
+        if account_id is None:
+            return
         
-        # 更新工具栏计数（批量更新，避免频繁刷新）
-        if selected_count > 0 and hasattr(self, 'toolbar'):
-            visible_count = sum(1 for c in self.account_cards.values() if c.isVisible())
-            self.toolbar.update_counts(len(self.selected_account_ids), len(self.account_cards), visible_count)
+        other_card = self.account_cards.get(account_id)
+        # 如果这个卡片还没有被选中，则选中它
+        if other_card is None or other_card.is_selected():
+            return
+        other_card.set_selected(True)
+        self.selected_account_ids.add(account_id)
+        
+        # 更新工具栏计数（合并到下一帧，定时器未启动时才启动）
+        if not self._toolbar_refresh_timer.isActive():
+            self._toolbar_refresh_timer.start()
+        
+        logger.debug(f"拖动经过卡片: {other_card.account_data.get('email')}")
+    
+    def _flush_toolbar_counts(self):
+        """按当前选中/可见数刷新工具栏计数"""
+        if self.toolbar is not None:
+            total_count, visible_count = self._card_counts()
+            self.toolbar.update_counts(len(self.selected_account_ids), total_count, visible_count)
     
     def _on_drag_select_end(self, card):
         """拖动多选结束"""
@@ -2689,6 +3236,7 @@ class MainWindow(QMainWindow):
         
         self.is_drag_selecting = False
         self.drag_start_card = None
+        self._drag_hit_index = None
         
         logger.info(f"拖动多选完成，共选中 {len(self.selected_account_ids)} 个账号")
     
@@ -2703,8 +3251,6 @@ class MainWindow(QMainWindow):
         Returns:
             bool: 是否拦截事件
         """
-        from PyQt6.QtCore import Qt
-        
         # 只处理左键
         if event.button() != Qt.MouseButton.LeftButton:
             return False
@@ -2723,6 +3269,7 @@ class MainWindow(QMainWindow):
             # 在复选框区域按下，启动拖动多选
             self.is_drag_selecting = True
             self.drag_start_card = card
+            self._drag_hit_index = None
             
             # 切换当前卡片的选中状态
             current_state = card.is_selected()
@@ -2735,9 +3282,9 @@ class MainWindow(QMainWindow):
                 self.selected_account_ids.discard(card.account_id)
             
             # 更新工具栏计数
-            if hasattr(self, 'toolbar'):
-                visible_count = sum(1 for c in self.account_cards.values() if c.isVisible())
-                self.toolbar.update_counts(len(self.selected_account_ids), len(self.account_cards), visible_count)
+            if self.toolbar is not None:
+                total_count, visible_count = self._card_counts()
+                self.toolbar.update_counts(len(self.selected_account_ids), total_count, visible_count)
             
             logger.info(f"✅ 开始拖动多选，起始卡片: {card.account_data.get('email')}")
             return True  # 拦截事件，防止触发复选框的默认行为
@@ -2760,36 +3307,8 @@ class MainWindow(QMainWindow):
         if not self.is_drag_selecting:
             return False
         
-        # 获取鼠标全局位置
-        global_pos = event.globalPosition().toPoint()
-        
-        # 遍历所有卡片，判断鼠标是否经过
-        for account_id, other_card in self.account_cards.items():
-            try:
-                # ⭐ 修复：直接使用卡片的全局矩形
-                card_top_left = other_card.mapToGlobal(other_card.rect().topLeft())
-                card_bottom_right = other_card.mapToGlobal(other_card.rect().bottomRight())
-                
-                # 创建全局矩形
-                from PyQt6.QtCore import QRect
-                card_global_rect = QRect(card_top_left, card_bottom_right)
-                
-                # 判断鼠标是否在这个卡片内
-                if card_global_rect.contains(global_pos):
-                    # 如果这个卡片还没有被选中，则选中它
-                    if not other_card.is_selected():
-                        other_card.set_selected(True)
-                        self.selected_account_ids.add(account_id)
-                        
-                        # 更新工具栏计数
-                        if hasattr(self, 'toolbar'):
-                            visible_count = sum(1 for c in self.account_cards.values() if c.isVisible())
-                            self.toolbar.update_counts(len(self.selected_account_ids), len(self.account_cards), visible_count)
-                        
-                        logger.debug(f"拖动经过卡片: {other_card.account_data.get('email')}")
-            except Exception as e:
-                logger.debug(f"处理卡片鼠标移动异常: {e}")
-                continue
+        # 获取鼠标全局位置，命中测试找出鼠标下的卡片
+        self._drag_select_at(event.globalPosition().toPoint())
         
         return True  # 拦截事件
     
@@ -2804,8 +3323,6 @@ class MainWindow(QMainWindow):
         Returns:
             bool: 是否拦截事件
         """
-        from PyQt6.QtCore import Qt
-        
         if not self.is_drag_selecting:
             return False
         
@@ -2816,6 +3333,7 @@ class MainWindow(QMainWindow):
         # 结束拖动多选
         self.is_drag_selecting = False
         self.drag_start_card = None
+        self._drag_hit_index = None
         
         logger.info(f"拖动多选完成，共选中 {len(self.selected_account_ids)} 个账号")
         
@@ -2854,9 +3372,10 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event):
         """窗口大小调整事件 - 动态调整分割器比例"""
         super().resizeEvent(event)
+        self._drag_hit_index = None  # 卡片重排后需重建拖动命中索引
         
         # 只在分割器已创建后才调整
-        if hasattr(self, 'main_splitter'):
+        if self.main_splitter is not None:
             # 获取窗口宽度
             window_width = self.width()
             
@@ -2902,29 +3421,73 @@ class MainWindow(QMainWindow):
                 ratio = f"{left_width}:{right_width} ({left_width/window_width*100:.1f}%:{right_width/window_width*100:.1f}%)"
                 logger.info(f"🔧 窗口调整: {window_width}px → 分割器: [{left_width}, {right_width}] = {ratio}")
     
-    def _collect_card_update(self, account_id: int, account_data: dict):
+    def _collect_card_update(self, account_id: int, account_data: dict = None):
         """
         收集卡片更新请求（防抖）
         
         Args:
             account_id: 账号ID
-            account_data: 账号数据
+            account_data: 账号数据（为 None 时在批量刷新时统一从数据库读取）
         """
         # 加入待更新队列
         self._batch_update_manager['pending_cards'][account_id] = account_data
         
-        # ⭐ 从配置读取防抖延迟（默认200ms）
+        # ⭐ 定时器已在等待时只入队（延迟内的更新合并到同一次刷新）；
+        # 不重启计时，批量刷新持续完成时卡片也会按固定间隔刷新而不是一直推迟到最后
+        timer = self._batch_update_manager['timer']
+        if timer.isActive():
+            return
+        
+        # 从配置读取防抖延迟（默认200ms）
         performance_config = self.config.get('performance', {})
-        debounce_delay = performance_config.get('debounce_delay', 200)
+        timer.start(performance_config.get('debounce_delay', 200))
+    
+    def _queue_status_update(self, account_id: int, usage_info: Optional[dict]):
+        """
+        缓冲一条批量刷新结果，攒够一批或定时器到期后统一写入数据库
         
-        # 重启定时器（延迟内的更新会被合并）
-        timer = self._batch_update_manager['timer']
-        timer.stop()
-        timer.start(debounce_delay)
+        Args:
+            account_id: 账号 ID
+            usage_info: 使用情况信息，None 表示刷新失败（标记失效）
+        """
+        self._pending_status_updates.append((account_id, usage_info))
+        if len(self._pending_status_updates) >= STATUS_FLUSH_BATCH_SIZE:
+            self._flush_pending_updates()
+        elif not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+    
+    def _apply_batch_card_updates(self):
+        """批量刷新结束后，一次性更新本批所有刷新成功的卡片（单次数据库读取、单次重绘）"""
+        completed, self._batch_completed_ids = self._batch_completed_ids, []
+        if not completed:
+            return
+        
+        pending = self._batch_update_manager['pending_cards']
+        for account_id in completed:
+            pending[account_id] = None
+        self._batch_update_manager['timer'].stop()
+        self._flush_card_updates()
+    
+    def _flush_pending_updates(self):
+        """把缓冲的批量刷新结果在单个事务中写入数据库"""
+        self._status_flush_timer.stop()
+        if not self._pending_status_updates:
+            return
+        
+        pending, self._pending_status_updates = self._pending_status_updates, []
+        try:
+            self.storage.update_accounts_status_bulk(pending)
+            logger.debug(f"💾 批量刷新结果已写入数据库: {len(pending)} 个")
+        except Exception as e:
+            logger.error(f"批量写入刷新结果失败: {e}")
     
     def _flush_card_updates(self):
         """
-        刷新所有待更新的卡片（批量一次性处理）
+        刷新所有待更新的卡片（分级批量处理）
+        
+        Level 0: 单次 SQL 读取所有待更新账号
+        Level 1: 冻结布局后逐个静默更新卡片
+        Level 2: 解冻并统一失效布局，一次性重绘
         """
         pending = self._batch_update_manager['pending_cards']
         
@@ -2934,43 +3497,53 @@ class MainWindow(QMainWindow):
         try:
             logger.debug(f"批量更新 {len(pending)} 个卡片")
             
-            # ⭐ 三重防护：冻结布局+暂停渲染+禁用更新
-            if hasattr(self, 'account_list_layout'):
-                self.account_list_layout.freeze()
-            
-            if hasattr(self, 'account_list_widget'):
+            # ⭐ Level 0：批量读取数据（避免 N 次数据库往返）
+            # 先落盘缓冲中的刷新结果，保证读到的是最新数据
+            self._flush_pending_updates()
+            missing_ids = [aid for aid, data in pending.items() if data is None]
+            if missing_ids:
+                loaded = self.storage.get_accounts_by_ids(missing_ids)
+                for aid in missing_ids:
+                    pending[aid] = loaded.get(aid)
+            
+            # ⭐ Level 1：冻结布局+暂停渲染，批量更新所有卡片（静默模式）
+            if self.account_list_widget is not None:
                 self.account_list_widget.setUpdatesEnabled(False)
             
-            # ⭐ 批量更新所有卡片（静默模式）
-            for account_id, account_data in pending.items():
-                card = self.account_cards.get(account_id)
-                if card and account_data:
-                    card.update_account_data_silent(account_data)
+            current_account = None
+            deferred_index = {acc['id']: i for i, acc in enumerate(self._deferred_card_accounts)}
+            with self.account_list_layout.frozen():
+                for account_id, account_data in pending.items():
+                    if not account_data:
+                        continue
+                    card = self.account_cards.get(account_id)
+                    if card:
+                        card.update_account_data_silent(account_data)
+                    elif account_id in deferred_index:
+                        # 卡片尚未创建：更新延迟队列中的数据
+                        self._deferred_card_accounts[deferred_index[account_id]] = account_data
+                    if self.current_login_email and account_data.get('email') == self.current_login_email:
+                        current_account = account_data
             
             # 清空队列
             pending.clear()
             
-            # ⭐ 解冻布局并标记为脏（准备重新计算）
-            if hasattr(self, 'account_list_layout'):
-                self.account_list_layout.unfreeze()
+            # ⭐ Level 2：布局已解冻，统一失效一次（恢复渲染与一次性重绘在 finally 中）
+            self.account_list_layout.invalidate()
             
-            # ⭐ 恢复渲染（一次性重绘）
-            if hasattr(self, 'account_list_widget'):
-                self.account_list_widget.setUpdatesEnabled(True)
-                self.account_list_widget.update()
+            # ⭐ 如果刷新的是当前登录账号，同步更新右侧面板
+            if current_account:
+                QTimer.singleShot(150, lambda acc=current_account: self._safe_update_current_panel(acc))
             
             logger.debug("批量更新完成")
             
         except Exception as e:
             logger.error(f"批量更新失败: {e}")
-            # 确保恢复状态
-            if hasattr(self, 'account_list_layout'):
-                try:
-                    self.account_list_layout.unfreeze()
-                except:
-                    pass
-            if hasattr(self, 'account_list_widget'):
+        finally:
+            # ⭐ 无论成功与否都恢复渲染并只重绘一次（布局由 frozen() 保证解冻）
+            if self.account_list_widget is not None and not self.account_list_widget.updatesEnabled():
                 self.account_list_widget.setUpdatesEnabled(True)
+                self.account_list_widget.update()
     
     def closeEvent(self, event):
         """窗口关闭（优化版：确保所有线程正确清理）"""
@@ -2983,7 +3556,8 @@ class MainWindow(QMainWindow):
             ]
             
             for panel, name in config_panels:
-                if hasattr(self, panel.__class__.__name__.replace('Panel', '').lower() + '_panel'):
+                # 未打开过的标签页尚未创建面板，不会有未保存修改
+                if panel is not None:
                     if hasattr(panel, 'check_unsaved_changes'):
                         if not panel.check_unsaved_changes():
                             # 用户选择取消，不关闭窗口
@@ -2996,8 +3570,11 @@ class MainWindow(QMainWindow):
             # ⭐ 设置关闭标志，防止新线程启动
             self._is_closing = True
             
+            # ⭐ 写入缓冲中尚未落盘的批量刷新结果
+            self._flush_pending_updates()
+            
             # 停止自动检测定时器
-            if hasattr(self, 'auto_detect_timer') and self.auto_detect_timer:
+            if self.auto_detect_timer is not None:
                 try:
                     self.auto_detect_timer.stop()
                     logger.debug("自动检测定时器已停止")
@@ -3005,10 +3582,10 @@ class MainWindow(QMainWindow):
                     pass
             
             # 停止防抖定时器
-            if hasattr(self, 'search_debounce_timer') and self.search_debounce_timer:
+            if self._view_change_timer is not None:
                 try:
-                    self.search_debounce_timer.stop()
-                    logger.debug("搜索防抖定时器已停止")
+                    self._view_change_timer.stop()
+                    logger.debug("筛选/排序/搜索防抖定时器已停止")
                 except:
                     pass
             
@@ -3016,7 +3593,7 @@ class MainWindow(QMainWindow):
             # 系统监控功能已移除
             
             # ⭐ 停止线程管理器
-            if hasattr(self, 'thread_manager') and self.thread_manager:
+            if self.thread_manager is not None:
                 try:
                     running_tasks = self.thread_manager.get_running_tasks()
                     if running_tasks:
@@ -3029,9 +3606,7 @@ class MainWindow(QMainWindow):
                     logger.error(f"停止线程管理器失败: {e}")
             
             # 停止检测线程
-            if (hasattr(self, 'current_panel') and 
-                hasattr(self.current_panel, 'detection_thread') and
-                self.current_panel.detection_thread):
+            if self.current_panel is not None and self.current_panel.detection_thread:
                 try:
                     thread = self.current_panel.detection_thread
                     if thread.isRunning():
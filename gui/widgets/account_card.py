@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import (
     QGraphicsDropShadowEffect
 )
 from PyQt6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, 
+    Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, pyqtSlot, QMetaObject,
     QParallelAnimationGroup, QSequentialAnimationGroup, QTimer, QSize, QPoint
 )
 from PyQt6.QtGui import QFont, QColor
@@ -25,6 +25,13 @@ from gui.widgets.rotating_button import RotatingIconButton
 
 logger = get_logger("account_card")
 
+# ⭐ 影响卡片显示的账号字段（批量刷新时比较签名，未变化的卡片跳过重绘）
+DISPLAY_FIELDS = (
+    'email', 'status', 'membership_type', 'days_remaining', 'usage_percent',
+    'total_cost', 'unpaid_amount', 'subscription_status', 'last_used',
+    'created_at', 'model_usage', 'model_usage_json', 'is_invalid',
+)
+
 
 class AccountCard(QFrame):
     """账号卡片组件"""
@@ -38,6 +45,7 @@ class AccountCard(QFrame):
     drag_select_start = pyqtSignal(object)  # 拖动多选开始（card对象）
     drag_select_move = pyqtSignal(object, object)  # 拖动多选中（card对象, event）
     drag_select_end = pyqtSignal(object)  # 拖动多选结束（card对象）
+    action = pyqtSignal(str, object)  # ⭐ 汇总信号（信号名, 参数元组），主窗口每张卡片只需连接这一个
     
     def __init__(self, account_data: dict, parent=None, enable_animation: bool = False):
         """
@@ -59,6 +67,7 @@ class AccountCard(QFrame):
         self._shadow_effect = None  # 阴影效果
         self._is_loading = False  # 是否正在加载中（刷新期间禁用悬停）
         self._is_invalid = False  # 账号是否失效
+        self._content_sig = self.content_signature(account_data)  # ⭐ 显示内容签名（未变化时跳过更新）
         
         self._setup_ui()
         self._setup_hover_effects()  # 设置悬停效果
@@ -95,7 +104,7 @@ class AccountCard(QFrame):
         
         # 复选框 - 使用 stateChanged 信号，单击即可选中
         self.checkbox = QCheckBox()
-        self.checkbox.stateChanged.connect(self._on_checkbox_state_changed)
+        self.checkbox.setObjectName("checkbox")  # ⭐ 按对象名自动连接 on_checkbox_stateChanged
         # ⭐ 设置复选框接受鼠标事件但不拦截
         self.checkbox.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
         # ⭐ 强制设置透明背景（代码层面双重保障）
@@ -202,6 +211,7 @@ class AccountCard(QFrame):
         
         # 第一行：切换按钮（占满整行）
         self.switch_btn = QPushButton("🔑 切换账号")
+        self.switch_btn.setObjectName("switch_btn")
         self.switch_btn.setProperty("success", True)
         self.switch_btn.setMinimumHeight(34)
         self.switch_btn.setStyleSheet("""
@@ -211,11 +221,11 @@ class AccountCard(QFrame):
                 font-weight: bold;
             }
         """)
-        self.switch_btn.clicked.connect(lambda: self.switch_clicked.emit(self.account_id))
         button_grid.addWidget(self.switch_btn, 0, 0, 1, 3)  # 第0行，跨3列
         
         # 第二行：三个小按钮均分（刷新按钮使用可旋转组件）
         self.refresh_btn = RotatingIconButton("🔄")
+        self.refresh_btn.setObjectName("refresh_btn")
         self.refresh_btn.setProperty("secondary", True)
         self.refresh_btn.setToolTip("刷新账号信息")
         self.refresh_btn.setMinimumHeight(30)
@@ -225,10 +235,10 @@ class AccountCard(QFrame):
                 font-size: 16px;
             }
         """)
-        self.refresh_btn.clicked.connect(lambda: self.refresh_clicked.emit(self.account_id))
         button_grid.addWidget(self.refresh_btn, 1, 0)  # 第1行，第0列
         
         self.detail_btn = QPushButton("📊")
+        self.detail_btn.setObjectName("detail_btn")
         self.detail_btn.setProperty("secondary", True)
         self.detail_btn.setToolTip("查看详情")
         self.detail_btn.setMinimumHeight(30)
@@ -238,10 +248,10 @@ class AccountCard(QFrame):
                 font-size: 16px;
             }
         """)
-        self.detail_btn.clicked.connect(lambda: self.detail_clicked.emit(self.account_id))
         button_grid.addWidget(self.detail_btn, 1, 1)  # 第1行，第1列
         
         self.delete_btn = QPushButton("🗑️")
+        self.delete_btn.setObjectName("delete_btn")
         self.delete_btn.setProperty("danger", True)
         self.delete_btn.setToolTip("删除账号")
         self.delete_btn.setMinimumHeight(30)
@@ -251,11 +261,13 @@ class AccountCard(QFrame):
                 font-size: 16px;
             }
         """)
-        self.delete_btn.clicked.connect(lambda: self.delete_clicked.emit(self.account_id))
         button_grid.addWidget(self.delete_btn, 1, 2)  # 第1行，第2列
         
         main_layout.addLayout(button_grid)
         
+        # ⭐ 按对象名一次性连接按钮/复选框到 on_<对象名>_<信号> 槽（替代逐个 lambda 连接）
+        QMetaObject.connectSlotsByName(self)
+        
         # ⭐ 失效标记层（大红×）
         self.invalid_overlay = QLabel(self)
         self.invalid_overlay.setObjectName("InvalidOverlay")
@@ -789,6 +801,19 @@ class AccountCard(QFrame):
         # 完全禁用淡入动画，避免刷新时的闪烁问题
         pass
     
+    @staticmethod
+    def content_signature(account_data: dict) -> tuple:
+        """
+        计算影响卡片显示的字段签名（签名相同说明显示内容未变化）
+        
+        Args:
+            account_data: 账号数据
+            
+        Returns:
+            tuple: 显示字段值组成的元组
+        """
+        return tuple(account_data.get(field) for field in DISPLAY_FIELDS)
+    
     def update_account_data(self, account_data: dict):
         """
         更新账号数据（简化版）
@@ -802,6 +827,7 @@ class AccountCard(QFrame):
             
             # ⭐ 简化：移除复杂的防抖逻辑（由主窗口统一管理）
             self.account_data = account_data
+            self._content_sig = self.content_signature(account_data)
             
             # 更新样式
             try:
@@ -835,6 +861,7 @@ class AccountCard(QFrame):
             
             # 更新数据
             self.account_data = account_data
+            self._content_sig = self.content_signature(account_data)
             
             # 更新样式（可能改变边框颜色）
             try:
@@ -854,6 +881,26 @@ class AccountCard(QFrame):
         except Exception as e:
             logger.error(f"静默更新失败: {e}")
     
+    def rebind(self, account_data: dict):
+        """
+        复用卡片并绑定到新账号（卡片池回收后使用，避免重建控件树）
+        
+        Args:
+            account_data: 新的账号数据
+        """
+        self.account_id = account_data.get('id')
+        
+        # 重置上一个账号遗留的交互状态
+        self.set_selected(False)
+        if self._is_loading:
+            self.set_loading(False)
+        if self._is_invalid:
+            self.set_invalid(False)
+        self.is_current = False
+        self._update_switch_button()
+        
+        self.update_account_data_silent(account_data)
+    
     def _update_style_silent(self):
         """
         静默更新样式（只改变视觉，不触发重排）
@@ -1041,11 +1088,42 @@ class AccountCard(QFrame):
         # 如果需要反馈，可以使用边框闪烁或其他不影响布局的效果
         pass
     
-    def _on_checkbox_state_changed(self, state):
+    def _emit_action(self, name: str, *args):
+        """
+        发出指定信号，并通过汇总信号 action 转发
+        
+        Args:
+            name: 信号名（如 'switch_clicked'）
+            *args: 信号参数
+        """
+        getattr(self, name).emit(*args)
+        self.action.emit(name, args)
+    
+    @pyqtSlot()
+    def on_switch_btn_clicked(self):
+        """切换按钮点击"""
+        self._emit_action('switch_clicked', self.account_id)
+    
+    @pyqtSlot()
+    def on_refresh_btn_clicked(self):
+        """刷新按钮点击"""
+        self._emit_action('refresh_clicked', self.account_id)
+    
+    @pyqtSlot()
+    def on_detail_btn_clicked(self):
+        """详情按钮点击"""
+        self._emit_action('detail_clicked', self.account_id)
+    
+    @pyqtSlot()
+    def on_delete_btn_clicked(self):
+        """删除按钮点击"""
+        self._emit_action('delete_clicked', self.account_id)
+    
+    @pyqtSlot(int)
+    def on_checkbox_stateChanged(self, state):
         """复选框状态改变事件 - 单击即可选中"""
-        from PyQt6.QtCore import Qt
         checked = (state == Qt.CheckState.Checked.value)
-        self.selection_changed.emit(self.account_id, checked)
+        self._emit_action('selection_changed', self.account_id, checked)
         
         # 禁用选中动画，避免布局闪烁
         # self._animate_selection(checked)
@@ -1093,7 +1171,7 @@ class AccountCard(QFrame):
                 current_state = self.is_selected()
                 self.set_selected(not current_state)
                 # 通知主窗口开始拖动
-                self.drag_select_start.emit(self)
+                self._emit_action('drag_select_start', self)
                 event.accept()
                 return
             else:
@@ -1106,7 +1184,7 @@ class AccountCard(QFrame):
         if self._is_dragging:
             # 通知主窗口鼠标移动
             logger.debug(f"卡片鼠标移动事件 - 位置: {event.pos()}, 卡片: {self.account_data.get('email', 'unknown')}")
-            self.drag_select_move.emit(self, event)
+            self._emit_action('drag_select_move', self, event)
             event.accept()
             return
         
@@ -1119,7 +1197,7 @@ class AccountCard(QFrame):
         if event.button() == Qt.MouseButton.LeftButton and self._is_dragging:
             self._is_dragging = False
             # 通知主窗口结束拖动
-            self.drag_select_end.emit(self)
+            self._emit_action('drag_select_end', self)
             event.accept()
             return
         
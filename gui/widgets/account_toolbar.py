@@ -34,6 +34,7 @@ class AccountToolbar(QWidget):
         
         self.selected_count = 0
         self.total_count = 0
+        self._last_counts = None  # ⭐ 上次显示的 (选中数, 总数, 可见数)，未变化时不重设标签/按钮
         
         self._setup_ui()
     
@@ -259,17 +260,22 @@ class AccountToolbar(QWidget):
         if visible is None:
             visible = total
         
-        self.title_label.setText(f"📋 账号列表 ({total}个)")
-        self.selection_label.setText(f"已选择 {selected} 个")
-        
-        # 更新按钮状态
-        has_selection = selected > 0
-        self.export_btn.setEnabled(has_selection)
-        self.batch_delete_btn.setEnabled(has_selection)
-        self.batch_refresh_btn.setEnabled(has_selection)
-        self.batch_payment_btn.setEnabled(has_selection)
-        
-        # 更新全选复选框状态 - 阻塞信号避免循环触发
+        # ⭐ 计数未变化时跳过标签文本和按钮状态（拖动多选等高频调用时避免标签重新布局）
+        counts = (selected, total, visible)
+        if counts != self._last_counts:
+            self._last_counts = counts
+            
+            self.title_label.setText(f"📋 账号列表 ({total}个)")
+            self.selection_label.setText(f"已选择 {selected} 个")
+            
+            # 更新按钮状态
+            has_selection = selected > 0
+            self.export_btn.setEnabled(has_selection)
+            self.batch_delete_btn.setEnabled(has_selection)
+            self.batch_refresh_btn.setEnabled(has_selection)
+            self.batch_payment_btn.setEnabled(has_selection)
+        
+        # 更新全选复选框状态 - 阻塞信号避免循环触发（用户点击会改变复选框，因此每次都同步）
         from PyQt6.QtCore import Qt as QtCore
         # ⭐ 更新全选复选框状态（使用visible而不是total）
         self.select_all_checkbox.blockSignals(True)
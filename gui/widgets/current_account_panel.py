@@ -13,6 +13,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QThread, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QFont, QTextCursor
 from datetime import datetime
+from contextlib import contextmanager
 
 
 class DetectionThread(QThread):
@@ -28,12 +29,18 @@ class DetectionThread(QThread):
     def run(self):
         """执行检测"""
         try:
+            import time
+            from core.account_storage import get_storage
             from core.current_account_detector import get_detector
             
-            detector = get_detector()
+            # ⭐ 传递storage实例，让detector可以读取增量刷新信息
+            storage = get_storage()
+            detector = get_detector(storage=storage)
             account = detector.detect_current_account()
             
             if account and account.get('status') == 'active':
+                # ⭐ 缓存检测结果，短时间内重启可直接复用
+                storage.set_cached_detection_result(account, time.time())
                 self.detection_complete.emit(account)
             else:
                 error_msg = account.get('error', '未找到账号或检测失败') if account else '未找到账号'
@@ -56,6 +63,7 @@ class CurrentAccountPanel(QWidget):
         
         self.current_account = None
         self.detection_thread = None
+        self._log_batch_depth = 0  # ⭐ log_batch() 嵌套层数（>0 时暂停逐行重绘和滚动）
         self._setup_ui()
         
         # ⭐ 确保初始主题样式正确应用
@@ -639,13 +647,35 @@ class CurrentAccountPanel(QWidget):
                     cursor.removeSelectedText()
                     cursor.deleteChar()  # 删除换行符
             
-            # 平滑滚动到底部
-            self._smooth_scroll_to_bottom()
+            # 平滑滚动到底部（批量输出时在结束后统一滚动一次）
+            if not self._log_batch_depth:
+                self._smooth_scroll_to_bottom()
             
         except Exception as e:
             # 静默处理，避免日志函数本身导致崩溃
             pass
     
+    @contextmanager
+    def log_batch(self):
+        """
+        连续输出多行日志的上下文管理器（期间暂停日志区重绘，结束后只重绘、滚动一次）
+        
+        用法:
+            with panel.log_batch():
+                panel.log(...)
+                panel.log(...)
+        """
+        self._log_batch_depth += 1
+        if self._log_batch_depth == 1:
+            self.log_text.setUpdatesEnabled(False)
+        try:
+            yield self
+        finally:
+            self._log_batch_depth -= 1
+            if not self._log_batch_depth:
+                self.log_text.setUpdatesEnabled(True)
+                self._smooth_scroll_to_bottom()
+    
     def _smooth_scroll_to_bottom(self):
         """平滑滚动到底部"""
         scrollbar = self.log_text.verticalScrollBar()
@@ -5,6 +5,8 @@ FlowLayout - 流式布局管理器
 自动换行的网格布局，根据容器宽度自动调整列数
 """
 
+from contextlib import contextmanager
+
 from PyQt6.QtCore import Qt, QRect, QSize, QPoint
 from PyQt6.QtWidgets import QLayout, QWidgetItem
 
@@ -171,6 +173,34 @@ class FlowLayout(QLayout):
         # 其他情况使用缓存
         return False
     
+    def reorder(self, widgets):
+        """
+        按给定的控件顺序重排布局项（复用现有 QLayoutItem，不移除/重新添加）
+        
+        Args:
+            widgets: 期望顺序的控件列表；未列出的控件保持原相对顺序排在最后
+        """
+        order = {widget: index for index, widget in enumerate(widgets)}
+        tail = len(order)
+        self._item_list.sort(key=lambda item: order.get(item.widget(), tail))
+        self._layout_dirty = True
+    
+    def columns_for_width(self, width: int, item_width: int) -> int:
+        """
+        不依赖子控件，按容器宽度计算一行可容纳的列数
+        
+        Args:
+            width: 容器宽度
+            item_width: 单个项目宽度
+            
+        Returns:
+            int: 列数（至少为1）
+        """
+        left, _, right, _ = self.getContentsMargins()
+        spacing = max(self.spacing(), 0)
+        available = width - left - right
+        return max(1, (available + spacing) // (item_width + spacing))
+    
     def invalidate(self):
         """标记布局为脏（需要重新计算）"""
         self._layout_dirty = True
@@ -185,6 +215,21 @@ class FlowLayout(QLayout):
         self._frozen = False
         self._layout_dirty = True
     
+    @contextmanager
+    def frozen(self):
+        """
+        冻结布局的上下文管理器（退出时必定解冻，异常也不会遗留冻结状态）
+        
+        用法:
+            with layout.frozen():
+                ...  # 批量增删/更新卡片
+        """
+        self.freeze()
+        try:
+            yield self
+        finally:
+            self.unfreeze()
+    
     def _apply_cached_layout(self):
         """应用缓存的布局位置（极快，无需计算）"""
         for item in self._item_list:
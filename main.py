@@ -196,7 +196,7 @@ def main():
             plan = detected_account.get('membership_type', 'free').upper()
             logger.info(f"启动画面完成，已检测账号: {email} ({plan})")
         else:
-            logger.info("启动画面完成，未检测到账号")
+            logger.info("启动画面完成，当前账号将在后台检测")
         
         logger.info("创建主窗口...")
         
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON 编解码模块
+优先使用 orjson（C 实现），未安装或遇到 orjson 不支持的数据时回退标准库
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 标准库紧凑编码器（复用同一个实例，避免每次构造）
+_compact_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    序列化为 JSON 字符串
+
+    Args:
+        obj: 要序列化的对象
+        indent: 是否缩进 2 格（用于显示/复制），默认紧凑格式（用于存储）
+
+    Returns:
+        str: JSON 字符串
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:
+            # 非字符串键、超过 64 位的整数等 orjson 不支持的数据交给标准库
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return _compact_encoder.encode(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    解析 JSON
+
+    Args:
+        data: JSON 字节串或字符串
+
+    Returns:
+        Any: 解析结果
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity、超过 64 位的整数等 orjson 拒绝的内容交给标准库（仍失败则抛出）
+            pass
+    return json.loads(data)